@@ -0,0 +1,7 @@
+"""
+Cardinity SDK Benchmarks
+
+Micro-benchmarks for the SDK hot paths. Run a benchmark module with, e.g.::
+
+    python -m benchmarks.bench_validation
+"""
@@ -0,0 +1,78 @@
+"""
+Authentication Benchmark
+
+Measures OAuth 1.0 request signing throughput, comparing the previous
+behaviour (a new OAuth1 signer built for every request), the OAuth1 signer
+cached by CardinityAuth, and the in-house OAuthSigner used by the clients.
+"""
+
+import timeit
+
+from requests import PreparedRequest, Request
+from requests_oauthlib import OAuth1
+
+from cardinity.auth import CardinityAuth
+
+#: Peak request rate the signer has to sustain comfortably
+TARGET_RATE = 500
+
+AUTH = CardinityAuth("benchmark_consumer_key", "benchmark_consumer_secret")
+
+
+def make_request() -> PreparedRequest:
+    """Build a representative prepared POST request."""
+    return Request(
+        "POST",
+        "https://api.cardinity.com/v1/payments",
+        headers={"Content-Type": "application/json"},
+        json={"amount": "50.00", "currency": "EUR"},
+    ).prepare()
+
+
+REQUEST = make_request()
+
+
+def sign_uncached() -> PreparedRequest:
+    """Sign a request the way the client did before the signer was cached."""
+    signer = OAuth1(
+        client_key=AUTH.consumer_key,
+        client_secret=AUTH.consumer_secret,
+        signature_method="HMAC-SHA1",
+        signature_type="AUTH_HEADER",
+    )
+    return signer(REQUEST)
+
+
+def sign_cached() -> PreparedRequest:
+    """Sign a request with the OAuth1 signer cached by CardinityAuth."""
+    return AUTH.get_auth()(REQUEST)
+
+
+def sign_fast() -> PreparedRequest:
+    """Sign a request with the in-house signer, as the clients do."""
+    return AUTH(REQUEST)
+
+
+def measure(func, number: int) -> float:
+    """Return the best signatures per second over several repeats."""
+    func()  # warm up caches
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return number / best
+
+
+def main(number: int = 2000) -> None:
+    """Run the benchmark and print signing throughput."""
+    before = measure(sign_uncached, number)
+    cached = measure(sign_cached, number)
+    after = measure(sign_fast, number)
+
+    print(f"OAuth 1.0 signing, {number} iterations x 5 repeats (best)")
+    print(f"  before (OAuth1 per request): {before:10.0f} signatures/s")
+    print(f"  cached OAuth1 signer:        {cached:10.0f} signatures/s")
+    print(f"  after  (OAuthSigner):        {after:10.0f} signatures/s")
+    print(f"  speedup:                     {after / before:10.2f}x")
+    print(f"  headroom at {TARGET_RATE} req/s:      {after / TARGET_RATE:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
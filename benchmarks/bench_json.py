@@ -0,0 +1,104 @@
+"""
+JSON Codec Benchmark
+
+Measures decoding of large payment listings, as returned for
+GetPayment(limit=...), and encoding of payment request bodies with every
+JSON codec installed, against requests' own response.json().
+"""
+
+import timeit
+
+from requests import Response
+
+from cardinity.client import decode_response
+from cardinity.codec import JSONCodec, available_codecs, get_codec
+from cardinity.models import GetPayment
+
+LIST_SIZES = (100, 1000)
+
+PAYMENT_BODY = {
+    "amount": "50.00",
+    "currency": "EUR",
+    "settle": True,
+    "description": "Order #123456",
+    "order_id": "123456",
+    "country": "LT",
+    "payment_method": "card",
+    "payment_instrument": {
+        "pan": "4111111111111111",
+        "exp_year": 2030,
+        "exp_month": 12,
+        "cvc": "456",
+        "holder": "Mike Dough",
+    },
+}
+
+
+def make_payment(index: int) -> dict:
+    """Build a payment as listed by the API."""
+    return {
+        "id": f"8e037fbb-fe5b-4781-b109-b3e93d{index:06d}",
+        "amount": "50.00",
+        "currency": "EUR",
+        "created": "2024-01-15T12:00:00Z",
+        "type": "authorization",
+        "live": False,
+        "settle": True,
+        "status": "approved",
+        "order_id": f"order-{index}",
+        "description": "Ünïcödé description",
+        "country": "LT",
+        "payment_method": "card",
+        "payment_instrument": {
+            "card_brand": "Visa",
+            "pan": "1111",
+            "exp_year": 2030,
+            "exp_month": 12,
+            "holder": "Mike Dough",
+        },
+    }
+
+
+def make_response(size: int) -> Response:
+    """Build a requests response holding a payment listing."""
+    response = Response()
+    response.status_code = 200
+    response.encoding = None
+    response.headers["Content-Type"] = "application/json"
+    response._content = JSONCodec().dumps([make_payment(i) for i in range(size)])
+    return response
+
+
+def measure(func, number: int) -> float:
+    """Return the best time per call in microseconds over several repeats."""
+    func()
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main(number: int = 50) -> None:
+    """Run the benchmark and print timings per codec."""
+    codecs = [get_codec(name) for name in available_codecs()]
+    print(f"Codecs installed: {', '.join(codec.name for codec in codecs)}")
+    print(f"Default codec:    {get_codec().name}")
+
+    for size in LIST_SIZES:
+        response = make_response(size)
+        print(
+            f"\nDecoding {GetPayment(limit=size).get_endpoint()} "
+            f"({len(response.content) / 1024:.0f} KiB), best of 5"
+        )
+        before = measure(response.json, number)
+        print(f"  response.json():      {before:10.0f} us")
+        for codec in codecs:
+            after = measure(lambda: decode_response(codec, response), number)
+            print(f"  {codec.name:<20}  {after:10.0f} us  ({before / after:.2f}x)")
+
+    print("\nEncoding a payment request body, best of 5")
+    for codec in codecs:
+        elapsed = measure(lambda: codec.dumps(PAYMENT_BODY), number * 200)
+        print(f"  {codec.name:<20}  {elapsed:10.2f} us")
+
+
+if __name__ == "__main__":
+    main()
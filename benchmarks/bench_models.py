@@ -0,0 +1,64 @@
+"""
+Model Memory Benchmark
+
+Measures, with tracemalloc, the memory held by many live Payment models and
+by repeated reads of a model's data, comparing the previous BaseModel
+storage (a per-instance __dict__ plus a copy of the data in __init__ and
+every read) against the slotted storage and read-only data view used now.
+"""
+
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from cardinity.models import Payment
+from cardinity.validation import Constraints
+from cardinity.validation.validators import validate_model_data
+
+from .bench_validation import PAYMENT_DATA
+
+LIVE_MODELS = 10_000
+
+
+class DictPayment:
+    """Payment stored the way BaseModel did before __slots__."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        errors = validate_model_data(
+            kwargs, DictPayment, Constraints.create_payment_schema
+        )
+        assert errors is None, errors
+        self._data = kwargs.copy()
+
+    def get_data(self) -> Dict[str, Any]:
+        return self._data.copy()
+
+
+def held(factory: Callable[[], Any], count: int) -> int:
+    """Return the bytes still allocated after building ``count`` objects."""
+    tracemalloc.start()
+    objects: List[Any] = [factory() for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+def main() -> None:
+    """Run the benchmark and print memory use per model."""
+    before = held(lambda: DictPayment(**PAYMENT_DATA), LIVE_MODELS)
+    after = held(lambda: Payment(**PAYMENT_DATA), LIVE_MODELS)
+    print(f"Memory held by {LIVE_MODELS} live payments")
+    print(f"  before (__dict__):  {before / LIVE_MODELS:8.0f} B/model")
+    print(f"  after  (__slots__): {after / LIVE_MODELS:8.0f} B/model")
+    print(f"  saved:              {1 - after / before:8.0%}")
+
+    old, new = DictPayment(**PAYMENT_DATA), Payment(**PAYMENT_DATA)
+    before = held(old.get_data, LIVE_MODELS)
+    after = held(lambda: new.data, LIVE_MODELS)
+    print(f"\nMemory held by {LIVE_MODELS} reads of one payment's data")
+    print(f"  before (get_data() copy): {before / LIVE_MODELS:8.0f} B/read")
+    print(f"  after  (data view):       {after / LIVE_MODELS:8.0f} B/read")
+
+
+if __name__ == "__main__":
+    main()
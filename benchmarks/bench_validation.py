@@ -0,0 +1,62 @@
+"""
+Validation Benchmark
+
+Measures the cost of constructing a Payment model, comparing the previous
+behaviour (a new CardinityValidator compiled for every model) against the
+cached validator registry used by BaseModel.
+"""
+
+import timeit
+from typing import Any, Dict
+
+from cardinity.models import Payment
+from cardinity.validation import Constraints, validate_data
+
+PAYMENT_DATA: Dict[str, Any] = {
+    "amount": "50.00",
+    "currency": "EUR",
+    "description": "Benchmark payment",
+    "country": "LT",
+    "payment_instrument": {
+        "pan": "4111111111111111",
+        "exp_month": 12,
+        "exp_year": 2030,
+        "cvc": "123",
+        "holder": "John Doe",
+    },
+}
+
+
+def construct_uncached() -> Dict[str, Any]:
+    """Validate a payment the way BaseModel did before the registry existed."""
+    data = dict(PAYMENT_DATA)
+    errors = validate_data(data, Constraints.create_payment_schema())
+    assert errors is None, errors
+    return data.copy()
+
+
+def construct_cached() -> Payment:
+    """Construct a payment through the cached validator registry."""
+    return Payment(**PAYMENT_DATA)
+
+
+def measure(func, number: int) -> float:
+    """Return the best per-call time in microseconds over several repeats."""
+    func()  # warm up caches
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1_000_000
+
+
+def main(number: int = 500) -> None:
+    """Run the benchmark and print per-Payment construction cost."""
+    before = measure(construct_uncached, number)
+    after = measure(construct_cached, number)
+
+    print(f"Payment construction, {number} iterations x 5 repeats (best)")
+    print(f"  before (validator per call): {before:10.1f} us/op")
+    print(f"  after  (validator registry): {after:10.1f} us/op")
+    print(f"  speedup:                     {before / after:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Benchmark Suite
+
+Measures the SDK hot paths end to end: model construction and validation,
+OAuth signing, JSON encoding and decoding, and full request round-trips
+through the SDK against the in-process CardinityTestServer. Every benchmark
+reports p50/p95/p99 latency and throughput, results are written as JSON,
+and the run fails when a benchmark is slower than the committed baseline by
+more than the tolerance.
+
+Run the suite and compare it with the baseline::
+
+    python -m benchmarks.suite
+
+Record a new baseline after an intended performance change::
+
+    python -m benchmarks.suite --update-baseline
+
+Baselines are only comparable on the machine they were recorded on; record
+one locally before comparing, and keep the committed baseline in step with
+the reference machine (CI).
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from cardinity import AsyncCardinity, Cardinity
+from cardinity.codec import get_codec
+from cardinity.models import Payment
+from cardinity.signing import OAuthSigner
+from cardinity.testing import CardinityTestServer
+
+from .bench_json import PAYMENT_BODY, make_payment
+from .bench_validation import PAYMENT_DATA
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results" / "latest.json"
+#: Allowed slowdown of a benchmark's p50 before it counts as a regression
+DEFAULT_TOLERANCE = 0.25
+LISTING_SIZE = 100
+
+
+class Benchmark:
+    """One timed operation of the suite.
+
+    The operation is run ``batch`` times per sample so that operations of a
+    few microseconds are timed well above the clock resolution; latencies are
+    reported per operation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        samples: int = 200,
+        batch: int = 1,
+        warmup: int = 10,
+    ) -> None:
+        """Initialize the benchmark.
+
+        Args:
+            name: Dotted benchmark name (e.g. ``roundtrip.get_payment``)
+            func: Operation to time
+            samples: Number of timed samples
+            batch: Operations per sample
+            warmup: Untimed samples run first
+        """
+        self.name = name
+        self.func = func
+        self.samples = samples
+        self.batch = batch
+        self.warmup = warmup
+
+    def run(self, scale: float = 1.0) -> Dict[str, float]:
+        """Time the operation.
+
+        Args:
+            scale: Factor applied to the number of samples
+
+        Returns:
+            Dict[str, float]: Latency percentiles in microseconds, operations
+                per second and the number of samples
+        """
+        func, batch = self.func, self.batch
+        samples = max(int(self.samples * scale), 10)
+        for _ in range(self.warmup):
+            func()
+
+        timings: List[float] = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            for _ in range(batch):
+                func()
+            timings.append((time.perf_counter() - start) / batch)
+        return summarize(timings)
+
+
+def summarize(timings: Sequence[float]) -> Dict[str, float]:
+    """Summarize per-operation timings.
+
+    Args:
+        timings: Seconds per operation of every sample
+
+    Returns:
+        Dict[str, float]: p50/p95/p99 latency in microseconds, operations per
+            second and the number of samples
+    """
+    cuts = statistics.quantiles(timings, n=100, method="inclusive")
+    return {
+        "p50_us": round(cuts[49] * 1e6, 3),
+        "p95_us": round(cuts[94] * 1e6, 3),
+        "p99_us": round(cuts[98] * 1e6, 3),
+        "ops_per_sec": round(len(timings) / sum(timings), 1),
+        "samples": len(timings),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Find the benchmarks that regressed against a baseline.
+
+    A benchmark regresses when its p50 latency exceeds the baseline p50 by
+    more than ``tolerance``. The median is compared because it is the
+    percentile least disturbed by scheduler noise; p95/p99 are reported for
+    inspection.
+
+    Args:
+        results: Results of this run, by benchmark name
+        baseline: Baseline results, by benchmark name
+        tolerance: Allowed relative slowdown (0.25 allows 25%)
+
+    Returns:
+        List[str]: One message per regression
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        limit = expected["p50_us"] * (1 + tolerance)
+        if result["p50_us"] > limit:
+            regressions.append(
+                f"{name}: p50 {result['p50_us']:.1f} us > {limit:.1f} us "
+                f"(baseline {expected['p50_us']:.1f} us + {tolerance:.0%})"
+            )
+    return regressions
+
+
+def build_benchmarks(server: CardinityTestServer, stack: ExitStack) -> List[Benchmark]:
+    """Build the benchmarks of the suite.
+
+    The asynchronous round-trip is only measured when httpx is installed.
+
+    Args:
+        server: Running test server for the round-trip benchmarks
+        stack: Exit stack the SDK clients are closed by
+
+    Returns:
+        List[Benchmark]: Benchmarks in reporting order
+    """
+    payment = Payment(**PAYMENT_DATA)
+    signer = OAuthSigner("benchmark_consumer_key", "benchmark_consumer_secret")
+    codec = get_codec()
+    body = codec.dumps(PAYMENT_BODY)
+    listing = codec.dumps([make_payment(i) for i in range(LISTING_SIZE)])
+    payment_url = "https://api.cardinity.com/v1/payments?limit=10"
+
+    cardinity = Cardinity("key", "secret", base_url=server.base_url)
+    stack.callback(cardinity.get_client().close)
+    payment_id = cardinity.create_payment(**PAYMENT_DATA)["id"]
+
+    benchmarks = [
+        Benchmark("model.construct_payment", lambda: Payment(**PAYMENT_DATA), batch=20),
+        Benchmark("model.validate_payment", payment.validate, batch=20),
+        Benchmark("auth.sign", lambda: signer.sign("POST", payment_url), batch=50),
+        Benchmark("json.encode_payment", lambda: codec.dumps(PAYMENT_BODY), batch=200),
+        Benchmark("json.decode_payment", lambda: codec.loads(body), batch=200),
+        Benchmark(
+            f"json.decode_listing_{LISTING_SIZE}", lambda: codec.loads(listing), batch=5
+        ),
+        Benchmark(
+            "roundtrip.create_payment",
+            lambda: cardinity.create_payment(**PAYMENT_DATA),
+        ),
+        Benchmark("roundtrip.get_payment", lambda: cardinity.get_payment(payment_id)),
+        Benchmark(
+            "roundtrip.list_payments",
+            lambda: cardinity.get_payment(limit=LISTING_SIZE),
+        ),
+    ]
+
+    if importlib.util.find_spec("httpx") is not None:
+        loop = asyncio.new_event_loop()
+        stack.callback(loop.close)
+        async_cardinity = AsyncCardinity("key", "secret", base_url=server.base_url)
+        stack.callback(lambda: loop.run_until_complete(async_cardinity.aclose()))
+        benchmarks.append(
+            Benchmark(
+                "roundtrip.async_get_payment",
+                lambda: loop.run_until_complete(
+                    async_cardinity.get_payment(payment_id)
+                ),
+            )
+        )
+    return benchmarks
+
+
+def run_suite(
+    only: Optional[Sequence[str]] = None, scale: float = 1.0
+) -> Dict[str, Dict[str, float]]:
+    """Run the suite against a fresh test server.
+
+    Args:
+        only: Name prefixes of the benchmarks to run (all if None)
+        scale: Factor applied to the number of samples
+
+    Returns:
+        Dict[str, Dict[str, float]]: Results by benchmark name
+    """
+    results = {}
+    with CardinityTestServer() as server, ExitStack() as stack:
+        for benchmark in build_benchmarks(server, stack):
+            if only and not any(benchmark.name.startswith(name) for name in only):
+                continue
+            results[benchmark.name] = result = benchmark.run(scale)
+            print(
+                f"  {benchmark.name:32} p50 {result['p50_us']:10.1f} us"
+                f"  p95 {result['p95_us']:10.1f} us  p99 {result['p99_us']:10.1f} us"
+                f"  {result['ops_per_sec']:12.0f} ops/s"
+            )
+    return results
+
+
+def environment() -> Dict[str, str]:
+    """Describe the machine and interpreter the results were measured on."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "json_codec": get_codec().name,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, float]]:
+    """Load the results stored in a results or baseline file."""
+    with path.open() as file:
+        return json.load(file)["results"]
+
+
+def save_results(path: Path, results: Dict[str, Dict[str, float]]) -> None:
+    """Store results with a description of the environment."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=2)
+        file.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the suite from the command line.
+
+    Returns:
+        int: Exit status, 1 if a benchmark regressed
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="factor applied to sample counts"
+    )
+    parser.add_argument(
+        "--only", nargs="+", metavar="PREFIX", help="run matching benchmarks only"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store the results as the new baseline instead of comparing",
+    )
+    args = parser.parse_args(argv)
+
+    print("Cardinity SDK benchmark suite")
+    results = run_suite(args.only, args.scale)
+    save_results(args.output, results)
+    print(f"\nResults written to {args.output}")
+
+    if args.update_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline")
+        return 0
+
+    regressions = compare(results, load_results(args.baseline), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print(
+            f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,19 +4,38 @@ Cardinity Python SDK
 A Python SDK for the Cardinity payment gateway API.
 """
 
+from .async_client import AsyncCardinityClient
+from .async_sdk import AsyncCardinity
 from .auth import CardinityAuth
+from .bulk import BulkResult
 from .client import CardinityClient
 from .exceptions import (
     APIError,
     AuthenticationError,
     CardinityError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    IdempotencyError,
     NotFoundError,
     RateLimitError,
     ServerError,
     ValidationError,
 )
+from .hooks import RequestEvent, RequestHooks
+from .idempotency import IdempotencyLedger
+from .metrics import ClientMetrics
 from .models import BaseModel, ReadOnlyModel
+from .results import (
+    ChargebackResult,
+    PaymentLinkResult,
+    PaymentResult,
+    RefundResult,
+    Result,
+    SettlementResult,
+    VoidResult,
+)
 from .sdk import Cardinity
+from .tracing import Tracing
 from .validation import (
     CardinityValidator,
     Constraints,
@@ -33,9 +52,17 @@ __version__ = "1.0.4"
 __all__ = [
     # Main SDK Interface
     "Cardinity",
+    "AsyncCardinity",
     # Core functionality
     "CardinityAuth",
     "CardinityClient",
+    "AsyncCardinityClient",
+    "BulkResult",
+    "IdempotencyLedger",
+    "RequestHooks",
+    "RequestEvent",
+    "ClientMetrics",
+    "Tracing",
     # Exceptions
     "CardinityError",
     "ValidationError",
@@ -44,9 +71,20 @@ __all__ = [
     "NotFoundError",
     "RateLimitError",
     "ServerError",
+    "CircuitOpenError",
+    "IdempotencyError",
+    "DeadlineExceededError",
     # Models
     "BaseModel",
     "ReadOnlyModel",
+    # Results
+    "Result",
+    "PaymentResult",
+    "RefundResult",
+    "SettlementResult",
+    "VoidResult",
+    "ChargebackResult",
+    "PaymentLinkResult",
     # Validation
     "Constraints",
     "CardinityValidator",
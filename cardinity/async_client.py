@@ -0,0 +1,679 @@
+"""
+Cardinity Async HTTP Client
+
+This module contains the asyncio-based HTTP client for making requests to the
+Cardinity API. It requires the optional ``httpx`` dependency, installable with
+``pip install cardinity-python[async]``.
+"""
+
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlencode, urljoin
+
+from .auth import CardinityAuth
+from .cache import ResponseCache
+from .circuit import CircuitBreaker
+from .client import (
+    CardinityClient,
+    decode_response,
+    extract_error_message,
+    raise_for_status,
+)
+from .coalesce import AsyncSingleFlight, request_key
+from .codec import JSONCodec, get_codec
+from .exceptions import (
+    APIError,
+    CardinityError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    RateLimitError,
+    ServerError,
+)
+from .hooks import RequestEvent, RequestHooks
+from .idempotency import (
+    IDEMPOTENCY_HEADER,
+    IdempotencyLedger,
+    derive_idempotency_key,
+)
+from .models.base import ReadOnlyModel
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .tracing import DISABLED, Tracing
+from .utils import endpoint_template, freeze
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncCardinityClient:
+    """Asynchronous HTTP client for the Cardinity Payment Gateway API.
+
+    This client mirrors CardinityClient for asyncio applications. Requests go
+    through a pooled ``httpx.AsyncClient``, are signed with OAuth 1.0, map
+    error responses onto the same exceptions, and back off between retries
+    without blocking the event loop.
+    """
+
+    BASE_URL = CardinityClient.BASE_URL
+    DEFAULT_TIMEOUT = CardinityClient.DEFAULT_TIMEOUT
+    MAX_RETRIES = CardinityClient.MAX_RETRIES
+    RETRY_DELAY = CardinityClient.RETRY_DELAY
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+
+    def __init__(
+        self,
+        auth: CardinityAuth,
+        base_url: str = BASE_URL,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_reads: bool = True,
+        json_codec: Union[str, JSONCodec, None] = None,
+        idempotency_ledger: Optional[IdempotencyLedger] = None,
+        derive_idempotency_keys: bool = False,
+        hooks: Optional[RequestHooks] = None,
+        tracing: Optional[Tracing] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+        transport: Optional[Any] = None,
+    ) -> None:
+        """Initialize the asynchronous Cardinity HTTP client.
+
+        Args:
+            auth: CardinityAuth instance for authentication
+            base_url: Base URL for the Cardinity API
+            timeout: Default timeout of each attempt, in seconds
+            max_retries: Maximum number of retries for failed requests
+            retry_policy: Policy deciding which failures are retried and how
+                long to wait (its sleep function is not used; waits always go
+                through asyncio.sleep)
+            rate_limiter: Optional client-side rate limiter spacing out
+                requests per endpoint family; may be shared between clients
+                (waits for tokens go through asyncio.sleep)
+            circuit_breaker: Optional circuit breaker failing requests fast
+                while their endpoint family keeps failing; may be shared
+                between clients
+            response_cache: Optional cache serving repeated lookups of
+                read-only models (get_payment, get_refund, ...) locally
+            coalesce_reads: Share one API call between concurrent identical
+                GET requests (same endpoint and parameters)
+            json_codec: JSON codec, or name of one ("orjson", "msgspec",
+                "ujson", "json"); defaults to the fastest one installed
+            idempotency_ledger: Optional ledger answering a repeated POST
+                with the same idempotency key (explicit or derived) with the
+                original response; may be shared between clients
+            derive_idempotency_keys: Give POSTs without an explicit
+                idempotency key one derived from their order_id and payload
+                (see derive_idempotency_key())
+            hooks: Optional instrumentation hooks called at each stage of
+                every request (see RequestHooks); handlers can also be added
+                later through the client's hooks attribute
+            tracing: Optional OpenTelemetry tracing of the SDK operations and
+                their HTTP attempts; requests then carry trace context headers
+            connect_timeout: Seconds to wait for a connection to be
+                established (defaults to timeout)
+            read_timeout: Seconds to wait for the server to send data
+                (defaults to timeout)
+            deadline: Default limit in seconds on the total time of a call,
+                across all its attempts and the waits between them; each
+                attempt's timeouts are shortened to the time left (None for
+                no limit)
+            max_connections: Maximum number of concurrent pooled connections
+            max_keepalive_connections: Maximum number of idle connections kept
+                alive in the pool
+            transport: Optional custom httpx async transport
+
+        Raises:
+            ImportError: If httpx is not installed
+            ValueError: If the deadline is not positive
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncCardinityClient requires httpx. "
+                "Install it with: pip install cardinity-python[async]"
+            )
+
+        self.auth = auth
+        self.base_url = base_url
+        self.timeout = timeout
+        self.connect_timeout = (
+            connect_timeout if connect_timeout is not None else timeout
+        )
+        self.read_timeout = read_timeout if read_timeout is not None else timeout
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, backoff_base=self.RETRY_DELAY
+        )
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self.codec = (
+            json_codec if isinstance(json_codec, JSONCodec) else get_codec(json_codec)
+        )
+        self.single_flight = AsyncSingleFlight() if coalesce_reads else None
+        self.idempotency_ledger = idempotency_ledger
+        self.derive_idempotency_keys = derive_idempotency_keys
+        # Concurrent submissions of one idempotent operation share one call
+        self._idempotent_flight = AsyncSingleFlight()
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.tracing = tracing if tracing is not None and tracing.enabled else None
+
+        # Create a pooled async client shared by all requests
+        self.session = httpx.AsyncClient(
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": "cardinity-python/1.0.0",
+            },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(
+                timeout, connect=self.connect_timeout, read=self.read_timeout
+            ),
+            transport=transport,
+        )
+
+    def _build_url(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the full URL for an API endpoint.
+
+        Query parameters are folded into the URL so that the OAuth signature
+        covers exactly the URL that is sent.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/payments")
+            params: URL query parameters
+
+        Returns:
+            str: Full URL for the API endpoint
+        """
+        # Ensure base_url ends with / and endpoint starts with / for proper joining
+        base = self.base_url.rstrip("/") + "/"
+        url = urljoin(base, endpoint.lstrip("/"))
+        if params:
+            separator = "&" if "?" in url else "?"
+            url = f"{url}{separator}{urlencode(params)}"
+        return url
+
+    def _parse_response(self, response: "httpx.Response") -> Dict[str, Any]:
+        """Parse and validate API response.
+
+        Args:
+            response: HTTP response object
+
+        Returns:
+            Dict[str, Any]: Parsed response data
+
+        Raises:
+            APIError: If the response indicates an error
+        """
+        try:
+            response_data = decode_response(self.codec, response)
+        except ValueError:
+            # Handle non-JSON responses
+            response_data = {"error": "Invalid JSON response", "content": response.text}
+
+        # Check for HTTP errors
+        if not response.is_success:
+            error_message = extract_error_message(
+                response_data, response.status_code, response.reason_phrase
+            )
+            raise_for_status(
+                response.status_code,
+                error_message,
+                response_data,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
+
+        return response_data
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make an HTTP request to the Cardinity API.
+
+        Failed attempts are retried as decided by the client's retry policy.
+        The request is reported to the client's hooks if any handler is
+        registered, and traced if the client has tracing enabled.
+
+        With a deadline, the request fails with DeadlineExceededError instead
+        of waiting for a rate limiter slot or a retry that would start after
+        the deadline, and each attempt's timeouts are shortened to the time
+        left.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE)
+            endpoint: API endpoint path
+            data: Request payload data (for POST/PATCH requests)
+            params: URL query parameters
+            idempotency_key: Key sent in the Idempotency-Key header of every
+                attempt
+            deadline: Seconds the request may take in total (defaults to the
+                client's deadline)
+
+        Returns:
+            Dict[str, Any]: Parsed API response data
+
+        Raises:
+            CardinityError: If the request fails after all retries
+            CircuitOpenError: If the circuit breaker rejects the request
+            DeadlineExceededError: If the deadline expires first
+        """
+        if deadline is None:
+            deadline = self.deadline
+        hooks = self.hooks
+        if not hooks and self.tracing is None:
+            return await self._send(
+                method, endpoint, data, params, idempotency_key, deadline
+            )
+
+        event = hooks.start(method.upper(), endpoint, self._build_url(endpoint))
+        try:
+            result = await self._send(
+                method, endpoint, data, params, idempotency_key, deadline, event
+            )
+        except BaseException as e:
+            hooks.complete(event, e)
+            raise
+        hooks.complete(event)
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        deadline: Optional[float] = None,
+        event: Optional[RequestEvent] = None,
+    ) -> Dict[str, Any]:
+        """Send a request, retrying failed attempts.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            data: Request payload data
+            params: URL query parameters
+            idempotency_key: Key sent in the Idempotency-Key header
+            deadline: Seconds the request may take in total
+            event: Event reporting the attempts to the hooks, if instrumented
+
+        Returns:
+            Dict[str, Any]: Parsed API response data
+        """
+        method = method.upper()
+        url = self._build_url(endpoint, params)
+        content = self.codec.dumps(data) if data is not None else None
+        hooks = self.hooks
+        policy = self.retry_policy
+        state = policy.start(method, idempotency_key, deadline)
+        limiter = self.rate_limiter
+        breaker = self.circuit_breaker
+        timeout: Any = httpx.USE_CLIENT_DEFAULT
+
+        while True:
+            if breaker is not None:
+                # Fail fast before queueing for a rate limiter token
+                breaker.check(endpoint)
+            if limiter is not None:
+                wait = limiter.reserve(endpoint)
+                if wait > 0:
+                    try:
+                        policy.time_left(state, wait)
+                    except DeadlineExceededError:
+                        # The request will not be sent; free its slot
+                        limiter.release(endpoint)
+                        raise
+                    await asyncio.sleep(wait)
+            left = policy.time_left(state)
+            if left is not None:
+                timeout = httpx.Timeout(
+                    min(self.timeout, left),
+                    connect=min(self.connect_timeout, left),
+                    read=min(self.read_timeout, left),
+                )
+            if breaker is not None:
+                try:
+                    breaker.allow(endpoint)
+                except CircuitOpenError:
+                    # The circuit opened while waiting for the token
+                    if limiter is not None:
+                        limiter.release(endpoint)
+                    raise
+            try:
+                with (
+                    breaker.call(endpoint, admitted=True) if breaker else nullcontext()
+                ):
+                    if event is None:
+                        headers = self.auth.get_auth_headers(method, url)
+                        if idempotency_key:
+                            headers[IDEMPOTENCY_HEADER] = idempotency_key
+                        response = await self.session.request(
+                            method,
+                            url,
+                            content=content,
+                            headers=headers,
+                            timeout=timeout,
+                        )
+                        result = self._parse_response(response)
+                    else:
+                        result = await self._send_traced(
+                            event, method, url, content, idempotency_key, timeout
+                        )
+                if limiter is not None:
+                    limiter.on_success(endpoint)
+                return result
+
+            except httpx.TransportError as e:
+                if event is not None:
+                    hooks.error(event, e)
+                # Failures to connect never reached the server
+                request_sent = not isinstance(
+                    e, (httpx.ConnectError, httpx.ConnectTimeout)
+                )
+                delay = policy.next_delay(state, e, request_sent=request_sent)
+                if delay is None:
+                    raise CardinityError(f"Request failed: {str(e)}")
+                policy.time_left(state, delay, cause=e)
+
+            except httpx.HTTPError as e:
+                if event is not None:
+                    hooks.error(event, e)
+                raise CardinityError(f"Request failed: {str(e)}")
+
+            except (RateLimitError, ServerError) as e:
+                if event is not None:
+                    hooks.error(event, e)
+                if limiter is not None and isinstance(e, RateLimitError):
+                    # Slow the endpoint family down instead of adding load
+                    limiter.on_rate_limited(endpoint, e.retry_after)
+                delay = policy.next_delay(state, e)
+                if delay is None:
+                    raise
+                policy.time_left(state, delay, cause=e)
+
+            except APIError as e:
+                if event is not None:
+                    hooks.error(event, e)
+                raise
+
+            if event is not None:
+                hooks.retry(event, delay)
+            # Back off without blocking the event loop
+            await asyncio.sleep(delay)
+
+    async def _send_traced(
+        self,
+        event: RequestEvent,
+        method: str,
+        url: str,
+        content: Optional[bytes],
+        idempotency_key: Optional[str],
+        timeout: Any = None,
+    ) -> Dict[str, Any]:
+        """Send one attempt of a request, timing its phases for the hooks.
+
+        With tracing, the attempt is traced as a client span with child spans
+        for signing and parsing, and its trace context is sent in the request
+        headers.
+
+        Args:
+            event: Event of the request
+            method: HTTP method
+            url: Full request URL, with query parameters
+            content: Encoded request body
+            idempotency_key: Key sent in the Idempotency-Key header
+            timeout: httpx timeout of the attempt (the client's by default)
+
+        Returns:
+            Dict[str, Any]: Parsed API response data
+        """
+        if timeout is None:
+            timeout = httpx.USE_CLIENT_DEFAULT
+        hooks = self.hooks
+        tracing = self.tracing or DISABLED
+        hooks.attempt(event)
+
+        attributes: Dict[str, Any] = {
+            "http.request.method": method,
+            "url.full": event.url,
+        }
+        if event.attempt > 1:
+            attributes["http.request.resend_count"] = event.attempt - 1
+        name = f"{method} {endpoint_template(event.endpoint)}"
+        with tracing.span(name, attributes, client=True) as span:
+            start = time.monotonic()
+            with tracing.span("CardinityAuth.sign"):
+                headers = self.auth.get_auth_headers(method, url)
+            hooks.signed(event, time.monotonic() - start)
+            if idempotency_key:
+                headers[IDEMPOTENCY_HEADER] = idempotency_key
+            tracing.inject(headers, span)
+
+            start = time.monotonic()
+            response = await self.session.request(
+                method, url, content=content, headers=headers, timeout=timeout
+            )
+            # httpx reads the whole body before returning
+            event.phases["send"] = time.monotonic() - start
+            hooks.response(
+                event,
+                response.status_code,
+                len(content) if content else 0,
+                len(response.content),
+            )
+            if span is not None:
+                span.set_attribute("http.response.status_code", response.status_code)
+
+            start = time.monotonic()
+            try:
+                with tracing.span("Response.parse"):
+                    return self._parse_response(response)
+            finally:
+                event.phases["parse"] = time.monotonic() - start
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make a GET request to the API.
+
+        Identical GET requests made concurrently share one API call unless
+        coalescing was disabled; the call runs with the deadline of the
+        request that started it.
+
+        Args:
+            endpoint: API endpoint path
+            params: URL query parameters
+            deadline: Seconds the request may take in total (optional)
+
+        Returns:
+            Dict[str, Any]: API response data
+        """
+        if self.single_flight is None:
+            return await self._request(
+                "GET", endpoint, params=params, deadline=deadline
+            )
+        return await self.single_flight.do(
+            request_key("GET", endpoint, params),
+            lambda: self._request("GET", endpoint, params=params, deadline=deadline),
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make a POST request to the API.
+
+        A POST carries an idempotency key, the same for all its retries, when
+        one is given or, if the client derives keys, when its payload has an
+        order_id. With an idempotency ledger, repeating a key returns the
+        recorded response instead of calling the API again.
+
+        Args:
+            endpoint: API endpoint path
+            data: Request payload data
+            idempotency_key: Key identifying the operation (optional)
+            deadline: Seconds the request may take in total (optional)
+
+        Returns:
+            Dict[str, Any]: API response data
+
+        Raises:
+            IdempotencyError: If the key was already used with another payload
+        """
+        key = idempotency_key
+        if key is None and self.derive_idempotency_keys:
+            key = derive_idempotency_key(endpoint, data)
+        ledger = self.idempotency_ledger
+        if ledger is None or key is None:
+            return await self._request(
+                "POST",
+                endpoint,
+                data=data,
+                idempotency_key=key,
+                deadline=deadline,
+            )
+
+        async def submit() -> Dict[str, Any]:
+            recorded = ledger.get(key, data)
+            if recorded is not None:
+                return recorded
+            response = await self._request(
+                "POST", endpoint, data=data, idempotency_key=key, deadline=deadline
+            )
+            ledger.record(key, data, response)
+            return response
+
+        return await self._idempotent_flight.do((key, freeze(data)), submit)
+
+    async def patch(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make a PATCH request to the API.
+
+        Args:
+            endpoint: API endpoint path
+            data: Request payload data
+            deadline: Seconds the request may take in total (optional)
+
+        Returns:
+            Dict[str, Any]: API response data
+        """
+        return await self._request("PATCH", endpoint, data=data, deadline=deadline)
+
+    async def delete(
+        self, endpoint: str, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Make a DELETE request to the API.
+
+        Args:
+            endpoint: API endpoint path
+            deadline: Seconds the request may take in total (optional)
+
+        Returns:
+            Dict[str, Any]: API response data
+        """
+        return await self._request("DELETE", endpoint, deadline=deadline)
+
+    async def execute_request(
+        self,
+        model,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Execute a request using a model object.
+
+        Args:
+            model: Model object with get_method(), get_endpoint(), and to_dict() methods
+            idempotency_key: Idempotency key of a POST request (optional, see
+                post())
+            deadline: Seconds the request may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Parsed API response data
+
+        Raises:
+            CardinityError: If the request fails
+        """
+        method = model.get_method().upper()
+        endpoint = model.get_endpoint()
+        cache = self.response_cache
+
+        if method == "GET":
+            if cache is None or not isinstance(model, ReadOnlyModel):
+                return await self.get(endpoint, deadline=deadline)
+            cached = cache.get(endpoint)
+            if cached is not None:
+                return cached
+            response = await self.get(endpoint, deadline=deadline)
+            cache.set(endpoint, response)
+            return response
+
+        if method not in ("POST", "PATCH", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        if cache is not None:
+            # The written resource (and its parent payment) changes
+            cache.invalidate(endpoint)
+        try:
+            if method == "POST":
+                return await self.post(
+                    endpoint, model.to_dict(), idempotency_key, deadline
+                )
+            elif method == "PATCH":
+                return await self.patch(endpoint, model.to_dict(), deadline)
+            else:
+                return await self.delete(endpoint, deadline)
+        finally:
+            if cache is not None:
+                # A GET running alongside the write may have cached the old
+                # state; drop it again, even if the write failed midway
+                cache.invalidate(endpoint)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and clean up resources."""
+        if self.session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the client."""
+        return f"AsyncCardinityClient(base_url='{self.base_url}')"
@@ -0,0 +1,560 @@
+"""
+Cardinity Async SDK Interface
+
+This module provides the AsyncCardinity class, the asyncio counterpart of the
+Cardinity facade.
+"""
+
+from typing import Any, Dict, Optional, Type, Union
+
+from .async_client import AsyncCardinityClient
+from .auth import CardinityAuth
+from .models import (
+    FinalizePayment,
+    GetChargeback,
+    GetPayment,
+    GetPaymentLink,
+    GetRefund,
+    GetSettlement,
+    GetVoid,
+    Payment,
+    PaymentLink,
+    RecurringPayment,
+    Refund,
+    Settlement,
+    UpdatePaymentLink,
+    Void,
+)
+from .results import (
+    ChargebackResult,
+    PaymentLinkResult,
+    PaymentResult,
+    RefundResult,
+    Result,
+    SettlementResult,
+    VoidResult,
+)
+from .tracing import traced
+
+
+class AsyncCardinity:
+    """Asynchronous Cardinity SDK class.
+
+    This class exposes the same operations as Cardinity, but every API call is
+    a coroutine executed over a pooled asynchronous HTTP transport. Input
+    validation still happens eagerly when each request model is built.
+
+    Example:
+        Basic usage example::
+
+            async with AsyncCardinity(
+                consumer_key="your_consumer_key",
+                consumer_secret="your_consumer_secret"
+            ) as cardinity:
+                payment = await cardinity.create_payment(
+                    amount="10.50",
+                    currency="EUR",
+                    description="Test payment"
+                )
+
+    Responses are dictionaries by default. With ``typed_results=True`` they
+    are Result objects (PaymentResult, RefundResult, ...) exposing decoded
+    attributes such as ``payment.amount`` (a Decimal) while still supporting
+    dictionary-style reads.
+    """
+
+    def __init__(
+        self,
+        consumer_key: str,
+        consumer_secret: str,
+        base_url: str = "https://api.cardinity.com/v1",
+        typed_results: bool = False,
+        **client_options: Any,
+    ) -> None:
+        """Initialize the asynchronous Cardinity SDK.
+
+        Args:
+            consumer_key: Your Cardinity consumer key
+            consumer_secret: Your Cardinity consumer secret
+            base_url: Base URL for the Cardinity API (default: production)
+            typed_results: Return typed, lazily decoded result objects
+                (PaymentResult, RefundResult, ...) instead of dictionaries.
+                Results still support dictionary-style reads.
+            **client_options: Extra options passed to AsyncCardinityClient
+                (timeout, connect_timeout, read_timeout, deadline,
+                max_retries, max_connections, ...)
+        """
+        self._auth = CardinityAuth(consumer_key, consumer_secret)
+        self._client = AsyncCardinityClient(self._auth, base_url, **client_options)
+        self.typed_results = typed_results
+
+    def _wrap(self, result_class: Type[Result], data: Any) -> Any:
+        """Wrap a response in its result class if typed results are enabled.
+
+        Args:
+            result_class: Result class matching the endpoint
+            data: Parsed response
+
+        Returns:
+            Any: Result object(s), or the response unchanged
+        """
+        return result_class.wrap(data) if self.typed_results else data
+
+    # Payment Operations
+
+    @traced
+    async def create_payment(
+        self,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a new payment.
+
+        Args:
+            **kwargs: Payment data including amount, currency, description, etc.
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Payment response from the API
+
+        Raises:
+            ValidationError: If payment data is invalid
+            APIError: If the API request fails
+        """
+        payment = Payment(**kwargs)
+        return self._wrap(
+            PaymentResult,
+            await self._client.execute_request(
+                payment, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
+    async def get_payment(
+        self,
+        payment_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        *,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get payment information.
+
+        Args:
+            payment_id: Specific payment ID to retrieve (optional)
+            limit: Limit for payment listing (optional, used when payment_id is None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Payment data or list of payments
+
+        Raises:
+            APIError: If the API request fails
+        """
+        get_payment = GetPayment(payment_id, limit)
+        return self._wrap(
+            PaymentResult,
+            await self._client.execute_request(get_payment, deadline=deadline),
+        )
+
+    @traced
+    async def finalize_payment(
+        self, payment_id: str, *, deadline: Optional[float] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Finalize a payment (complete 3D Secure authentication).
+
+        Args:
+            payment_id: ID of the payment to finalize
+            **kwargs: Finalization data (authorize_data or cres)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Finalized payment response
+
+        Raises:
+            ValidationError: If finalization data is invalid
+            APIError: If the API request fails
+        """
+        finalize = FinalizePayment(payment_id, **kwargs)
+        return self._wrap(
+            PaymentResult,
+            await self._client.execute_request(finalize, deadline=deadline),
+        )
+
+    @traced
+    async def create_recurring_payment(
+        self,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a recurring payment.
+
+        Args:
+            **kwargs: Recurring payment data including payment_id reference
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Recurring payment response
+
+        Raises:
+            ValidationError: If recurring payment data is invalid
+            APIError: If the API request fails
+        """
+        recurring = RecurringPayment(**kwargs)
+        return self._wrap(
+            PaymentResult,
+            await self._client.execute_request(
+                recurring, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    # Refund Operations
+
+    @traced
+    async def create_refund(
+        self,
+        payment_id: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a refund for a payment.
+
+        Args:
+            payment_id: ID of the payment to refund
+            **kwargs: Refund data including amount and description
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Refund response
+
+        Raises:
+            ValidationError: If refund data is invalid
+            APIError: If the API request fails
+        """
+        refund = Refund(payment_id, **kwargs)
+        return self._wrap(
+            RefundResult,
+            await self._client.execute_request(
+                refund, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
+    async def get_refund(
+        self,
+        payment_id: str,
+        refund_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get refund information.
+
+        Args:
+            payment_id: ID of the payment
+            refund_id: Specific refund ID (optional, lists all if None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Refund data or list of refunds
+
+        Raises:
+            APIError: If the API request fails
+        """
+        get_refund = GetRefund(payment_id, refund_id)
+        return self._wrap(
+            RefundResult,
+            await self._client.execute_request(get_refund, deadline=deadline),
+        )
+
+    # Settlement Operations
+
+    @traced
+    async def create_settlement(
+        self,
+        payment_id: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a settlement for a payment.
+
+        Args:
+            payment_id: ID of the payment to settle
+            **kwargs: Settlement data including amount and description
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Settlement response
+
+        Raises:
+            ValidationError: If settlement data is invalid
+            APIError: If the API request fails
+        """
+        settlement = Settlement(payment_id, **kwargs)
+        return self._wrap(
+            SettlementResult,
+            await self._client.execute_request(
+                settlement, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
+    async def get_settlement(
+        self,
+        payment_id: str,
+        settlement_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get settlement information.
+
+        Args:
+            payment_id: ID of the payment
+            settlement_id: Specific settlement ID (optional, lists all if None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Settlement data or list of settlements
+
+        Raises:
+            APIError: If the API request fails
+        """
+        get_settlement = GetSettlement(payment_id, settlement_id)
+        return self._wrap(
+            SettlementResult,
+            await self._client.execute_request(get_settlement, deadline=deadline),
+        )
+
+    # Void Operations
+
+    @traced
+    async def create_void(
+        self,
+        payment_id: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a void for a payment.
+
+        Args:
+            payment_id: ID of the payment to void
+            **kwargs: Optional void data including description
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Void response
+
+        Raises:
+            APIError: If the API request fails
+        """
+        void = Void(payment_id, **kwargs)
+        return self._wrap(
+            VoidResult,
+            await self._client.execute_request(
+                void, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
+    async def get_void(
+        self,
+        payment_id: str,
+        void_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get void information.
+
+        Args:
+            payment_id: ID of the payment
+            void_id: Specific void ID (optional, lists all if None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Void data or list of voids
+
+        Raises:
+            APIError: If the API request fails
+        """
+        get_void = GetVoid(payment_id, void_id)
+        return self._wrap(
+            VoidResult, await self._client.execute_request(get_void, deadline=deadline)
+        )
+
+    # Chargeback Operations
+
+    @traced
+    async def get_chargeback(
+        self,
+        payment_id_or_limit: Optional[Union[str, int]] = None,
+        chargeback_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get chargeback information.
+
+        Supports the same modes as Cardinity.get_chargeback().
+
+        Args:
+            payment_id_or_limit: Payment ID (str) or limit (int) for global listing
+            chargeback_id: Specific chargeback ID (optional)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Chargeback data or list of chargebacks
+
+        Raises:
+            APIError: If the API request fails
+        """
+        get_chargeback = GetChargeback(payment_id_or_limit, chargeback_id)
+        return self._wrap(
+            ChargebackResult,
+            await self._client.execute_request(get_chargeback, deadline=deadline),
+        )
+
+    # Payment Link Operations
+
+    @traced
+    async def create_payment_link(
+        self,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a payment link.
+
+        Args:
+            **kwargs: Payment link data including amount, currency, description, etc.
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Payment link response
+
+        Raises:
+            ValidationError: If payment link data is invalid
+            APIError: If the API request fails
+        """
+        payment_link = PaymentLink(kwargs)
+        return self._wrap(
+            PaymentLinkResult,
+            await self._client.execute_request(
+                payment_link, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
+    async def update_payment_link(
+        self, link_id: str, *, deadline: Optional[float] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Update an existing payment link.
+
+        Args:
+            link_id: ID of the payment link to update
+            **kwargs: Update data including expiration_date and enabled status
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Updated payment link response
+
+        Raises:
+            ValidationError: If update data is invalid
+            APIError: If the API request fails
+        """
+        update_link = UpdatePaymentLink(link_id, kwargs)
+        return self._wrap(
+            PaymentLinkResult,
+            await self._client.execute_request(update_link, deadline=deadline),
+        )
+
+    @traced
+    async def get_payment_link(
+        self, link_id: str, *, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Get payment link information.
+
+        Args:
+            link_id: ID of the payment link to retrieve
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
+
+        Returns:
+            Dict[str, Any]: Payment link data
+
+        Raises:
+            APIError: If the API request fails
+        """
+        get_link = GetPaymentLink(link_id)
+        return self._wrap(
+            PaymentLinkResult,
+            await self._client.execute_request(get_link, deadline=deadline),
+        )
+
+    # Utility Methods
+
+    def get_client(self) -> AsyncCardinityClient:
+        """Get the underlying asynchronous HTTP client for advanced usage.
+
+        Returns:
+            AsyncCardinityClient: The HTTP client instance
+        """
+        return self._client
+
+    def get_auth(self) -> CardinityAuth:
+        """Get the authentication instance.
+
+        Returns:
+            CardinityAuth: The authentication instance
+        """
+        return self._auth
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
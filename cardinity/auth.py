@@ -4,10 +4,16 @@ Cardinity Authentication
 This module handles OAuth 1.0 authentication for the Cardinity API.
 """
 
-from typing import Dict
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
+from requests import PreparedRequest
 from requests_oauthlib import OAuth1
 
+from .signing import OAuthSigner
+
+_T = TypeVar("_T")
+
 
 class CardinityAuth:
     """OAuth 1.0 authentication handler for Cardinity API.
@@ -15,6 +21,15 @@ class CardinityAuth:
     This class manages OAuth 1.0 authentication using HMAC-SHA1 signature method
     as required by the Cardinity API. It provides authentication headers for
     HTTP requests.
+
+    Requests are signed with the in-house OAuthSigner, which produces the same
+    Authorization header as oauthlib at a fraction of the cost. Instances are
+    also usable directly as a requests auth callable. get_auth() still returns
+    a standard OAuth1 object for callers that need one.
+
+    Signers are built once per credential pair and reused for every request.
+    They hold no per-request state (each signature gets a fresh nonce and
+    timestamp), so one signer is safe to share between threads.
     """
 
     def __init__(self, consumer_key: str, consumer_secret: str) -> None:
@@ -34,17 +49,64 @@ class CardinityAuth:
 
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
+        self._oauth1: Optional[Tuple[Tuple[str, str], OAuth1]] = None
+        self._signer: Optional[Tuple[Tuple[str, str], OAuthSigner]] = None
+        self._lock = threading.Lock()
+
+    def _cached(self, attr: str, factory: Callable[[str, str], _T]) -> _T:
+        """Return the object cached in ``attr`` for the current credentials.
+
+        Args:
+            attr: Name of the attribute holding a (credentials, object) pair
+            factory: Callable building the object from key and secret
+
+        Returns:
+            The cached object, rebuilt only if the credentials changed
+        """
+        credentials = (self.consumer_key, self.consumer_secret)
+        cached = getattr(self, attr)
+        if cached is None or cached[0] != credentials:
+            with self._lock:
+                cached = getattr(self, attr)
+                if cached is None or cached[0] != credentials:
+                    cached = (credentials, factory(*credentials))
+                    setattr(self, attr, cached)
+        return cached[1]
 
     def get_auth(self) -> OAuth1:
         """Get the OAuth1 authentication object for requests.
 
+        The object is created on first use and cached for the current
+        credentials; it is rebuilt only if the credentials change.
+
         Returns:
             OAuth1: Configured OAuth1 authentication object that can be used
                    with the requests library
         """
+        return self._cached("_oauth1", self._create_oauth1)
+
+    def get_signer(self) -> OAuthSigner:
+        """Get the fast OAuth 1.0 signer for the current credentials.
+
+        Returns:
+            OAuthSigner: Cached signer, rebuilt only if the credentials change
+        """
+        return self._cached("_signer", OAuthSigner)
+
+    @staticmethod
+    def _create_oauth1(consumer_key: str, consumer_secret: str) -> OAuth1:
+        """Create an OAuth1 signer for a credential pair.
+
+        Args:
+            consumer_key: The OAuth consumer key
+            consumer_secret: The OAuth consumer secret
+
+        Returns:
+            OAuth1: OAuth1 object signing with HMAC-SHA1 in the header
+        """
         return OAuth1(
-            client_key=self.consumer_key,
-            client_secret=self.consumer_secret,
+            client_key=consumer_key,
+            client_secret=consumer_secret,
             signature_method="HMAC-SHA1",
             signature_type="AUTH_HEADER",
         )
@@ -53,19 +115,33 @@ class CardinityAuth:
         """Get authentication headers for a specific request.
 
         This is an alternative method to get_auth() that returns the headers
-        directly instead of an OAuth1 object.
+        directly instead of an OAuth1 object, for transports other than
+        requests (e.g. the asynchronous client).
 
         Args:
             method: HTTP method (GET, POST, PATCH, etc.)
-            url: Full URL for the request
-            body: Request body (for POST/PATCH requests)
+            url: Full URL for the request, including any query string
+            body: Request body (for POST/PATCH requests); JSON bodies are not
+                part of the OAuth 1.0 signature, so it does not affect it
 
         Returns:
             Dict[str, str]: Dictionary containing OAuth authentication headers
         """
-        # We'll use the OAuth1 object with requests, so this method is mainly
-        # for compatibility or debugging purposes
-        return {}
+        return {"Authorization": self.get_signer().sign(method, url)}
+
+    def __call__(self, request: PreparedRequest) -> Any:
+        """Sign a prepared request, making this a requests auth callable.
+
+        Args:
+            request: Prepared request to sign
+
+        Returns:
+            PreparedRequest: The same request with an Authorization header
+        """
+        request.headers.update(
+            self.get_auth_headers(str(request.method), str(request.url))
+        )
+        return request
 
     def __repr__(self) -> str:
         """Return a string representation of the auth object."""
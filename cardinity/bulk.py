@@ -0,0 +1,163 @@
+"""
+Cardinity Bulk Submission
+
+This module submits many requests of the same kind concurrently over a
+bounded worker pool, reporting the outcome of every item without aborting
+the batch on individual failures.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from .models.base import BaseModel
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class BulkResult(NamedTuple):
+    """Outcome of a single item of a bulk submission.
+
+    Attributes:
+        position: Position of the item in the submitted iterable
+        data: Request data the item was submitted with
+        response: Parsed API response, or None if the item failed
+        error: Exception raised for the item (building its model or the API
+            request), or None
+    """
+
+    position: int
+    data: Dict[str, Any]
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was submitted successfully."""
+        return self.error is None
+
+
+# A validated item: (position, data, model or None, validation error or None)
+_Prepared = Tuple[int, Dict[str, Any], Optional[BaseModel], Optional[Exception]]
+
+
+def submit_bulk(
+    client: Any,
+    model_class: Type[BaseModel],
+    items: Iterable[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ordered: bool = True,
+) -> Iterator[BulkResult]:
+    """Validate a batch of requests and submit them concurrently.
+
+    All items are validated before anything is sent. Items whose model
+    cannot be built (invalid data, an item that is not a mapping, an unknown
+    field) are reported as failed results and never sent; the rest are
+    dispatched over a pool of ``max_concurrency`` worker threads sharing the
+    client (and so its connection pool). At most ``max_concurrency`` requests
+    are in flight at any time.
+
+    Args:
+        client: CardinityClient executing the requests
+        model_class: Model class each item's data is passed to as keyword
+            arguments
+        items: Request data for each item
+        max_concurrency: Maximum number of concurrent requests
+        ordered: Yield results in input order if True, otherwise in
+            completion order
+
+    Returns:
+        Iterator[BulkResult]: Lazily produced result for every item
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    prepared: List[_Prepared] = []
+    for position, data in enumerate(items):
+        try:
+            prepared.append((position, data, model_class(**data), None))
+        except Exception as e:
+            # Invalid data, a non-mapping item or an unknown field
+            prepared.append((position, data, None, e))
+
+    return _dispatch(client, prepared, max_concurrency, ordered)
+
+
+def _execute(client: Any, item: _Prepared) -> BulkResult:
+    """Execute one prepared item and capture its outcome.
+
+    Args:
+        client: CardinityClient executing the request
+        item: Prepared item
+
+    Returns:
+        BulkResult: Result of the item
+    """
+    position, data, model, error = item
+    if error is not None:
+        return BulkResult(position, data, error=error)
+    try:
+        return BulkResult(position, data, response=client.execute_request(model))
+    except Exception as e:
+        return BulkResult(position, data, error=e)
+
+
+def _dispatch(
+    client: Any, prepared: List[_Prepared], max_concurrency: int, ordered: bool
+) -> Iterator[BulkResult]:
+    """Run prepared items over a worker pool with a bounded in-flight window.
+
+    Args:
+        client: CardinityClient executing the requests
+        prepared: Validated items
+        max_concurrency: Maximum number of concurrent requests
+        ordered: Yield results in input order if True
+
+    Yields:
+        BulkResult: Result of every item
+    """
+    queue = iter(prepared)
+    in_flight: Deque[Future] = deque()
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="cardinity-bulk"
+    )
+
+    def fill() -> None:
+        while len(in_flight) < max_concurrency:
+            item = next(queue, None)
+            if item is None:
+                return
+            in_flight.append(executor.submit(_execute, client, item))
+
+    try:
+        fill()
+        while in_flight:
+            if ordered:
+                # Wait for the oldest request so results keep input order
+                yield in_flight.popleft().result()
+            else:
+                done: Set[Future] = wait(in_flight, return_when=FIRST_COMPLETED)[0]
+                for future in [f for f in in_flight if f in done]:
+                    in_flight.remove(future)
+                    yield future.result()
+            fill()
+    finally:
+        # Stop scheduling if the consumer abandons the iterator early
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
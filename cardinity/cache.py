@@ -0,0 +1,180 @@
+"""
+Cardinity Response Cache
+
+This module contains an in-process LRU cache with expiry for responses of
+the API's read endpoints, so that repeated lookups of the same payment,
+refund or settlement within seconds are served locally.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Collection, Dict, Optional, Tuple
+
+from .utils import endpoint_family
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 5.0
+DEFAULT_TERMINAL_TTL = 300.0
+#: Statuses after which a payment, refund, settlement or void never changes
+DEFAULT_TERMINAL_STATUSES = frozenset({"approved", "declined"})
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET responses with per-resource expiry.
+
+    Responses are keyed by endpoint and kept for ``ttl`` seconds, or for the
+    resource's entry in ``resource_ttls`` (keyed by endpoint family, e.g.
+    ``"payments"``). Resources that reached a terminal status (approved or
+    declined) cannot change any more and are kept for ``terminal_ttl``
+    instead. At most ``max_entries`` responses are kept; the least recently
+    used one is evicted first.
+
+    Cached responses are copied on the way in and out, so callers may modify
+    what they receive without affecting the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        resource_ttls: Optional[Dict[str, float]] = None,
+        terminal_ttl: float = DEFAULT_TERMINAL_TTL,
+        terminal_statuses: Collection[str] = DEFAULT_TERMINAL_STATUSES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl: Seconds a response is kept by default (0 disables caching
+                of non-terminal resources)
+            resource_ttls: Per endpoint family TTLs overriding ``ttl`` (e.g.
+                ``{"payments": 2, "settlements": 30}``)
+            terminal_ttl: Seconds a response in a terminal status is kept
+            terminal_statuses: Statuses that never change again
+            clock: Monotonic clock
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.resource_ttls = dict(resource_ttls or {})
+        self.terminal_ttl = terminal_ttl
+        self.terminal_statuses = frozenset(terminal_statuses)
+        self.clock = clock
+        self._lock = threading.Lock()
+        # endpoint -> (expiry time, response)
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, endpoint: str, response: Any) -> float:
+        """Compute how long a response may be cached.
+
+        Args:
+            endpoint: API endpoint the response was returned for
+            response: Parsed response
+
+        Returns:
+            float: Seconds to keep the response
+        """
+        if isinstance(response, dict):
+            if response.get("status") in self.terminal_statuses:
+                return self.terminal_ttl
+        return self.resource_ttls.get(endpoint_family(endpoint), self.ttl)
+
+    def get(self, endpoint: str) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            endpoint: API endpoint
+
+        Returns:
+            Optional[Any]: Copy of the cached response, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(endpoint)
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(endpoint)
+                self.hits += 1
+                response = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[endpoint]
+                self.misses += 1
+                return None
+        return copy.deepcopy(response)
+
+    def set(self, endpoint: str, response: Any) -> None:
+        """Cache a response.
+
+        Args:
+            endpoint: API endpoint the response was returned for
+            response: Parsed response
+        """
+        ttl = self.ttl_for(endpoint, response)
+        if ttl <= 0:
+            return
+        response = copy.deepcopy(response)
+        with self._lock:
+            self._entries[endpoint] = (self.clock() + ttl, response)
+            self._entries.move_to_end(endpoint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop the cached responses of a resource and everything below it.
+
+        Writes to ``/payments/<id>/refunds`` also drop ``/payments/<id>``,
+        since the payment changes with its refunds. Writes to a collection
+        (creating a payment) only drop the collection's listings.
+
+        Args:
+            endpoint: API endpoint that was written to
+        """
+        segments = [s for s in endpoint.split("?", 1)[0].split("/") if s]
+        root = "/" + "/".join(segments[:2])
+        nested = len(segments) > 1
+        with self._lock:
+            for key in list(self._entries):
+                path = "/" + key.split("?", 1)[0].strip("/")
+                if path == root or (nested and path.startswith(root + "/")):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the cache counters.
+
+        Returns:
+            Dict[str, int]: Numbers of hits, misses, evictions and cached
+                entries
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the cache."""
+        fields = ", ".join(f"{key}={value}" for key, value in self.stats().items())
+        return f"ResponseCache({fields})"
@@ -0,0 +1,369 @@
+"""
+Cardinity Circuit Breaker
+
+This module contains a circuit breaker that makes requests fail fast while an
+endpoint family of the Cardinity API keeps failing or responding slowly,
+instead of tying up every caller for the full timeout and retry sequence.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import CardinityError, CircuitOpenError, ServerError
+from .utils import endpoint_family
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_WINDOW_SIZE = 20
+DEFAULT_MINIMUM_CALLS = 10
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_SLOW_CALL_DURATION = 10.0
+DEFAULT_SLOW_CALL_RATE = 0.8
+DEFAULT_OPEN_DURATION = 30.0
+DEFAULT_HALF_OPEN_CALLS = 3
+
+#: Listener called with (family, old_state, new_state) on every transition
+StateListener = Callable[[str, str, str], None]
+
+
+def is_failure(error: BaseException) -> bool:
+    """Check whether an error means the API is unhealthy.
+
+    Server errors and transport failures (raised by the HTTP library itself)
+    count as failures. Other SDK errors, such as 4xx responses or rate
+    limiting, mean the API is up and answering.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        bool: True if the error counts against the circuit
+    """
+    return isinstance(error, ServerError) or not isinstance(error, CardinityError)
+
+
+class _Circuit:
+    """State of the circuit of one endpoint family."""
+
+    __slots__ = ("state", "outcomes", "opened_at", "trials", "trial_successes")
+
+    def __init__(self, window_size: int) -> None:
+        self.state = STATE_CLOSED
+        # Recent (failed, slow) outcomes while closed
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.trials = 0
+        self.trial_successes = 0
+
+
+class CircuitBreaker:
+    """Circuit breaker with one circuit per endpoint family.
+
+    Each circuit starts closed and records the outcome of the last
+    ``window_size`` requests. Once at least ``minimum_calls`` were recorded
+    and the share of failures reaches ``failure_rate_threshold``, or the
+    share of requests slower than ``slow_call_duration`` reaches
+    ``slow_call_rate_threshold``, the circuit opens: requests are rejected
+    immediately with CircuitOpenError, without being sent.
+
+    After ``open_duration`` seconds the circuit becomes half-open and lets
+    ``half_open_calls`` trial requests through. If they all succeed in time
+    the circuit closes again; any failed or slow trial opens it again.
+
+    One breaker can be shared by several clients and threads in a process.
+    State-change listeners are called in the thread that caused the change,
+    after the breaker's lock is released, so they may shed load or record
+    metrics but should return quickly.
+    """
+
+    def __init__(
+        self,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        minimum_calls: int = DEFAULT_MINIMUM_CALLS,
+        failure_rate_threshold: float = DEFAULT_FAILURE_RATE,
+        slow_call_duration: float = DEFAULT_SLOW_CALL_DURATION,
+        slow_call_rate_threshold: float = DEFAULT_SLOW_CALL_RATE,
+        open_duration: float = DEFAULT_OPEN_DURATION,
+        half_open_calls: int = DEFAULT_HALF_OPEN_CALLS,
+        on_state_change: Optional[StateListener] = None,
+        failure_predicate: Callable[[BaseException], bool] = is_failure,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            window_size: Number of recent requests the rates are computed on
+            minimum_calls: Requests recorded before the circuit may open
+            failure_rate_threshold: Share of failed requests (0-1) opening
+                the circuit
+            slow_call_duration: Seconds after which a request counts as slow
+            slow_call_rate_threshold: Share of slow requests (0-1) opening
+                the circuit
+            open_duration: Seconds the circuit stays open before trial
+                requests are let through
+            half_open_calls: Number of successful trial requests needed to
+                close the circuit
+            on_state_change: Listener called with (family, old_state,
+                new_state) on every state change
+            failure_predicate: Function deciding whether an exception counts
+                as a failure
+            clock: Monotonic clock
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if window_size < 1 or not 1 <= minimum_calls <= window_size:
+            raise ValueError("minimum_calls must be between 1 and window_size")
+        for name, rate in (
+            ("failure_rate_threshold", failure_rate_threshold),
+            ("slow_call_rate_threshold", slow_call_rate_threshold),
+        ):
+            if not 0 < rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if half_open_calls < 1:
+            raise ValueError("half_open_calls must be at least 1")
+
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.failure_predicate = failure_predicate
+        self.clock = clock
+        self._listeners: List[StateListener] = []
+        if on_state_change is not None:
+            self._listeners.append(on_state_change)
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Register a state-change listener.
+
+        Args:
+            listener: Callable receiving (family, old_state, new_state)
+        """
+        self._listeners.append(listener)
+
+    def _circuit(self, family: str) -> _Circuit:
+        """Return the circuit of a family, creating it closed (lock held)."""
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit(self.window_size)
+        return circuit
+
+    def _transition(self, circuit: _Circuit, state: str) -> str:
+        """Move a circuit to a new state (lock held).
+
+        Returns:
+            str: The previous state
+        """
+        previous = circuit.state
+        circuit.state = state
+        circuit.outcomes.clear()
+        circuit.trials = circuit.trial_successes = 0
+        if state == STATE_OPEN:
+            circuit.opened_at = self.clock()
+        return previous
+
+    def _notify(self, family: str, previous: str, state: str) -> None:
+        """Call the listeners about a state change (lock released)."""
+        for listener in list(self._listeners):
+            listener(family, previous, state)
+
+    def state(self, endpoint: str) -> str:
+        """Get the state of an endpoint family's circuit.
+
+        Args:
+            endpoint: API endpoint path or family name
+
+        Returns:
+            str: "closed", "open" or "half_open"
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint_family(endpoint))
+            return circuit.state if circuit is not None else STATE_CLOSED
+
+    def get_states(self) -> Dict[str, str]:
+        """Get the state of every circuit used so far.
+
+        Returns:
+            Dict[str, str]: Circuit state by endpoint family
+        """
+        with self._lock:
+            return {family: c.state for family, c in self._circuits.items()}
+
+    def _rejection(self, family: str, circuit: _Circuit) -> Optional[CircuitOpenError]:
+        """Return the error rejecting a request to a circuit, if any (lock held)."""
+        if circuit.state == STATE_OPEN:
+            remaining = circuit.opened_at + self.open_duration - self.clock()
+            if remaining > 0:
+                return CircuitOpenError(
+                    f"Circuit open for '{family}' requests",
+                    family=family,
+                    retry_after=remaining,
+                )
+        elif circuit.state == STATE_HALF_OPEN:
+            if circuit.trials + circuit.trial_successes >= self.half_open_calls:
+                return CircuitOpenError(
+                    f"Circuit half-open for '{family}' requests", family=family
+                )
+        return None
+
+    def check(self, endpoint: str) -> None:
+        """Fail fast if a request would be rejected, without admitting it.
+
+        Lets callers avoid queueing (e.g. for a rate limiter token) for a
+        request that cannot be sent anyway.
+
+        Args:
+            endpoint: API endpoint path
+
+        Raises:
+            CircuitOpenError: If the circuit currently rejects requests
+        """
+        family = endpoint_family(endpoint)
+        with self._lock:
+            circuit = self._circuits.get(family)
+            error = self._rejection(family, circuit) if circuit else None
+        if error is not None:
+            raise error
+
+    def allow(self, endpoint: str) -> None:
+        """Admit a request or reject it if its circuit is open.
+
+        Every admitted request must be reported with record() (call() does
+        this automatically).
+
+        Args:
+            endpoint: API endpoint path
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                trial requests already in flight
+        """
+        family = endpoint_family(endpoint)
+        changed = None
+        with self._lock:
+            circuit = self._circuit(family)
+            error = self._rejection(family, circuit)
+            if error is not None:
+                raise error
+            if circuit.state == STATE_OPEN:
+                changed = self._transition(circuit, STATE_HALF_OPEN)
+            if circuit.state == STATE_HALF_OPEN:
+                circuit.trials += 1
+        if changed is not None:
+            self._notify(family, changed, STATE_HALF_OPEN)
+
+    def record(self, endpoint: str, duration: float, failed: bool) -> None:
+        """Report the outcome of an admitted request.
+
+        Args:
+            endpoint: API endpoint path
+            duration: Seconds the request took
+            failed: Whether the request failed
+        """
+        family = endpoint_family(endpoint)
+        slow = duration >= self.slow_call_duration
+        changed = None
+        with self._lock:
+            circuit = self._circuit(family)
+            if circuit.state == STATE_HALF_OPEN:
+                circuit.trials = max(0, circuit.trials - 1)
+                if failed or slow:
+                    changed = (self._transition(circuit, STATE_OPEN), STATE_OPEN)
+                else:
+                    circuit.trial_successes += 1
+                    if circuit.trial_successes >= self.half_open_calls:
+                        changed = (
+                            self._transition(circuit, STATE_CLOSED),
+                            STATE_CLOSED,
+                        )
+            elif circuit.state == STATE_CLOSED:
+                circuit.outcomes.append((failed, slow))
+                if self._should_open(circuit):
+                    changed = (self._transition(circuit, STATE_OPEN), STATE_OPEN)
+            # Late outcomes of requests admitted before the circuit opened are
+            # ignored
+        if changed is not None:
+            self._notify(family, *changed)
+
+    def _should_open(self, circuit: _Circuit) -> bool:
+        """Check the failure and slow-call rates of a closed circuit."""
+        calls = len(circuit.outcomes)
+        if calls < self.minimum_calls:
+            return False
+        failures = sum(1 for failed, _ in circuit.outcomes if failed)
+        slow = sum(1 for _, is_slow in circuit.outcomes if is_slow)
+        return (
+            failures / calls >= self.failure_rate_threshold
+            or slow / calls >= self.slow_call_rate_threshold
+        )
+
+    def _release(self, endpoint: str) -> None:
+        """Give back an admitted request's slot without recording an outcome."""
+        with self._lock:
+            circuit = self._circuit(endpoint_family(endpoint))
+            if circuit.state == STATE_HALF_OPEN:
+                circuit.trials = max(0, circuit.trials - 1)
+
+    @contextmanager
+    def call(self, endpoint: str, admitted: bool = False) -> Iterator[None]:
+        """Guard a request with the circuit of its endpoint family.
+
+        The request is admitted (or rejected) on entry, timed, and its
+        outcome recorded on exit. Exceptions are classified with
+        ``failure_predicate`` and re-raised.
+
+        Args:
+            endpoint: API endpoint path
+            admitted: Whether the request was already admitted with allow()
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+        """
+        if not admitted:
+            self.allow(endpoint)
+        started = self.clock()
+        try:
+            yield
+        except Exception as e:
+            self.record(endpoint, self.clock() - started, self.failure_predicate(e))
+            raise
+        except BaseException:
+            # Cancelled or interrupted: neither a success nor a failure
+            self._release(endpoint)
+            raise
+        self.record(endpoint, self.clock() - started, False)
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """Close circuits and forget their history.
+
+        Args:
+            endpoint: API endpoint path whose circuit is reset, or None to
+                reset every circuit
+        """
+        changes = []
+        with self._lock:
+            if endpoint is None:
+                families = list(self._circuits)
+            else:
+                families = [endpoint_family(endpoint)]
+            for family in families:
+                circuit = self._circuit(family)
+                if circuit.state != STATE_CLOSED:
+                    changes.append((family, circuit.state))
+                self._transition(circuit, STATE_CLOSED)
+        for family, previous in changes:
+            self._notify(family, previous, STATE_CLOSED)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the breaker."""
+        return f"CircuitBreaker(states={self.get_states()})"
@@ -5,21 +5,153 @@ This module contains the HTTP client for making requests to the Cardinity API.
 """
 
 import time
-from typing import Any, Dict, Optional
+from contextlib import nullcontext
+from typing import Any, Dict, Optional, Sequence, Union
 from urllib.parse import urljoin
 
 from requests import Response, Session
-from requests.exceptions import ConnectionError, RequestException, Timeout
+from requests.exceptions import (
+    ConnectionError,
+    ConnectTimeout,
+    RequestException,
+    Timeout,
+)
+from urllib3.exceptions import NewConnectionError
 
 from .auth import CardinityAuth
+from .cache import ResponseCache
+from .circuit import CircuitBreaker
+from .coalesce import SingleFlight, request_key
+from .codec import JSONCodec, get_codec
 from .exceptions import (
     APIError,
     AuthenticationError,
     CardinityError,
+    CircuitOpenError,
+    DeadlineExceededError,
     NotFoundError,
     RateLimitError,
     ServerError,
 )
+from .hooks import RequestEvent, RequestHooks
+from .idempotency import (
+    IDEMPOTENCY_HEADER,
+    IdempotencyLedger,
+    derive_idempotency_key,
+)
+from .models.base import ReadOnlyModel
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .tracing import DISABLED, Tracing
+from .transport import (
+    DEFAULT_POOL_BLOCK,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    CardinityHTTPAdapter,
+    SocketOption,
+    keepalive_socket_options,
+)
+from .utils import endpoint_template, freeze
+
+
+def decode_response(codec: JSONCodec, response: Any) -> Any:
+    """Decode a response body with a JSON codec.
+
+    The raw body bytes are decoded directly, skipping the text decoding done
+    by the HTTP library. Responses without a bytes body fall back to the
+    library's own json() method.
+
+    Args:
+        codec: JSON codec
+        response: requests or httpx response
+
+    Returns:
+        Any: Decoded body
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    content = response.content
+    if isinstance(content, bytes):
+        return codec.loads(content)
+    return response.json()
+
+
+def extract_error_message(
+    response_data: Dict[str, Any], status_code: int, reason: Optional[str]
+) -> str:
+    """Extract an error message from parsed API response data.
+
+    Args:
+        response_data: Parsed response data
+        status_code: HTTP status code of the response
+        reason: HTTP reason phrase of the response
+
+    Returns:
+        str: Error message
+    """
+    # Try different common error message fields
+    for field in ["message", "error", "detail", "error_description"]:
+        if field in response_data and response_data[field]:
+            return str(response_data[field])
+
+    # Fall back to generic HTTP status message
+    return f"HTTP {status_code}: {reason}"
+
+
+def raise_for_status(
+    status_code: int,
+    error_message: str,
+    response_data: Dict[str, Any],
+    retry_after: Optional[float] = None,
+) -> None:
+    """Raise the SDK exception matching an HTTP error status code.
+
+    Shared by the synchronous and asynchronous clients so both map API
+    errors onto the same exception hierarchy.
+
+    Args:
+        status_code: HTTP status code of the error response
+        error_message: Error message extracted from the response
+        response_data: Parsed response data
+        retry_after: Seconds from the response's Retry-After header, if any
+
+    Raises:
+        AuthenticationError: On 401 responses
+        NotFoundError: On 404 responses
+        RateLimitError: On 429 responses
+        ServerError: On 5xx responses
+        APIError: On any other error response
+    """
+    if status_code == 401:
+        raise AuthenticationError(error_message)
+    elif status_code == 404:
+        raise NotFoundError(error_message)
+    elif status_code == 429:
+        raise RateLimitError(error_message, retry_after=retry_after)
+    elif status_code >= 500:
+        raise ServerError(error_message, status_code, retry_after=retry_after)
+    else:
+        raise APIError(
+            message=error_message,
+            status_code=status_code,
+            response_data=response_data,
+        )
+
+
+def _request_sent(error: RequestException) -> bool:
+    """Check whether a failed request may have reached the server.
+
+    Args:
+        error: Exception raised by requests
+
+    Returns:
+        bool: False only if the connection could not be established
+    """
+    if isinstance(error, ConnectTimeout):
+        return False
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return not isinstance(reason, NewConnectionError)
 
 
 class CardinityClient:
@@ -41,22 +173,116 @@ class CardinityClient:
         base_url: str = BASE_URL,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = MAX_RETRIES,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_reads: bool = True,
+        json_codec: Union[str, JSONCodec, None] = None,
+        idempotency_ledger: Optional[IdempotencyLedger] = None,
+        derive_idempotency_keys: bool = False,
+        hooks: Optional[RequestHooks] = None,
+        tracing: Optional[Tracing] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOL_BLOCK,
+        tcp_keepalive: bool = False,
+        socket_options: Optional[Sequence[SocketOption]] = None,
     ) -> None:
         """Initialize the Cardinity HTTP client.
 
         Args:
             auth: CardinityAuth instance for authentication
             base_url: Base URL for the Cardinity API
-            timeout: Request timeout in seconds
+            timeout: Default connect and read timeout of each attempt, in
+                seconds
             max_retries: Maximum number of retries for failed requests
+            retry_policy: Policy deciding which failures are retried and how
+                long to wait; defaults to a RetryPolicy with max_retries
+                retries and jittered exponential backoff from RETRY_DELAY
+            rate_limiter: Optional client-side rate limiter spacing out
+                requests per endpoint family; may be shared between clients
+            circuit_breaker: Optional circuit breaker failing requests fast
+                while their endpoint family keeps failing; may be shared
+                between clients
+            response_cache: Optional cache serving repeated lookups of
+                read-only models (get_payment, get_refund, ...) locally
+            coalesce_reads: Share one API call between concurrent identical
+                GET requests (same endpoint and parameters)
+            json_codec: JSON codec, or name of one ("orjson", "msgspec",
+                "ujson", "json"); defaults to the fastest one installed
+            idempotency_ledger: Optional ledger answering a repeated POST
+                with the same idempotency key (explicit or derived) with the
+                original response; may be shared between clients
+            derive_idempotency_keys: Give POSTs without an explicit
+                idempotency key one derived from their order_id and payload
+                (see derive_idempotency_key())
+            hooks: Optional instrumentation hooks called at each stage of
+                every request (see RequestHooks); handlers can also be added
+                later through the client's hooks attribute
+            tracing: Optional OpenTelemetry tracing of the SDK operations and
+                their HTTP attempts; requests then carry trace context headers
+            connect_timeout: Seconds to wait for a connection to be
+                established (defaults to timeout)
+            read_timeout: Seconds to wait for the server to send data
+                (defaults to timeout)
+            deadline: Default limit in seconds on the total time of a call,
+                across all its attempts and the waits between them; each
+                attempt's timeouts are shortened to the time left (None for
+                no limit, see _request())
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept open per host;
+                raise it to at least the number of threads sharing the client
+            pool_block: Wait for a free pooled connection when all are in use,
+                instead of opening an extra one that is discarded afterwards
+            tcp_keepalive: Enable TCP keep-alive probes on pooled connections
+            socket_options: Extra socket options (level, option, value) set on
+                every new connection
         """
         self.auth = auth
         self.base_url = base_url
         self.timeout = timeout
+        self.connect_timeout = (
+            connect_timeout if connect_timeout is not None else timeout
+        )
+        self.read_timeout = read_timeout if read_timeout is not None else timeout
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        self.deadline = deadline
         self.max_retries = max_retries
-
-        # Create a persistent session for connection reuse
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries, backoff_base=self.RETRY_DELAY
+        )
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.response_cache = response_cache
+        self.codec = (
+            json_codec if isinstance(json_codec, JSONCodec) else get_codec(json_codec)
+        )
+        self.single_flight = SingleFlight() if coalesce_reads else None
+        self.idempotency_ledger = idempotency_ledger
+        self.derive_idempotency_keys = derive_idempotency_keys
+        # Concurrent submissions of one idempotent operation share one call
+        self._idempotent_flight = SingleFlight()
+        self.hooks = hooks if hooks is not None else RequestHooks()
+        self.tracing = tracing if tracing is not None and tracing.enabled else None
+
+        if tcp_keepalive:
+            socket_options = keepalive_socket_options() + list(socket_options or [])
+
+        # Create a persistent session for connection reuse, over a sized pool
+        self.adapter = CardinityHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            socket_options=socket_options,
+        )
         self.session = Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
         self.session.headers.update(
             {
                 "Accept": "application/json",
@@ -65,32 +291,6 @@ class CardinityClient:
             }
         )
 
-    def _should_retry(
-        self, response: Optional[Response], exception: Optional[Exception]
-    ) -> bool:
-        """Determine if a request should be retried.
-
-        Args:
-            response: HTTP response object (if available)
-            exception: Exception that occurred (if any)
-
-        Returns:
-            bool: True if the request should be retried
-        """
-        # Retry on connection errors or timeouts
-        if isinstance(exception, (ConnectionError, Timeout)):
-            return True
-
-        # Retry on server errors (5xx) but not client errors (4xx)
-        if response and response.status_code >= 500:
-            return True
-
-        # Retry on rate limiting with exponential backoff
-        if response and response.status_code == 429:
-            return True
-
-        return False
-
     def _build_url(self, endpoint: str) -> str:
         """Build the full URL for an API endpoint.
 
@@ -118,7 +318,7 @@ class CardinityClient:
             APIError: If the response indicates an error
         """
         try:
-            response_data = response.json()
+            response_data = decode_response(self.codec, response)
         except ValueError:
             # Handle non-JSON responses
             response_data = {"error": "Invalid JSON response", "content": response.text}
@@ -126,21 +326,12 @@ class CardinityClient:
         # Check for HTTP errors
         if not response.ok:
             error_message = self._extract_error_message(response_data, response)
-
-            if response.status_code == 401:
-                raise AuthenticationError(error_message)
-            elif response.status_code == 404:
-                raise NotFoundError(error_message)
-            elif response.status_code == 429:
-                raise RateLimitError(error_message)
-            elif response.status_code >= 500:
-                raise ServerError(error_message)
-            else:
-                raise APIError(
-                    message=error_message,
-                    status_code=response.status_code,
-                    response_data=response_data,
-                )
+            raise_for_status(
+                response.status_code,
+                error_message,
+                response_data,
+                parse_retry_after(response.headers.get("Retry-After")),
+            )
 
         return response_data
 
@@ -156,13 +347,9 @@ class CardinityClient:
         Returns:
             str: Error message
         """
-        # Try different common error message fields
-        for field in ["message", "error", "detail", "error_description"]:
-            if field in response_data and response_data[field]:
-                return str(response_data[field])
-
-        # Fall back to generic HTTP status message
-        return f"HTTP {response.status_code}: {response.reason}"
+        return extract_error_message(
+            response_data, response.status_code, response.reason
+        )
 
     def _request(
         self,
@@ -170,113 +357,362 @@ class CardinityClient:
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
-        retry_count: int = 0,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make an HTTP request to the Cardinity API.
 
+        Failed attempts are retried as decided by the client's retry policy.
+        The request is reported to the client's hooks if any handler is
+        registered, and traced if the client has tracing enabled.
+
+        With a deadline, the request fails with DeadlineExceededError instead
+        of waiting for a rate limiter slot or a retry that would start after
+        the deadline, and each attempt's connect and read timeouts are
+        shortened to the time left. The read timeout bounds each wait for
+        data from the server, not the download of the whole response.
+
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE)
             endpoint: API endpoint path
             data: Request payload data (for POST/PATCH requests)
             params: URL query parameters
-            retry_count: Current retry attempt number
+            idempotency_key: Key sent in the Idempotency-Key header of every
+                attempt
+            deadline: Seconds the request may take in total (defaults to the
+                client's deadline)
 
         Returns:
             Dict[str, Any]: Parsed API response data
 
         Raises:
             CardinityError: If the request fails after all retries
+            CircuitOpenError: If the circuit breaker rejects the request
+            DeadlineExceededError: If the deadline expires first
         """
-        url = self._build_url(endpoint)
+        if deadline is None:
+            deadline = self.deadline
+        hooks = self.hooks
+        if not hooks and self.tracing is None:
+            return self._send(method, endpoint, data, params, idempotency_key, deadline)
 
+        event = hooks.start(method.upper(), endpoint, self._build_url(endpoint))
         try:
-            response = self.session.request(
-                method=method.upper(),
-                url=url,
-                json=data,
-                params=params,
-                auth=self.auth.get_auth(),
-                timeout=self.timeout,
+            result = self._send(
+                method, endpoint, data, params, idempotency_key, deadline, event
             )
+        except BaseException as e:
+            hooks.complete(event, e)
+            raise
+        hooks.complete(event)
+        return result
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        idempotency_key: Optional[str],
+        deadline: Optional[float] = None,
+        event: Optional[RequestEvent] = None,
+    ) -> Dict[str, Any]:
+        """Send a request, retrying failed attempts.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            data: Request payload data
+            params: URL query parameters
+            idempotency_key: Key sent in the Idempotency-Key header
+            deadline: Seconds the request may take in total
+            event: Event reporting the attempts to the hooks, if instrumented
 
-            return self._parse_response(response)
+        Returns:
+            Dict[str, Any]: Parsed API response data
+        """
+        method = method.upper()
+        # Serialized once, not on every retry
+        body = self.codec.dumps(data) if data is not None else None
+        request_args: Dict[str, Any] = {
+            "method": method,
+            "url": self._build_url(endpoint),
+            "data": body,
+            "params": params,
+            "headers": (
+                {IDEMPOTENCY_HEADER: idempotency_key} if idempotency_key else None
+            ),
+            "auth": self.auth,
+            "timeout": (self.connect_timeout, self.read_timeout),
+        }
+        hooks = self.hooks
+        policy = self.retry_policy
+        state = policy.start(method, idempotency_key, deadline)
+        limiter = self.rate_limiter
+        breaker = self.circuit_breaker
+
+        while True:
+            if breaker is not None:
+                # Fail fast before queueing for a rate limiter token
+                breaker.check(endpoint)
+            if limiter is not None:
+                wait = limiter.reserve(endpoint)
+                if wait > 0:
+                    try:
+                        policy.time_left(state, wait)
+                    except DeadlineExceededError:
+                        # The request will not be sent; free its slot
+                        limiter.release(endpoint)
+                        raise
+                    limiter.sleep(wait)
+            left = policy.time_left(state)
+            if left is not None:
+                request_args["timeout"] = (
+                    min(self.connect_timeout, left),
+                    min(self.read_timeout, left),
+                )
+            if breaker is not None:
+                try:
+                    breaker.allow(endpoint)
+                except CircuitOpenError:
+                    # The circuit opened while waiting for the token
+                    if limiter is not None:
+                        limiter.release(endpoint)
+                    raise
+            try:
+                with (
+                    breaker.call(endpoint, admitted=True) if breaker else nullcontext()
+                ):
+                    if event is None:
+                        response = self.session.request(**request_args)
+                        result = self._parse_response(response)
+                    else:
+                        result = self._send_traced(event, request_args)
+                if limiter is not None:
+                    limiter.on_success(endpoint)
+                return result
+
+            except (ConnectionError, Timeout) as e:
+                if event is not None:
+                    hooks.error(event, e)
+                delay = policy.next_delay(state, e, request_sent=_request_sent(e))
+                if delay is None:
+                    raise CardinityError(f"Request failed: {str(e)}")
+                policy.time_left(state, delay, cause=e)
+
+            except RequestException as e:
+                if event is not None:
+                    hooks.error(event, e)
+                raise CardinityError(f"Request failed: {str(e)}")
+
+            except (RateLimitError, ServerError) as e:
+                if event is not None:
+                    hooks.error(event, e)
+                if limiter is not None and isinstance(e, RateLimitError):
+                    # Slow the endpoint family down instead of adding load
+                    limiter.on_rate_limited(endpoint, e.retry_after)
+                delay = policy.next_delay(state, e)
+                if delay is None:
+                    raise
+                policy.time_left(state, delay, cause=e)
+
+            except APIError as e:
+                if event is not None:
+                    hooks.error(event, e)
+                raise
+
+            if event is not None:
+                hooks.retry(event, delay)
+            policy.sleep(delay)
+
+    def _send_traced(
+        self, event: RequestEvent, request_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Send one attempt of a request, timing its phases for the hooks.
 
-        except (ConnectionError, Timeout, RequestException) as e:
-            if retry_count < self.max_retries and self._should_retry(None, e):
-                retry_count += 1
-                delay = self.RETRY_DELAY * (
-                    2 ** (retry_count - 1)
-                )  # Exponential backoff
-                time.sleep(delay)
-                return self._request(method, endpoint, data, params, retry_count)
+        With tracing, the attempt is traced as a client span with child spans
+        for signing and parsing, and its trace context is sent in the request
+        headers.
 
-            raise CardinityError(f"Request failed: {str(e)}")
+        Args:
+            event: Event of the request
+            request_args: Arguments of Session.request()
 
-        except (RateLimitError, ServerError) as e:
-            if retry_count < self.max_retries:
-                retry_count += 1
-                delay = self.RETRY_DELAY * (
-                    2 ** (retry_count - 1)
-                )  # Exponential backoff
-                time.sleep(delay)
-                return self._request(method, endpoint, data, params, retry_count)
+        Returns:
+            Dict[str, Any]: Parsed API response data
+        """
+        hooks = self.hooks
+        tracing = self.tracing or DISABLED
+        auth = self.auth
+        hooks.attempt(event)
+
+        def sign(request: Any) -> Any:
+            start = time.monotonic()
+            with tracing.span("CardinityAuth.sign"):
+                signed = auth(request)
+            hooks.signed(event, time.monotonic() - start)
+            return signed
+
+        attributes: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.full": event.url,
+        }
+        if event.attempt > 1:
+            attributes["http.request.resend_count"] = event.attempt - 1
+        name = f"{event.method} {endpoint_template(event.endpoint)}"
+        with tracing.span(name, attributes, client=True) as span:
+            headers = dict(request_args["headers"] or {})
+            tracing.inject(headers, span)
+            start = time.monotonic()
+            response = self.session.request(
+                **{**request_args, "headers": headers or None, "auth": sign}
+            )
+            total = time.monotonic() - start
+            # requests times the exchange up to the response headers
+            send = response.elapsed.total_seconds()
+            event.phases["send"] = send
+            event.phases["read"] = max(
+                total - send - event.phases.get("sign", 0.0), 0.0
+            )
+            body = request_args["data"]
+            hooks.response(
+                event,
+                response.status_code,
+                len(body) if body else 0,
+                len(response.content),
+            )
+            if span is not None:
+                span.set_attribute("http.response.status_code", response.status_code)
 
-            raise e
+            start = time.monotonic()
+            try:
+                with tracing.span("Response.parse"):
+                    return self._parse_response(response)
+            finally:
+                event.phases["parse"] = time.monotonic() - start
 
     def get(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Make a GET request to the API.
 
+        Identical GET requests made concurrently share one API call unless
+        coalescing was disabled; the call runs with the deadline of the
+        request that started it.
+
         Args:
             endpoint: API endpoint path
             params: URL query parameters
+            deadline: Seconds the request may take in total (optional)
 
         Returns:
             Dict[str, Any]: API response data
         """
-        return self._request("GET", endpoint, params=params)
+        if self.single_flight is None:
+            return self._request("GET", endpoint, params=params, deadline=deadline)
+        return self.single_flight.do(
+            request_key("GET", endpoint, params),
+            lambda: self._request("GET", endpoint, params=params, deadline=deadline),
+        )
 
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Make a POST request to the API.
 
+        A POST carries an idempotency key, the same for all its retries, when
+        one is given or, if the client derives keys, when its payload has an
+        order_id. With an idempotency ledger, repeating a key returns the
+        recorded response instead of calling the API again.
+
         Args:
             endpoint: API endpoint path
             data: Request payload data
+            idempotency_key: Key identifying the operation (optional)
+            deadline: Seconds the request may take in total (optional)
 
         Returns:
             Dict[str, Any]: API response data
+
+        Raises:
+            IdempotencyError: If the key was already used with another payload
         """
-        return self._request("POST", endpoint, data=data)
+        key = idempotency_key
+        if key is None and self.derive_idempotency_keys:
+            key = derive_idempotency_key(endpoint, data)
+        ledger = self.idempotency_ledger
+        if ledger is None or key is None:
+            return self._request(
+                "POST",
+                endpoint,
+                data=data,
+                idempotency_key=key,
+                deadline=deadline,
+            )
+
+        def submit() -> Dict[str, Any]:
+            recorded = ledger.get(key, data)
+            if recorded is not None:
+                return recorded
+            response = self._request(
+                "POST", endpoint, data=data, idempotency_key=key, deadline=deadline
+            )
+            ledger.record(key, data, response)
+            return response
 
-    def patch(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        return self._idempotent_flight.do((key, freeze(data)), submit)
+
+    def patch(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Make a PATCH request to the API.
 
         Args:
             endpoint: API endpoint path
             data: Request payload data
+            deadline: Seconds the request may take in total (optional)
 
         Returns:
             Dict[str, Any]: API response data
         """
-        return self._request("PATCH", endpoint, data=data)
+        return self._request("PATCH", endpoint, data=data, deadline=deadline)
 
-    def delete(self, endpoint: str) -> Dict[str, Any]:
+    def delete(self, endpoint: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """Make a DELETE request to the API.
 
         Args:
             endpoint: API endpoint path
+            deadline: Seconds the request may take in total (optional)
 
         Returns:
             Dict[str, Any]: API response data
         """
-        return self._request("DELETE", endpoint)
+        return self._request("DELETE", endpoint, deadline=deadline)
 
-    def execute_request(self, model) -> Dict[str, Any]:
+    def execute_request(
+        self,
+        model,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Execute a request using a model object.
 
         Args:
             model: Model object with get_method(), get_endpoint(), and to_dict() methods
+            idempotency_key: Idempotency key of a POST request (optional, see
+                post())
+            deadline: Seconds the request may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Parsed API response data
@@ -286,17 +722,45 @@ class CardinityClient:
         """
         method = model.get_method().upper()
         endpoint = model.get_endpoint()
+        cache = self.response_cache
 
         if method == "GET":
-            return self.get(endpoint)
-        elif method == "POST":
-            return self.post(endpoint, model.to_dict())
-        elif method == "PATCH":
-            return self.patch(endpoint, model.to_dict())
-        elif method == "DELETE":
-            return self.delete(endpoint)
-        else:
+            if cache is None or not isinstance(model, ReadOnlyModel):
+                return self.get(endpoint, deadline=deadline)
+            cached = cache.get(endpoint)
+            if cached is not None:
+                return cached
+            response = self.get(endpoint, deadline=deadline)
+            cache.set(endpoint, response)
+            return response
+
+        if method not in ("POST", "PATCH", "DELETE"):
             raise ValueError(f"Unsupported HTTP method: {method}")
+        if cache is not None:
+            # The written resource (and its parent payment) changes
+            cache.invalidate(endpoint)
+        try:
+            if method == "POST":
+                return self.post(endpoint, model.to_dict(), idempotency_key, deadline)
+            elif method == "PATCH":
+                return self.patch(endpoint, model.to_dict(), deadline)
+            else:
+                return self.delete(endpoint, deadline)
+        finally:
+            if cache is not None:
+                # A GET running alongside the write may have cached the old
+                # state; drop it again, even if the write failed midway
+                cache.invalidate(endpoint)
+
+    def get_pool_stats(self) -> Dict[str, int]:
+        """Get connection pool occupancy statistics.
+
+        Returns:
+            Dict[str, int]: Number of connections in use, idle in the pool,
+                created since the client was built, and discarded because
+                the pool was full when they were returned
+        """
+        return self.adapter.stats.snapshot()
 
     def close(self) -> None:
         """Close the HTTP session and clean up resources."""
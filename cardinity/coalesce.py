@@ -0,0 +1,209 @@
+"""
+Cardinity Request Coalescing
+
+This module implements single-flight coalescing: concurrent identical read
+requests share one upstream call and one parsed result instead of each
+hitting the API.
+"""
+
+import asyncio
+import copy
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+#: Identifies identical requests: (method, endpoint, sorted query parameters)
+RequestKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def request_key(
+    method: str, endpoint: str, params: Optional[Mapping[str, Any]] = None
+) -> RequestKey:
+    """Build the key under which identical requests are coalesced.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint path
+        params: URL query parameters
+
+    Returns:
+        RequestKey: Hashable key, equal for requests with the same method,
+            endpoint and parameters (in any order)
+    """
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return (method.upper(), endpoint, items)
+
+
+class _Call:
+    """A call in flight and the callers waiting for it."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key across threads.
+
+    The first caller for a key (the leader) runs the call; callers arriving
+    while it is in flight wait for it and receive the same outcome, either
+    the result or the exception. Once the call completes the key is
+    forgotten, so later callers trigger a new call. Nothing is cached.
+
+    When a result is shared, every caller gets its own deep copy, so callers
+    may modify what they receive.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run ``fn`` unless an identical call is already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Function performing the call
+
+        Returns:
+            Any: Result of the call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            call.done.set()
+        # Waiters copy the stored result, so the leader must not hand it out
+        return copy.deepcopy(call.result) if shared else call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Get the coalescing counters.
+
+        Returns:
+            Dict[str, int]: Calls made, callers that shared another caller's
+                call, and calls currently in flight
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "shared": self.shared,
+                "in_flight": len(self._calls),
+            }
+
+
+class _AsyncCall:
+    """A coroutine call in flight and the number of callers sharing it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+def _retrieve_exception(task: "asyncio.Future[Any]") -> None:
+    """Mark a shared call's exception as retrieved.
+
+    When every caller was cancelled, nobody awaits the shielded task and
+    asyncio would log its exception as never retrieved.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent coroutine calls with the same key.
+
+    The call runs as a task shared by every caller awaiting the key.
+    Cancelling one caller does not cancel the shared call for the others.
+    Must be used from a single event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: Dict[Hashable, _AsyncCall] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``fn()`` unless an identical call is already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Coroutine function performing the call
+
+        Returns:
+            Any: Result of the call (a deep copy when shared)
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        call = self._calls.get(key)
+        leader = call is None
+        if call is None:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(fn()))
+            # Registered first, so the key is released before callers resume
+            call.task.add_done_callback(lambda _: self._calls.pop(key, None))
+            call.task.add_done_callback(_retrieve_exception)
+            self.calls += 1
+        else:
+            call.waiters += 1
+            self.shared += 1
+
+        result = await asyncio.shield(call.task)
+        if leader and call.waiters == 0:
+            return result
+        return copy.deepcopy(result)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the coalescing counters.
+
+        Returns:
+            Dict[str, int]: Calls made, callers that shared another caller's
+                call, and calls currently in flight
+        """
+        return {
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": len(self._calls),
+        }
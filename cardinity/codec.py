@@ -0,0 +1,160 @@
+"""
+Cardinity JSON Codecs
+
+This module contains the JSON codecs used by the HTTP clients to encode
+request bodies and decode responses. Faster third-party JSON libraries
+(orjson, msgspec or ujson) are used when installed, with the standard
+library json module as fallback.
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - exercised only without ujson
+    ujson = None  # type: ignore[assignment]
+
+
+class JSONCodec:
+    """Codec based on the standard library json module.
+
+    Subclasses wrap faster JSON libraries. All codecs encode to compact UTF-8
+    bytes and decode from bytes, so responses are decoded without building an
+    intermediate string.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to JSON.
+
+        Args:
+            obj: JSON-serializable object
+
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON.
+
+        Args:
+            data: UTF-8 encoded JSON
+
+        Returns:
+            Any: Decoded object
+
+        Raises:
+            ValueError: If the data is not valid JSON
+        """
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the codec."""
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec based on orjson."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to JSON with orjson."""
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON with orjson (its errors subclass ValueError)."""
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec based on msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Create reusable msgspec encoder and decoder."""
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to JSON with msgspec."""
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON with msgspec."""
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+class UjsonCodec(JSONCodec):
+    """Codec based on ujson."""
+
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to JSON with ujson."""
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON with ujson (its errors subclass ValueError)."""
+        return ujson.loads(data)
+
+
+# Codecs in order of preference, with the module each one needs
+_CODECS: Dict[str, Tuple[Callable[[], JSONCodec], Any]] = {
+    "orjson": (OrjsonCodec, orjson),
+    "msgspec": (MsgspecCodec, msgspec),
+    "ujson": (UjsonCodec, ujson),
+    "json": (JSONCodec, json),
+}
+
+
+def available_codecs() -> Tuple[str, ...]:
+    """List the codecs usable in this environment, fastest first.
+
+    Returns:
+        Tuple[str, ...]: Codec names
+    """
+    return tuple(name for name, (_, module) in _CODECS.items() if module is not None)
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Create a JSON codec.
+
+    Args:
+        name: "orjson", "msgspec", "ujson" or "json", or None for the fastest
+            one installed
+
+    Returns:
+        JSONCodec: Codec instance
+
+    Raises:
+        ValueError: If the codec is unknown
+        ImportError: If the codec's library is not installed
+    """
+    if name is None:
+        name = available_codecs()[0]
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec: {name}")
+    factory, module = _CODECS[name]
+    if module is None:
+        raise ImportError(f"The {name} package is required for the {name} codec")
+    return factory()
@@ -126,13 +126,18 @@ class RateLimitError(APIError):
     indicating that the rate limit has been exceeded.
     """
 
-    def __init__(self, message: str = "Rate limit exceeded") -> None:
+    def __init__(
+        self, message: str = "Rate limit exceeded", retry_after: Optional[float] = None
+    ) -> None:
         """Initialize the RateLimitError.
 
         Args:
             message: The error message
+            retry_after: Seconds to wait before retrying, from the Retry-After
+                header (if sent)
         """
         super().__init__(message, status_code=429)
+        self.retry_after = retry_after
 
 
 class ServerError(APIError):
@@ -142,10 +147,89 @@ class ServerError(APIError):
     indicating that there's an issue on the server side.
     """
 
-    def __init__(self, message: str = "Internal server error") -> None:
+    def __init__(
+        self,
+        message: str = "Internal server error",
+        status_code: int = 500,
+        retry_after: Optional[float] = None,
+    ) -> None:
         """Initialize the ServerError.
 
         Args:
             message: The error message
+            status_code: HTTP status code of the error response
+            retry_after: Seconds to wait before retrying, from the Retry-After
+                header (if sent)
+        """
+        super().__init__(message, status_code=status_code)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(CardinityError):
+    """Exception raised when a request is rejected by an open circuit breaker.
+
+    The request was never sent: recent requests to the same endpoint family
+    failed or were too slow, so new ones fail fast until the circuit lets a
+    trial request through again.
+    """
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        family: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """Initialize the CircuitOpenError.
+
+        Args:
+            message: The error message
+            family: Endpoint family whose circuit is open
+            retry_after: Seconds until the circuit allows a trial request, if
+                known
+        """
+        super().__init__(message)
+        self.family = family
+        self.retry_after = retry_after
+
+
+class IdempotencyError(CardinityError):
+    """Exception raised when an idempotency key is reused for another request.
+
+    The key identifies one operation (e.g. one payment for an order), so
+    submitting it again with a different payload is rejected locally instead
+    of being answered with the response of the original request.
+    """
+
+    def __init__(self, message: str, key: Optional[str] = None) -> None:
+        """Initialize the IdempotencyError.
+
+        Args:
+            message: The error message
+            key: The reused idempotency key
         """
-        super().__init__(message, status_code=500)
+        super().__init__(message)
+        self.key = key
+
+
+class DeadlineExceededError(CardinityError):
+    """Exception raised when a call runs out of its deadline.
+
+    The deadline caps the total time of a call across all its attempts and
+    the waits between them. When it is raised after a failed attempt, that
+    attempt's error is the ``__cause__``; a POST that timed out may still
+    have been processed by the API.
+    """
+
+    def __init__(
+        self,
+        message: str = "Deadline exceeded",
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Initialize the DeadlineExceededError.
+
+        Args:
+            message: The error message
+            deadline: Deadline of the call in seconds
+        """
+        super().__init__(message)
+        self.deadline = deadline
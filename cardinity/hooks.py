@@ -0,0 +1,325 @@
+"""
+Cardinity Request Hooks
+
+This module contains the instrumentation hooks of the HTTP clients. Handlers
+registered on a RequestHooks instance are called at each stage of a request
+(start, signing, response, retry, error and completion) with a RequestEvent
+carrying the endpoint, method, attempt, status code and monotonic timings of
+each phase, so applications can see where the time of a request goes.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+REQUEST_START = "on_request_start"
+SIGNED = "on_signed"
+RESPONSE = "on_response"
+RETRY = "on_retry"
+ERROR = "on_error"
+COMPLETE = "on_complete"
+
+#: Hook names, in the order they are called during a request
+EVENTS = (REQUEST_START, SIGNED, RESPONSE, RETRY, ERROR, COMPLETE)
+
+#: Handler called with the RequestEvent of a request
+Handler = Callable[["RequestEvent"], None]
+
+
+class RequestEvent:
+    """State of one logical request, passed to every hook handler.
+
+    One event follows a request through all its attempts; per-attempt fields
+    (status_code, error, phases) are reset when an attempt starts. Handlers
+    that keep data beyond the call should copy it, e.g. with to_dict().
+
+    Attributes:
+        method: HTTP method
+        endpoint: API endpoint path (e.g. ``/payments``)
+        url: Full request URL, without query parameters
+        attempt: Number of the current attempt, from 1 (0 before the first)
+        status_code: HTTP status of the current attempt's response, if any
+        error: Exception of the failed attempt (on_error, on_retry) or of
+            the failed request (on_complete)
+        retry_delay: Seconds waited before the next attempt (on_retry)
+        started: time.monotonic() when the request started
+        attempt_started: time.monotonic() when the current attempt started
+        elapsed: Seconds from the start to the completion of the request
+            (on_complete)
+        request_size: Bytes of the request body sent by the current attempt
+        response_size: Bytes of the response body of the current attempt
+        phases: Seconds spent in each phase of the current attempt: ``sign``
+            (OAuth signing), ``send`` (from sending the request to receiving
+            the response headers, including connection acquisition, TLS
+            handshakes of new connections and server time; with the async
+            client the body download too), ``read`` (downloading the body,
+            sync client only) and ``parse`` (decoding the response)
+    """
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "url",
+        "attempt",
+        "status_code",
+        "error",
+        "retry_delay",
+        "started",
+        "attempt_started",
+        "elapsed",
+        "request_size",
+        "response_size",
+        "phases",
+    )
+
+    def __init__(self, method: str, endpoint: str, url: str) -> None:
+        """Initialize the event of a request that starts now.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            url: Full request URL; its query string is dropped
+        """
+        self.method = method
+        self.endpoint = endpoint
+        # Query strings (e.g. pagination cursors) would make every URL unique
+        self.url = urlsplit(url)._replace(query="").geturl() if "?" in url else url
+        self.attempt = 0
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.retry_delay: Optional[float] = None
+        self.started = time.monotonic()
+        self.attempt_started = self.started
+        self.elapsed: Optional[float] = None
+        self.request_size = 0
+        self.response_size = 0
+        self.phases: Dict[str, float] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a snapshot of the event.
+
+        Returns:
+            Dict[str, Any]: Event fields, with a copy of the phase timings
+        """
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["phases"] = dict(self.phases)
+        return data
+
+    def __repr__(self) -> str:
+        """Return a string representation of the event."""
+        return (
+            f"RequestEvent(method='{self.method}', endpoint='{self.endpoint}', "
+            f"attempt={self.attempt}, status_code={self.status_code})"
+        )
+
+
+class RequestHooks:
+    """Registry of request hook handlers.
+
+    Hooks are called in the thread (or task) making the request:
+
+    * ``on_request_start``: once, before the first attempt
+    * ``on_signed``: after the OAuth signature of each attempt
+    * ``on_response``: when each attempt receives a response, before it is
+      parsed (status_code and the body sizes are set)
+    * ``on_error``: when an attempt fails with a transport error or an
+      error response
+    * ``on_retry``: after on_error, when the failed attempt will be retried
+      (retry_delay is set)
+    * ``on_complete``: once, when the request succeeded or finally failed
+      (elapsed is set, and error for failures)
+
+    Requests are not instrumented at all while no handler is registered.
+    Handlers should be fast and must not raise: exceptions propagate to the
+    caller of the request. One registry can be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        on_request_start: Optional[Handler] = None,
+        on_signed: Optional[Handler] = None,
+        on_response: Optional[Handler] = None,
+        on_retry: Optional[Handler] = None,
+        on_error: Optional[Handler] = None,
+        on_complete: Optional[Handler] = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            on_request_start: Handler called when a request starts
+            on_signed: Handler called after each attempt is signed
+            on_response: Handler called when each attempt gets a response
+            on_retry: Handler called before each retry
+            on_error: Handler called when an attempt fails
+            on_complete: Handler called when a request completes
+        """
+        self._lock = threading.Lock()
+        self._handlers: Dict[str, List[Handler]] = {name: [] for name in EVENTS}
+        self._count = 0
+        handlers = {
+            REQUEST_START: on_request_start,
+            SIGNED: on_signed,
+            RESPONSE: on_response,
+            RETRY: on_retry,
+            ERROR: on_error,
+            COMPLETE: on_complete,
+        }
+        for name, handler in handlers.items():
+            if handler is not None:
+                self.add(name, handler)
+
+    def add(self, name: str, handler: Handler) -> Handler:
+        """Register a handler.
+
+        Args:
+            name: Hook name (one of EVENTS, e.g. ``"on_response"``)
+            handler: Callable receiving the RequestEvent
+
+        Returns:
+            Handler: The registered handler
+
+        Raises:
+            ValueError: If the hook name is unknown
+        """
+        if name not in self._handlers:
+            raise ValueError(f"Unknown hook: {name} (expected one of {EVENTS})")
+        with self._lock:
+            # Copy on write, so emitting never sees a list being modified
+            self._handlers[name] = [*self._handlers[name], handler]
+            self._count += 1
+        return handler
+
+    def remove(self, name: str, handler: Handler) -> None:
+        """Unregister a handler.
+
+        Args:
+            name: Hook name the handler was registered for
+            handler: Registered handler
+
+        Raises:
+            ValueError: If the handler is not registered for the hook
+        """
+        with self._lock:
+            handlers = list(self._handlers.get(name, ()))
+            handlers.remove(handler)
+            self._handlers[name] = handlers
+            self._count -= 1
+
+    def __bool__(self) -> bool:
+        """Return whether any handler is registered."""
+        return self._count > 0
+
+    def emit(self, name: str, event: RequestEvent) -> None:
+        """Call the handlers of a hook.
+
+        Args:
+            name: Hook name
+            event: Event of the request
+        """
+        for handler in self._handlers[name]:
+            handler(event)
+
+    # Request stages, called by the clients
+
+    def start(self, method: str, endpoint: str, url: str) -> RequestEvent:
+        """Start a request and call the on_request_start handlers.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            url: Full request URL
+
+        Returns:
+            RequestEvent: Event following the request
+        """
+        event = RequestEvent(method, endpoint, url)
+        self.emit(REQUEST_START, event)
+        return event
+
+    def attempt(self, event: RequestEvent) -> None:
+        """Reset the per-attempt fields of an event for a new attempt.
+
+        Args:
+            event: Event of the request
+        """
+        event.attempt += 1
+        event.attempt_started = time.monotonic()
+        event.status_code = None
+        event.error = None
+        event.retry_delay = None
+        event.request_size = 0
+        event.response_size = 0
+        event.phases = {}
+
+    def signed(self, event: RequestEvent, duration: float) -> None:
+        """Record the signing time and call the on_signed handlers.
+
+        Args:
+            event: Event of the request
+            duration: Seconds spent signing
+        """
+        event.phases["sign"] = duration
+        self.emit(SIGNED, event)
+
+    def response(
+        self,
+        event: RequestEvent,
+        status_code: int,
+        request_size: int = 0,
+        response_size: int = 0,
+    ) -> None:
+        """Record the response and call the on_response handlers.
+
+        Args:
+            event: Event of the request, with its send/read phases recorded
+            status_code: HTTP status of the response
+            request_size: Bytes of the request body
+            response_size: Bytes of the response body
+        """
+        event.status_code = status_code
+        event.request_size = request_size
+        event.response_size = response_size
+        self.emit(RESPONSE, event)
+
+    def error(self, event: RequestEvent, error: BaseException) -> None:
+        """Record a failed attempt and call the on_error handlers.
+
+        Args:
+            event: Event of the request
+            error: Exception of the attempt
+        """
+        event.error = error
+        self.emit(ERROR, event)
+
+    def retry(self, event: RequestEvent, delay: float) -> None:
+        """Record the wait before a retry and call the on_retry handlers.
+
+        Args:
+            event: Event of the request
+            delay: Seconds until the next attempt
+        """
+        event.retry_delay = delay
+        self.emit(RETRY, event)
+
+    def complete(
+        self, event: RequestEvent, error: Optional[BaseException] = None
+    ) -> None:
+        """Finish a request and call the on_complete handlers.
+
+        Args:
+            event: Event of the request
+            error: Exception the request failed with, None on success
+        """
+        event.elapsed = time.monotonic() - event.started
+        event.error = error
+        self.emit(COMPLETE, event)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the registry."""
+        counts = ", ".join(
+            f"{name}={len(handlers)}"
+            for name, handlers in self._handlers.items()
+            if handlers
+        )
+        return f"RequestHooks({counts})"
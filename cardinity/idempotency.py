@@ -0,0 +1,180 @@
+"""
+Cardinity Idempotency
+
+This module contains the idempotency keys attached to write requests and the
+local ledger that answers a repeated submission of the same operation with
+the original response instead of sending it to the API again.
+"""
+
+import copy
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .exceptions import IdempotencyError
+from .utils import freeze
+
+#: Request header carrying the idempotency key
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL = 24 * 60 * 60.0
+
+# Namespace of the derived keys, so the same operation always maps to the
+# same key, across processes too
+_KEY_NAMESPACE = uuid.UUID("6f3c1a52-4a3e-4d0e-9a8e-5c1d0b7e2f41")
+
+
+def derive_idempotency_key(
+    endpoint: str, data: Optional[Mapping[str, Any]]
+) -> Optional[str]:
+    """Derive a stable idempotency key from an order's request payload.
+
+    The key covers the endpoint and the whole payload (order_id, amount,
+    payment instrument, ...), so only an identical resubmission maps to the
+    same key. Operations that repeat a payload on purpose, such as recurring
+    charges of the same amount on the same order, need explicit keys.
+
+    Args:
+        endpoint: API endpoint the request is sent to
+        data: Request payload
+
+    Returns:
+        Optional[str]: Key identifying the operation, or None if the payload
+            has no order_id
+    """
+    order_id = data.get("order_id") if data else None
+    if order_id is None or order_id == "":
+        return None
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return str(uuid.uuid5(_KEY_NAMESPACE, f"POST {endpoint} {payload}"))
+
+
+class IdempotencyLedger:
+    """Thread-safe record of the responses to idempotent write requests.
+
+    The clients record the response of every successful POST made with an
+    explicit or derived idempotency key. Submitting the same key again
+    within ``ttl`` seconds returns a copy of that response without calling
+    the API, e.g. when a double click resubmits a completed payment. Reusing
+    a key with a different payload raises IdempotencyError. At most
+    ``max_entries`` responses are kept; the oldest one is evicted first.
+
+    Only completed responses are replayed. An attempt whose outcome is
+    unknown (a timeout, a dropped connection) is never recorded, so
+    resubmitting it calls the API again; the ledger gives no protection
+    against charging such an operation twice.
+
+    The ledger lives in the memory of one process and is lost when the
+    process exits; share one instance between clients of the same process
+    to de-duplicate across them.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the ledger.
+
+        Args:
+            max_entries: Maximum number of recorded responses
+            ttl: Seconds a response is kept
+            clock: Monotonic clock
+
+        Raises:
+            ValueError: If max_entries is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        # key -> (expiry time, frozen payload, response)
+        self._entries: OrderedDict[str, Tuple[float, Any, Any]] = OrderedDict()
+        self.replays = 0
+
+    def get(self, key: str, payload: Optional[Mapping[str, Any]]) -> Optional[Any]:
+        """Look up the recorded response of an operation.
+
+        Args:
+            key: Idempotency key of the operation
+            payload: Payload the operation is being submitted with
+
+        Returns:
+            Optional[Any]: Copy of the recorded response, or None if the key
+                was not recorded or has expired
+
+        Raises:
+            IdempotencyError: If the key was recorded with another payload
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= self.clock():
+                del self._entries[key]
+                return None
+            if entry[1] != freeze(payload):
+                raise IdempotencyError(
+                    "Idempotency key was already used with a different payload",
+                    key=key,
+                )
+            self.replays += 1
+            response = entry[2]
+        return copy.deepcopy(response)
+
+    def record(
+        self, key: str, payload: Optional[Mapping[str, Any]], response: Any
+    ) -> None:
+        """Record the response of a successful operation.
+
+        Args:
+            key: Idempotency key of the operation
+            payload: Payload the operation was submitted with
+            response: Parsed API response
+        """
+        entry = (self.clock() + self.ttl, freeze(payload), copy.deepcopy(response))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, key: str) -> None:
+        """Drop the recorded response of an operation, allowing a resubmission.
+
+        Args:
+            key: Idempotency key of the operation
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every recorded response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get the ledger counters.
+
+        Returns:
+            Dict[str, int]: Numbers of replayed responses and recorded entries
+        """
+        with self._lock:
+            return {"replays": self.replays, "entries": len(self._entries)}
+
+    def __len__(self) -> int:
+        """Return the number of recorded responses."""
+        with self._lock:
+            return len(self._entries)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the ledger."""
+        fields = ", ".join(f"{key}={value}" for key, value in self.stats().items())
+        return f"IdempotencyLedger({fields})"
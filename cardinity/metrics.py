@@ -0,0 +1,406 @@
+"""
+Cardinity Metrics
+
+This module contains client-side request metrics collected through the
+request hooks: per-endpoint, per-status latency histograms with logarithmic
+buckets, and counters of errors, retries, timeouts and bytes sent and
+received. Metrics are available as a snapshot dictionary or rendered in the
+Prometheus text exposition format.
+"""
+
+import math
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests.exceptions import Timeout
+
+from .hooks import RequestEvent, RequestHooks
+from .utils import endpoint_template
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None  # type: ignore[assignment]
+
+#: Exceptions counted as timeouts
+TIMEOUT_ERRORS: Tuple[type, ...] = (Timeout,)
+if httpx is not None:
+    TIMEOUT_ERRORS += (httpx.TimeoutException,)
+
+#: Linear sub-buckets per power of two; the relative bucket width is at most
+#: 1 / SUB_BUCKETS
+SUB_BUCKETS = 4
+#: frexp() exponent of the first octave; latencies below 2**-14 s (~61 us)
+#: share the first bucket
+MIN_EXPONENT = -13
+#: frexp() exponent past the last octave; latencies of 2**7 s (128 s) and
+#: more share the overflow bucket
+MAX_EXPONENT = 8
+BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT) * SUB_BUCKETS + 2
+
+# Per-endpoint counters, in the order they are stored
+COUNTERS = ("requests", "errors", "retries", "timeouts", "bytes_sent", "bytes_received")
+_REQUESTS, _ERRORS, _RETRIES, _TIMEOUTS, _BYTES_SENT, _BYTES_RECEIVED = range(6)
+
+LatencyKey = Tuple[str, str, str]  # method, endpoint, status
+EndpointKey = Tuple[str, str]  # method, endpoint
+
+
+def bucket_index(seconds: float) -> int:
+    """Return the histogram bucket of a latency.
+
+    Args:
+        seconds: Latency in seconds
+
+    Returns:
+        int: Bucket index, from 0 to BUCKET_COUNT - 1
+    """
+    if seconds <= 0:
+        return 0
+    mantissa, exponent = math.frexp(seconds)  # seconds = mantissa * 2**exponent
+    if exponent < MIN_EXPONENT:
+        return 0
+    if exponent >= MAX_EXPONENT:
+        return BUCKET_COUNT - 1
+    sub_bucket = int((mantissa * 2 - 1) * SUB_BUCKETS)
+    return 1 + (exponent - MIN_EXPONENT) * SUB_BUCKETS + sub_bucket
+
+
+def bucket_upper_bound(index: int) -> float:
+    """Return the upper bound of a histogram bucket in seconds.
+
+    Args:
+        index: Bucket index
+
+    Returns:
+        float: Exclusive upper bound (infinity for the overflow bucket)
+    """
+    if index == 0:
+        return math.ldexp(0.5, MIN_EXPONENT)
+    if index >= BUCKET_COUNT - 1:
+        return math.inf
+    octave, sub_bucket = divmod(index - 1, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub_bucket + 1) / (2 * SUB_BUCKETS), MIN_EXPONENT + octave)
+
+
+class LatencyHistogram:
+    """Latency histogram with logarithmic (HDR-style) buckets.
+
+    Each power of two between 2**-14 and 2**7 seconds is split into
+    SUB_BUCKETS linear buckets, so percentiles are accurate to within 25%
+    with 86 buckets, whatever the latency. Not thread-safe by itself; the
+    metrics keep one per thread and merge them when read.
+    """
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record a latency.
+
+        Args:
+            seconds: Latency in seconds
+        """
+        self.counts[bucket_index(seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the recordings of another histogram to this one.
+
+        Args:
+            other: Histogram to add
+        """
+        counts = self.counts
+        for index, count in enumerate(list(other.counts)):
+            counts[index] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a latency percentile.
+
+        Args:
+            percent: Percentile, from 0 to 100
+
+        Returns:
+            float: Upper bound of the bucket holding the percentile, capped
+                at the largest recorded latency (0.0 if nothing was recorded)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max  # pragma: no cover - counts always add up to count
+
+
+class _Shard:
+    """Metrics recorded by one thread."""
+
+    __slots__ = ("latency", "counters")
+
+    def __init__(self) -> None:
+        self.latency: Dict[LatencyKey, LatencyHistogram] = {}
+        self.counters: Dict[EndpointKey, List[int]] = {}
+
+    def counter(self, event: RequestEvent) -> List[int]:
+        key = (event.method, endpoint_template(event.endpoint))
+        counters = self.counters.get(key)
+        if counters is None:
+            counters = self.counters[key] = [0] * len(COUNTERS)
+        return counters
+
+    def merge(self, other: "_Shard") -> None:
+        """Add the metrics of another shard to this one."""
+        for key, histogram in list(other.latency.items()):
+            self.latency.setdefault(key, LatencyHistogram()).merge(histogram)
+        for endpoint, values in list(other.counters.items()):
+            totals = self.counters.setdefault(endpoint, [0] * len(COUNTERS))
+            for index, value in enumerate(list(values)):
+                totals[index] += value
+
+
+class _ThreadToken:
+    """Object living as long as the thread-local data of one thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire_shard(metrics_ref: "weakref.ref[ClientMetrics]", shard: _Shard) -> None:
+    """Fold the shard of a finished thread into the retired metrics."""
+    metrics = metrics_ref()
+    if metrics is not None:
+        metrics._retire(shard)
+
+
+class ClientMetrics:
+    """Request metrics of Cardinity clients.
+
+    Metrics are recorded by request hooks: pass ``metrics.hooks`` as the
+    ``hooks`` option of a client or SDK, or attach the metrics to the hooks
+    of existing clients. One instance can collect the metrics of several
+    clients.
+
+    Latencies cover a whole request, retries included, and are grouped by
+    method, endpoint template (``/payments/{id}``) and final status (the
+    HTTP status code, or ``error`` when no response was received). Bytes are
+    counted for every attempt that got a response.
+
+    Each thread records into its own shard without locking; shards are merged
+    when the metrics are read. When a thread exits, its shard is folded into
+    a shared total, so short-lived worker threads do not accumulate shards.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[_Shard] = []
+        self._retired = _Shard()
+        self.hooks = RequestHooks()
+        self.attach(self.hooks)
+
+    def attach(self, hooks: RequestHooks) -> None:
+        """Record the requests reported to a hook registry.
+
+        Args:
+            hooks: Request hooks, e.g. ``client.hooks``
+        """
+        hooks.add("on_response", self._on_response)
+        hooks.add("on_error", self._on_error)
+        hooks.add("on_retry", self._on_retry)
+        hooks.add("on_complete", self._on_complete)
+
+    def detach(self, hooks: RequestHooks) -> None:
+        """Stop recording the requests reported to a hook registry.
+
+        Args:
+            hooks: Request hooks the metrics were attached to
+        """
+        hooks.remove("on_response", self._on_response)
+        hooks.remove("on_error", self._on_error)
+        hooks.remove("on_retry", self._on_retry)
+        hooks.remove("on_complete", self._on_complete)
+
+    def _shard(self) -> _Shard:
+        """Return the shard of the current thread."""
+        shard: Optional[_Shard] = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            # The token is dropped with the thread-local data when the thread
+            # exits, which retires the shard
+            token = self._local.token = _ThreadToken()
+            weakref.finalize(token, _retire_shard, weakref.ref(self), shard)
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold the shard of a finished thread into the retired metrics."""
+        with self._lock:
+            self._shards.remove(shard)
+            self._retired.merge(shard)
+
+    # Hook handlers
+
+    def _on_response(self, event: RequestEvent) -> None:
+        counters = self._shard().counter(event)
+        counters[_BYTES_SENT] += event.request_size
+        counters[_BYTES_RECEIVED] += event.response_size
+
+    def _on_error(self, event: RequestEvent) -> None:
+        if isinstance(event.error, TIMEOUT_ERRORS):
+            self._shard().counter(event)[_TIMEOUTS] += 1
+
+    def _on_retry(self, event: RequestEvent) -> None:
+        self._shard().counter(event)[_RETRIES] += 1
+
+    def _on_complete(self, event: RequestEvent) -> None:
+        shard = self._shard()
+        counters = shard.counter(event)
+        counters[_REQUESTS] += 1
+        if event.error is not None:
+            counters[_ERRORS] += 1
+
+        status = str(event.status_code) if event.status_code else "error"
+        key = (event.method, endpoint_template(event.endpoint), status)
+        histogram = shard.latency.get(key)
+        if histogram is None:
+            histogram = shard.latency[key] = LatencyHistogram()
+        histogram.record(event.elapsed or 0.0)
+
+    # Reading
+
+    def _merged(
+        self,
+    ) -> Tuple[Dict[LatencyKey, LatencyHistogram], Dict[EndpointKey, List[int]]]:
+        """Merge the shards of every thread."""
+        merged = _Shard()
+        with self._lock:
+            merged.merge(self._retired)
+            shards = list(self._shards)
+        for shard in shards:
+            merged.merge(shard)
+        return merged.latency, merged.counters
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the current metrics.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: ``latency``, one entry per
+                method, endpoint and status with the request count and the
+                sum, min, max, p50, p90, p99 latencies in seconds; and
+                ``endpoints``, one entry per method and endpoint with the
+                request, error, retry, timeout and byte counters
+        """
+        latency, counters = self._merged()
+        return {
+            "latency": [
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "status": status,
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "min": histogram.min,
+                    "max": histogram.max,
+                    "p50": histogram.percentile(50),
+                    "p90": histogram.percentile(90),
+                    "p99": histogram.percentile(99),
+                }
+                for (method, endpoint, status), histogram in sorted(latency.items())
+            ],
+            "endpoints": [
+                {"method": method, "endpoint": endpoint, **dict(zip(COUNTERS, values))}
+                for (method, endpoint), values in sorted(counters.items())
+            ],
+        }
+
+    def render_prometheus(self, prefix: str = "cardinity") -> str:
+        """Render the metrics in the Prometheus text exposition format.
+
+        Latency histograms are exposed with one bucket per power of two.
+
+        Args:
+            prefix: Prefix of the metric names
+
+        Returns:
+            str: Metrics text, ending with a newline
+        """
+        latency, counters = self._merged()
+        lines: List[str] = []
+
+        name = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {name} Latency of Cardinity API requests.")
+        lines.append(f"# TYPE {name} histogram")
+        for (method, endpoint, status), histogram in sorted(latency.items()):
+            labels = _labels(method=method, endpoint=endpoint, status=status)
+            cumulative = histogram.counts[0]
+            for index in range(1, BUCKET_COUNT - 1):
+                cumulative += histogram.counts[index]
+                if index % SUB_BUCKETS == 0:  # last sub-bucket of an octave
+                    le = repr(bucket_upper_bound(index))
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        for counter, help_text in (
+            ("requests", "Completed Cardinity API requests."),
+            ("errors", "Cardinity API requests that failed."),
+            ("retries", "Retried attempts of Cardinity API requests."),
+            ("timeouts", "Attempts of Cardinity API requests that timed out."),
+            ("bytes_sent", "Request body bytes sent to the Cardinity API."),
+            ("bytes_received", "Response body bytes received from the API."),
+        ):
+            name = f"{prefix}_{counter}_total"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            index = COUNTERS.index(counter)
+            for (method, endpoint), values in sorted(counters.items()):
+                labels = _labels(method=method, endpoint=endpoint)
+                lines.append(f"{name}{{{labels}}} {values[index]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop every recorded metric."""
+        with self._lock:
+            self._retired = _Shard()
+            for shard in self._shards:
+                shard.latency = {}
+                shard.counters = {}
+
+    def __repr__(self) -> str:
+        """Return a string representation of the metrics."""
+        with self._lock:
+            shards = len(self._shards)
+        return f"ClientMetrics(shards={shards})"
+
+
+def _labels(**labels: str) -> str:
+    """Format Prometheus labels, escaping their values."""
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in labels.items()
+    )
@@ -5,10 +5,12 @@ This module defines the abstract base class for all Cardinity API models.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, List, Mapping, Optional
 
 from ..exceptions import ValidationError
-from ..validation import validate_data
+from ..tracing import validation_span
+from ..utils import FrozenDict, freeze, thaw
+from ..validation import validate_model_data
 
 
 class BaseModel(ABC):
@@ -16,8 +18,17 @@ class BaseModel(ABC):
 
     This class provides common functionality for data validation, serialization,
     and API endpoint configuration that all model classes inherit.
+
+    Models use ``__slots__`` and keep their validated data frozen all the way
+    down (see cardinity.utils.freeze); update_data() replaces it rather than
+    mutating it. Models are therefore hashable, with the hash of the data
+    computed once, and can be used as dict keys or in sets. Callers that only
+    read the data can use the ``data`` view instead of the copies returned by
+    to_dict() and get_data().
     """
 
+    __slots__ = ("_data",)
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the model with data validation.
 
@@ -28,15 +39,39 @@ class BaseModel(ABC):
             ValidationError: If the provided data fails validation
         """
         # Validate the input data against the model's constraints
-        validation_errors = validate_data(kwargs, self.get_constraints())
+        with validation_span(self):
+            validation_errors = self._validate_data(kwargs)
         if validation_errors:
             raise ValidationError(
                 f"Validation failed for {self.__class__.__name__}",
                 errors=validation_errors,
             )
 
-        # Store the validated data
-        self._data = kwargs.copy()
+        # Store the validated data, frozen so nested values cannot change
+        # under the cached hash
+        self._data: FrozenDict = freeze(kwargs)
+
+    def _validator_key(self) -> Hashable:
+        """Get the key under which this model's compiled validator is cached.
+
+        Constraints are compiled once per key, so subclasses whose constraints
+        depend on instance state must include that state in the key.
+
+        Returns:
+            Hashable: The model class by default
+        """
+        return self.__class__
+
+    def _validate_data(self, data: Dict[str, Any]) -> Optional[Dict[str, List[str]]]:
+        """Validate data against this model's constraints.
+
+        Args:
+            data: The data to validate
+
+        Returns:
+            Optional[Dict[str, List[str]]]: Validation errors if any, None if valid
+        """
+        return validate_model_data(data, self._validator_key(), self.get_constraints)
 
     @abstractmethod
     def get_constraints(self) -> Dict[str, Any]:
@@ -83,6 +118,16 @@ class BaseModel(ABC):
         """
         raise NotImplementedError("Subclasses must implement get_method()")
 
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """Read-only view of the model data, shared without copying.
+
+        Returns:
+            Mapping[str, Any]: The frozen model data; nested dicts and lists
+                are read-only too
+        """
+        return self._data
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the model to a dictionary for API serialization.
 
@@ -90,17 +135,18 @@ class BaseModel(ABC):
         for sending to the Cardinity API.
 
         Returns:
-            Dict[str, Any]: Dictionary representation of the model data
+            Dict[str, Any]: Dictionary representation of the model data;
+                nested values are shared read-only containers
         """
-        return self._data.copy()
+        return dict(self._data)
 
     def get_data(self) -> Dict[str, Any]:
         """Get the raw model data.
 
         Returns:
-            Dict[str, Any]: Copy of the internal model data
+            Dict[str, Any]: Mutable deep copy of the internal model data
         """
-        return self._data.copy()
+        return thaw(self._data)
 
     def update_data(self, **kwargs: Any) -> None:
         """Update the model data with new values.
@@ -112,11 +158,10 @@ class BaseModel(ABC):
             ValidationError: If the updated data fails validation
         """
         # Merge new data with existing data
-        updated_data = self._data.copy()
-        updated_data.update(kwargs)
+        updated_data = {**thaw(self._data), **kwargs}
 
         # Validate the updated data
-        validation_errors = validate_data(updated_data, self.get_constraints())
+        validation_errors = self._validate_data(updated_data)
         if validation_errors:
             raise ValidationError(
                 f"Validation failed for {self.__class__.__name__} update",
@@ -124,7 +169,7 @@ class BaseModel(ABC):
             )
 
         # Update the internal data
-        self._data = updated_data
+        self._data = freeze(updated_data)
 
     def get_field(self, field_name: str, default: Any = None) -> Any:
         """Get a specific field value from the model data.
@@ -155,7 +200,7 @@ class BaseModel(ABC):
         Returns:
             Optional[Dict[str, Any]]: Validation errors if any, None if valid
         """
-        return validate_data(self._data, self.get_constraints())
+        return self._validate_data(thaw(self._data))
 
     def is_valid(self) -> bool:
         """Check if the current model data is valid.
@@ -198,12 +243,16 @@ class BaseModel(ABC):
     def __hash__(self) -> int:
         """Generate hash for the model instance.
 
+        The data is hashed structurally, nested dicts and lists included; the
+        frozen data caches its hash, so it is computed only once per model.
+
         Returns:
             int: Hash value based on class and data
+
+        Raises:
+            TypeError: If the data holds an unhashable value, such as a set
         """
-        # Create a hash based on the class name and a sorted tuple of data items
-        data_items = tuple(sorted(self._data.items()))
-        return hash((self.__class__.__name__, data_items))
+        return hash((self.__class__.__name__, self._data))
 
 
 class ReadOnlyModel(BaseModel):
@@ -213,6 +262,8 @@ class ReadOnlyModel(BaseModel):
     that shouldn't be modified locally (e.g., payment status, transaction history).
     """
 
+    __slots__ = ()
+
     def update_data(self, **kwargs: Any) -> None:
         """Prevent data updates on read-only models.
 
@@ -18,6 +18,8 @@ class GetChargeback(ReadOnlyModel):
     3. Global chargeback listing with optional limit
     """
 
+    __slots__ = ("_mode", "_limit", "_payment_id", "_chargeback_id")
+
     def __init__(
         self,
         payment_id_or_limit: Optional[Union[str, int]] = None,
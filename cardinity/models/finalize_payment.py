@@ -4,7 +4,7 @@ Cardinity Finalize Payment Model
 This module contains the FinalizePayment model for completing 3D Secure authentication.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, Optional
 
 from ..validation.constraints import Constraints
 from .base import BaseModel
@@ -18,6 +18,8 @@ class FinalizePayment(BaseModel):
     - 3DS v2: Uses cres (Challenge Response) parameter
     """
 
+    __slots__ = ("_payment_id", "_is_threedsv2")
+
     def __init__(self, payment_id: str, **kwargs: Any):
         """Initialize FinalizePayment model.
 
@@ -32,6 +34,14 @@ class FinalizePayment(BaseModel):
 
         super().__init__(**kwargs)
 
+    def _validator_key(self) -> Hashable:
+        """Get the validator cache key, which depends on the 3DS version.
+
+        Returns:
+            Hashable: The model class paired with the 3DS v2 flag
+        """
+        return (self.__class__, self._is_threedsv2)
+
     def get_constraints(self) -> Dict[str, Any]:
         """Get validation constraints for payment finalization.
 
@@ -98,10 +108,8 @@ class FinalizePayment(BaseModel):
         Returns:
             Dict[str, Any]: Only the relevant field based on 3DS version
         """
-        data = super().to_dict()
-
         # Only include the relevant field for the 3DS version
         if self._is_threedsv2:
-            return {k: v for k, v in data.items() if k == "cres"}
+            return {k: v for k, v in self._data.items() if k == "cres"}
         else:
-            return {k: v for k, v in data.items() if k == "authorize_data"}
+            return {k: v for k, v in self._data.items() if k == "authorize_data"}
@@ -17,6 +17,8 @@ class GetPayment(ReadOnlyModel):
     2. Payment listing with optional limit parameter
     """
 
+    __slots__ = ("_payment_id", "_limit", "_is_listing")
+
     def __init__(self, payment_id: Optional[str] = None, limit: Optional[int] = None):
         """Initialize GetPayment model.
 
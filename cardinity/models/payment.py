@@ -17,6 +17,8 @@ class Payment(BaseModel):
     billing addresses, and all required payment data validation.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize Payment model.
 
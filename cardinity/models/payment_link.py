@@ -18,6 +18,8 @@ class PaymentLink(BaseModel):
     can use to complete payments without direct integration.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: Dict[str, Any]) -> None:
         """Initialize PaymentLink model.
 
@@ -111,6 +113,8 @@ class UpdatePaymentLink(BaseModel):
     of existing payment links.
     """
 
+    __slots__ = ("_link_id",)
+
     def __init__(self, link_id: str, data: Dict[str, Any]) -> None:
         """Initialize UpdatePaymentLink model.
 
@@ -182,6 +186,8 @@ class GetPaymentLink(ReadOnlyModel):
     This model retrieves information about a specific payment link.
     """
 
+    __slots__ = ("_link_id",)
+
     def __init__(self, link_id: str) -> None:
         """Initialize GetPaymentLink model.
 
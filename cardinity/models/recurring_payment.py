@@ -17,6 +17,8 @@ class RecurringPayment(BaseModel):
     from a successful payment to process new charges.
     """
 
+    __slots__ = ()
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize RecurringPayment model.
 
@@ -17,6 +17,8 @@ class Refund(BaseModel):
     previously processed payments.
     """
 
+    __slots__ = ("_payment_id",)
+
     def __init__(self, payment_id: str, **kwargs: Any) -> None:
         """Initialize Refund model.
 
@@ -83,6 +85,8 @@ class GetRefund(ReadOnlyModel):
     all refunds for a payment.
     """
 
+    __slots__ = ("_payment_id", "_refund_id")
+
     def __init__(self, payment_id: str, refund_id: Optional[str] = None) -> None:
         """Initialize GetRefund model.
 
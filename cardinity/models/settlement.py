@@ -17,6 +17,8 @@ class Settlement(BaseModel):
     authorized payments.
     """
 
+    __slots__ = ("_payment_id",)
+
     def __init__(self, payment_id: str, **kwargs: Any) -> None:
         """Initialize Settlement model.
 
@@ -83,6 +85,8 @@ class GetSettlement(ReadOnlyModel):
     all settlements for a payment.
     """
 
+    __slots__ = ("_payment_id", "_settlement_id")
+
     def __init__(self, payment_id: str, settlement_id: Optional[str] = None) -> None:
         """Initialize GetSettlement model.
 
@@ -16,6 +16,8 @@ class Void(BaseModel):
     before they are settled.
     """
 
+    __slots__ = ("_payment_id",)
+
     def __init__(self, payment_id: str, **kwargs: Any) -> None:
         """Initialize Void model.
 
@@ -81,6 +83,8 @@ class GetVoid(ReadOnlyModel):
     all voids for a payment.
     """
 
+    __slots__ = ("_payment_id", "_void_id")
+
     def __init__(self, payment_id: str, void_id: Optional[str] = None) -> None:
         """Initialize GetVoid model.
 
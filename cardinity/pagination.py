@@ -0,0 +1,204 @@
+"""
+Cardinity Pagination
+
+This module walks the pages of the API's listing endpoints lazily, yielding
+one item at a time while the next page is fetched in the background.
+"""
+
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .exceptions import CardinityError
+
+DEFAULT_PAGE_SIZE = 100
+
+
+class Paginator:
+    """Lazy iterator over the items of a listing endpoint.
+
+    Pages of ``page_size`` items are requested with the ``limit`` query
+    parameter. The Cardinity listing endpoints accept only ``limit``, so by
+    default a single page is fetched: if it is full, a UserWarning reports
+    that the listing may be truncated and iteration stops.
+
+    Walking further pages is opt-in for endpoints (or proxies, test servers)
+    that support a cursor: with ``cursor_param``, each page after the first
+    carries the ID of the previous page's last item in that query parameter.
+    Only the current page and, with ``prefetch``, the next one are held in
+    memory, so arbitrarily long histories can be exported in constant memory.
+
+    ``cursor`` holds the ID of the last item the consumer finished with (the
+    iterator moves past an item when the next one is requested). Storing it
+    lets an interrupted export resume where it stopped by passing it back as
+    ``cursor``; the item being processed during a crash is yielded again.
+
+    Example:
+        Exporting with resume support, through a cursor-aware endpoint::
+
+            pages = cardinity.iter_payments(
+                cursor=load_checkpoint(), cursor_param="after"
+            )
+            for payment in pages:
+                export(payment)
+                save_checkpoint(pages.cursor)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        endpoint: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cursor_param: Optional[str] = None,
+        prefetch: bool = True,
+        item_factory: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> None:
+        """Initialize the paginator.
+
+        Args:
+            client: CardinityClient executing the requests
+            endpoint: Listing endpoint path
+            page_size: Number of items requested per page
+            cursor: ID of the last item already processed, to resume after
+            params: Extra query parameters sent with every page request
+            cursor_param: Query parameter carrying the cursor, if the endpoint
+                supports one; without it only the first page is fetched
+            prefetch: Fetch the next page in a background thread while the
+                current one is consumed
+            item_factory: Callable applied to each item before it is yielded
+                (e.g. a result class); pages() still returns raw items
+
+        Raises:
+            ValueError: If page_size is less than 1, or a cursor is given
+                without cursor_param
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if cursor is not None and cursor_param is None:
+            raise ValueError("resuming from a cursor requires cursor_param")
+
+        self.client = client
+        self.endpoint = endpoint
+        self.page_size = page_size
+        self.cursor = cursor
+        self.params = dict(params or {})
+        self.cursor_param = cursor_param
+        self.prefetch = prefetch
+        self.item_factory = item_factory
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items of every page, starting after the cursor.
+
+        Yields:
+            Any: Each listed item, passed through item_factory if set
+
+        Raises:
+            CardinityError: If a page cannot be fetched or does not advance
+        """
+        for page in self.pages():
+            for item in page:
+                yield self.item_factory(item) if self.item_factory else item
+                self.cursor = _item_id(item) or self.cursor
+
+    def pages(self) -> Iterator[List[Dict[str, Any]]]:
+        """Iterate over whole pages, starting after the cursor.
+
+        Yields:
+            List[Dict[str, Any]]: Each non-empty page
+        """
+        if not self.prefetch:
+            cursor = self.cursor
+            while True:
+                page = self.fetch_page(cursor)
+                if page:
+                    yield page
+                next_cursor = self._next_cursor(page, cursor)
+                if next_cursor is None:
+                    return
+                cursor = next_cursor
+
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cardinity-pages"
+        )
+        pending: Optional[Future] = executor.submit(self.fetch_page, self.cursor)
+        cursor = self.cursor
+        try:
+            while pending is not None:
+                page = pending.result()
+                pending = None
+                next_cursor = self._next_cursor(page, cursor)
+                if next_cursor is not None:
+                    # Fetch the next page while this one is consumed
+                    pending = executor.submit(self.fetch_page, next_cursor)
+                    cursor = next_cursor
+                if page:
+                    yield page
+        finally:
+            # Stop prefetching if the consumer abandons the iterator early
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=True)
+
+    def fetch_page(self, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch the page following a cursor.
+
+        Args:
+            cursor: ID of the last item of the previous page, or None for the
+                first page
+
+        Returns:
+            List[Dict[str, Any]]: Items of the page
+
+        Raises:
+            CardinityError: If the endpoint does not return a list
+        """
+        params = dict(self.params, limit=self.page_size)
+        if cursor is not None and self.cursor_param is not None:
+            params[self.cursor_param] = cursor
+        page: Any = self.client.get(self.endpoint, params=params)
+        if not isinstance(page, list):
+            raise CardinityError(
+                f"Expected a list from {self.endpoint}, got {type(page).__name__}"
+            )
+        return page
+
+    def _next_cursor(
+        self, page: List[Dict[str, Any]], cursor: Optional[str]
+    ) -> Optional[str]:
+        """Return the cursor of the page after ``page``, or None if it was the last.
+
+        Without a cursor parameter, a full page is the last one fetched and
+        a UserWarning reports the possibly truncated listing.
+
+        Raises:
+            CardinityError: If a full page ends on the cursor it was fetched
+                with, i.e. the endpoint ignored the cursor
+        """
+        if len(page) < self.page_size:
+            return None
+        if self.cursor_param is None:
+            warnings.warn(
+                f"{self.endpoint} returned a full page of {len(page)} items; the "
+                "endpoint cannot be paginated without a cursor_param, so the "
+                "listing may be truncated (raise page_size to list more)",
+                UserWarning,
+                stacklevel=2,
+            )
+            return None
+        next_cursor = _item_id(page[-1])
+        if next_cursor is None or next_cursor == cursor:
+            raise CardinityError(f"Pagination of {self.endpoint} did not advance")
+        return next_cursor
+
+    def __repr__(self) -> str:
+        """Return a string representation of the paginator."""
+        return f"Paginator(endpoint='{self.endpoint}', cursor={self.cursor!r})"
+
+
+def _item_id(item: Any) -> Optional[str]:
+    """Return the ID of a listed item, or None if it has none."""
+    if isinstance(item, dict) and item.get("id") is not None:
+        return str(item["id"])
+    return None
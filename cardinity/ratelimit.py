@@ -0,0 +1,297 @@
+"""
+Cardinity Rate Limiting
+
+This module contains a client-side token-bucket rate limiter that spaces out
+requests per endpoint family and slows down when the API answers with 429.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .utils import endpoint_family
+
+DEFAULT_RATE = 10.0
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_DECREASE_INTERVAL = 1.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve a token and are told how long to wait for it; the balance
+    may go negative, which queues callers behind each other so that requests
+    leave at the bucket's rate instead of in bursts. The lock is never held
+    while waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens, i.e. the burst size
+                (defaults to one second worth of tokens, at least 1)
+            clock: Monotonic clock
+
+        Raises:
+            ValueError: If rate or capacity is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        capacity = max(1.0, rate) if capacity is None else capacity
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in tokens per second."""
+        return self._rate
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update (lock held)."""
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            float: Seconds the caller must wait before using the tokens
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Give back reserved tokens that will not be used.
+
+        Args:
+            tokens: Number of tokens to give back
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the current balance.
+
+        Args:
+            rate: New rate in tokens per second
+        """
+        with self._lock:
+            self._refill()
+            self._rate = float(rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new tokens for at least ``seconds``.
+
+        Args:
+            seconds: Time before the next token becomes available
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self._rate)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the bucket."""
+        return f"TokenBucket(rate={self._rate:g}, capacity={self.capacity:g})"
+
+
+class RateLimiter:
+    """Client-side rate limiter with one token bucket per endpoint family.
+
+    Requests to ``/payments``, ``/refunds``, ``/settlements``,
+    ``/paymentLinks`` and the other endpoint families draw from separate
+    buckets, so a bulk refund run does not starve payment creation.
+
+    Rates adapt to the API: a 429 response multiplies the family's rate by
+    ``decrease_factor`` (never going below ``min_rate``) and pauses it for the
+    Retry-After delay if one was sent; every successful response then adds
+    ``increase`` back until the configured rate is reached again. A burst of
+    429s answering requests that were already in flight slows a family down
+    only once: after a decrease, further 429s within ``decrease_interval``
+    (or the Retry-After delay, if longer) only pause it.
+
+    One limiter can be shared by several clients and threads in a process.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: Optional[float] = None,
+        family_rates: Optional[Dict[str, float]] = None,
+        min_rate: float = DEFAULT_MIN_RATE,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        decrease_interval: float = DEFAULT_DECREASE_INTERVAL,
+        increase: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Requests per second allowed for each endpoint family
+            burst: Bucket capacity (defaults to one second worth of requests)
+            family_rates: Per-family rates overriding ``rate`` (e.g.
+                ``{"refunds": 5}``)
+            min_rate: Lowest rate a family is slowed down to
+            decrease_factor: Multiplier applied to the rate on a 429
+            decrease_interval: Seconds after a decrease during which further
+                429s do not decrease the rate again
+            increase: Rate added back per successful response (defaults to
+                1% of the family's configured rate)
+            sleep: Function used to wait for a token
+            clock: Monotonic clock
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if min_rate <= 0:
+            raise ValueError("min_rate must be positive")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if decrease_interval < 0:
+            raise ValueError("decrease_interval cannot be negative")
+
+        self.rate = rate
+        self.burst = burst
+        self.family_rates = dict(family_rates or {})
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.decrease_interval = decrease_interval
+        self.increase = increase
+        self.sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._decrease_until: Dict[str, float] = {}
+
+    def _target_rate(self, family: str) -> float:
+        """Return the configured (maximum) rate of a family."""
+        return self.family_rates.get(family, self.rate)
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Return the token bucket for an endpoint's family.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            TokenBucket: Bucket shared by every endpoint of the family
+        """
+        family = endpoint_family(endpoint)
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(family)
+                if bucket is None:
+                    bucket = TokenBucket(
+                        self._target_rate(family), self.burst, self._clock
+                    )
+                    self._buckets[family] = bucket
+        return bucket
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve a request slot without waiting for it.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        return self.bucket(endpoint).reserve()
+
+    def release(self, endpoint: str) -> None:
+        """Give back a reserved slot that will not be used.
+
+        Args:
+            endpoint: API endpoint path passed to :meth:`reserve`
+        """
+        self.bucket(endpoint).refund()
+
+    def acquire(self, endpoint: str) -> float:
+        """Wait until a request to the endpoint may be sent.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            float: Seconds waited
+        """
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+
+    def on_rate_limited(
+        self, endpoint: str, retry_after: Optional[float] = None
+    ) -> None:
+        """Slow down an endpoint family after a 429 response.
+
+        Args:
+            endpoint: API endpoint path of the rejected request
+            retry_after: Seconds from the response's Retry-After header
+        """
+        family = endpoint_family(endpoint)
+        bucket = self.bucket(endpoint)
+        now = self._clock()
+        with self._lock:
+            until = self._decrease_until.get(family)
+            decrease = until is None or now >= until
+            if decrease:
+                window = max(self.decrease_interval, retry_after or 0.0)
+                self._decrease_until[family] = now + window
+        if decrease:
+            bucket.set_rate(max(self.min_rate, bucket.rate * self.decrease_factor))
+        if retry_after:
+            bucket.pause(retry_after)
+
+    def on_success(self, endpoint: str) -> None:
+        """Speed a slowed-down endpoint family back up after a success.
+
+        Args:
+            endpoint: API endpoint path of the successful request
+        """
+        bucket = self.bucket(endpoint)
+        target = self._target_rate(endpoint_family(endpoint))
+        if bucket.rate < target:
+            step = self.increase if self.increase is not None else target / 100
+            bucket.set_rate(min(target, bucket.rate + step))
+
+    def get_rates(self) -> Dict[str, float]:
+        """Get the current rate of every endpoint family used so far.
+
+        Returns:
+            Dict[str, float]: Requests per second by family
+        """
+        with self._lock:
+            return {family: bucket.rate for family, bucket in self._buckets.items()}
+
+    def __repr__(self) -> str:
+        """Return a string representation of the limiter."""
+        return f"RateLimiter(rate={self.rate:g}, families={sorted(self._buckets)})"
@@ -0,0 +1,310 @@
+"""
+Cardinity Response Objects
+
+This module contains typed, read-only wrappers around parsed API responses.
+Wrapping a response is free: fields are decoded (amounts to Decimal,
+timestamps to datetime, nested objects to their own wrappers) only when
+first accessed, and cached afterwards.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from dateutil.parser import isoparse
+
+_T = TypeVar("_T")
+_R = TypeVar("_R", bound="Result")
+
+
+def parse_decimal(value: Any) -> Decimal:
+    """Decode an amount such as "10.50" without float rounding.
+
+    Args:
+        value: Amount as sent by the API
+
+    Returns:
+        Decimal: Exact amount
+    """
+    return Decimal(str(value))
+
+
+def parse_datetime(value: str) -> datetime:
+    """Decode an ISO 8601 timestamp such as "2024-01-15T12:00:00Z".
+
+    Unlike ``datetime.fromisoformat`` before Python 3.11, this accepts every
+    ISO 8601 form, e.g. a "Z" suffix or fractional seconds of any length.
+
+    Args:
+        value: Timestamp as sent by the API
+
+    Returns:
+        datetime: Timezone-aware timestamp when the API sent an offset
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp
+    """
+    return isoparse(value)
+
+
+class Field(Generic[_T]):
+    """Lazily decoded response field.
+
+    Reading the field on a result decodes the raw JSON value with
+    ``decode`` on first access and caches it on the result; missing and null
+    values read as None.
+    """
+
+    __slots__ = ("name", "key", "decode")
+
+    def __init__(
+        self, decode: Optional[Callable[[Any], _T]] = None, key: Optional[str] = None
+    ) -> None:
+        """Initialize the field.
+
+        Args:
+            decode: Function decoding the raw JSON value, or None to return
+                it as is
+            key: JSON key of the field (defaults to the attribute name)
+        """
+        self.name = key or ""
+        self.key = key
+        self.decode = decode
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        if self.key is None:
+            self.key = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> "Field[_T]": ...
+
+    @overload
+    def __get__(self, instance: "Result", owner: type) -> Optional[_T]: ...
+
+    def __get__(
+        self, instance: Optional["Result"], owner: type
+    ) -> Union["Field[_T]", Optional[_T]]:
+        if instance is None:
+            return self
+        cache = instance._cache
+        if cache is None:
+            cache = instance._cache = {}
+        elif self.name in cache:
+            return cache[self.name]
+        raw = instance._data.get(self.key)  # type: ignore[arg-type]
+        value = raw if raw is None or self.decode is None else self.decode(raw)
+        cache[self.name] = value
+        return value
+
+
+class Result(Mapping[str, Any]):
+    """Base class of typed API responses.
+
+    Results also behave as read-only mappings of the raw JSON, so
+    ``result["status"]``, ``result.get("status")`` and ``dict(result)`` keep
+    working, and results compare equal to the dictionaries they wrap.
+    Fields the SDK does not know about yet are available the same way.
+    """
+
+    __slots__ = ("_data", "_cache")
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """Wrap a parsed response without decoding anything yet.
+
+        Args:
+            data: Parsed JSON object
+        """
+        self._data = data
+        self._cache: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def wrap(cls: Type[_R], data: Any) -> Any:
+        """Wrap a parsed object, or each object of a parsed list.
+
+        Args:
+            data: Parsed JSON object or list of objects
+
+        Returns:
+            Result or List[Result]: Wrapped response; other values are
+                returned unchanged
+        """
+        if isinstance(data, dict):
+            return cls(data)
+        if isinstance(data, list):
+            return [cls(item) if isinstance(item, dict) else item for item in data]
+        return data
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the raw parsed JSON.
+
+        Returns:
+            Dict[str, Any]: Shallow copy of the wrapped object
+        """
+        return dict(self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self._data
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._data = state
+        self._cache = None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the result."""
+        fields = ", ".join(
+            f"{key}={self._data[key]!r}"
+            for key in ("id", "status", "amount", "currency")
+            if key in self._data
+        )
+        return f"{self.__class__.__name__}({fields})"
+
+
+class PaymentInstrument(Result):
+    """Card details of a payment (the card number is masked)."""
+
+    __slots__ = ()
+
+    card_brand: Field[str] = Field()
+    pan: Field[str] = Field()
+    exp_year: Field[int] = Field()
+    exp_month: Field[int] = Field()
+    holder: Field[str] = Field()
+
+
+class AuthorizationInformation(Result):
+    """3D Secure v1 authorization data of a pending payment."""
+
+    __slots__ = ()
+
+    url: Field[str] = Field()
+    data: Field[str] = Field()
+
+
+class ThreeDS2Data(Result):
+    """3D Secure v2 challenge data of a pending payment."""
+
+    __slots__ = ()
+
+    acs_url: Field[str] = Field()
+    creq: Field[str] = Field()
+
+
+class TransactionResult(Result):
+    """Fields shared by payments, refunds, settlements, voids and chargebacks."""
+
+    __slots__ = ()
+
+    id: Field[str] = Field()
+    amount: Field[Decimal] = Field(parse_decimal)
+    currency: Field[str] = Field()
+    created: Field[datetime] = Field(parse_datetime)
+    type: Field[str] = Field()
+    live: Field[bool] = Field()
+    status: Field[str] = Field()
+    error: Field[str] = Field()
+    order_id: Field[str] = Field()
+    description: Field[str] = Field()
+
+    @property
+    def is_approved(self) -> bool:
+        """Whether the transaction was approved."""
+        return self._data.get("status") == "approved"
+
+    @property
+    def is_pending(self) -> bool:
+        """Whether the transaction awaits further action (e.g. 3D Secure)."""
+        return self._data.get("status") == "pending"
+
+    @property
+    def is_declined(self) -> bool:
+        """Whether the transaction was declined."""
+        return self._data.get("status") == "declined"
+
+
+class PaymentResult(TransactionResult):
+    """Payment or recurring payment response."""
+
+    __slots__ = ()
+
+    settle: Field[bool] = Field()
+    country: Field[str] = Field()
+    payment_method: Field[str] = Field()
+    statement_descriptor_suffix: Field[str] = Field()
+    payment_instrument: Field[PaymentInstrument] = Field(PaymentInstrument)
+    authorization_information: Field[AuthorizationInformation] = Field(
+        AuthorizationInformation
+    )
+    threeds2_data: Field[ThreeDS2Data] = Field(ThreeDS2Data)
+
+
+class RefundResult(TransactionResult):
+    """Refund response."""
+
+    __slots__ = ()
+
+    parent_id: Field[str] = Field()
+
+
+class SettlementResult(TransactionResult):
+    """Settlement response."""
+
+    __slots__ = ()
+
+    parent_id: Field[str] = Field()
+
+
+class VoidResult(TransactionResult):
+    """Void response."""
+
+    __slots__ = ()
+
+    parent_id: Field[str] = Field()
+
+
+class ChargebackResult(TransactionResult):
+    """Chargeback response."""
+
+    __slots__ = ()
+
+    parent_id: Field[str] = Field()
+    reason_code: Field[str] = Field()
+    reason_message: Field[str] = Field()
+
+
+class PaymentLinkResult(Result):
+    """Payment link response."""
+
+    __slots__ = ()
+
+    id: Field[str] = Field()
+    url: Field[str] = Field()
+    amount: Field[Decimal] = Field(parse_decimal)
+    currency: Field[str] = Field()
+    country: Field[str] = Field()
+    order_id: Field[str] = Field()
+    description: Field[str] = Field()
+    expiration_date: Field[datetime] = Field(parse_datetime)
+    multiple_use: Field[bool] = Field()
+    enabled: Field[bool] = Field()
@@ -0,0 +1,338 @@
+"""
+Cardinity Retry Policy
+
+This module contains the RetryPolicy used by the HTTP clients to decide
+whether a failed request is retried and how long to wait before retrying.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Collection, Optional
+
+from .exceptions import APIError, DeadlineExceededError
+
+JITTER_NONE = "none"
+JITTER_FULL = "full"
+JITTER_DECORRELATED = "decorrelated"
+JITTER_MODES = (JITTER_NONE, JITTER_FULL, JITTER_DECORRELATED)
+
+#: Statuses worth retrying: rate limiting and transient server failures
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+#: Methods that can be repeated without changing the outcome
+DEFAULT_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+#: Statuses meaning the request was rejected before being processed, so even
+#: non-idempotent requests (payments) can be retried safely
+DEFAULT_NON_IDEMPOTENT_STATUSES = frozenset({429})
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if missing or malformed
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryState:
+    """Progress of the retries of a single logical request."""
+
+    __slots__ = (
+        "method",
+        "attempt",
+        "started",
+        "delay",
+        "idempotency_key",
+        "deadline",
+        "expires",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        started: float,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Initialize the state before the first attempt.
+
+        Args:
+            method: HTTP method of the request
+            started: Clock reading when the request was first sent
+            idempotency_key: Idempotency key sent with every attempt, if any
+            deadline: Seconds the whole request may take, if limited
+        """
+        self.method = method.upper()
+        self.attempt = 0
+        self.started = started
+        self.delay = 0.0
+        self.idempotency_key = idempotency_key
+        self.deadline = deadline
+        # Clock reading at which the deadline expires
+        self.expires = started + deadline if deadline is not None else None
+
+
+class RetryPolicy:
+    """Decides whether and when failed requests are retried.
+
+    Delays grow exponentially from ``backoff_base`` up to ``backoff_max`` and
+    are randomized so that clients failing at the same moment do not retry
+    in lockstep:
+
+    - ``"full"`` jitter waits a uniform random time between 0 and the
+      exponential delay.
+    - ``"decorrelated"`` jitter waits a uniform random time between
+      ``backoff_base`` and three times the previous delay.
+    - ``"none"`` waits exactly the exponential delay.
+
+    A Retry-After header sent with a 429 or 5xx response sets the minimum
+    wait; a Retry-After longer than ``retry_after_max`` (by default
+    ``backoff_max``) is not waited for and the error is raised instead.
+    Retrying stops after ``max_retries`` retries, or when the next wait
+    would exceed ``max_elapsed`` seconds since the first attempt.
+
+    Requests with an idempotent method are retried on connection errors and
+    on any status in ``retry_statuses``. Other requests (POST, PATCH) may
+    already have been processed when they fail, so by default they are only
+    retried when the server rejected them without processing them (statuses
+    in ``non_idempotent_statuses``) or when the connection could not be
+    established at all. With ``retry_idempotency_keyed``, requests carrying
+    an idempotency key are retried like idempotent ones; only enable it for
+    APIs that de-duplicate requests by that key.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        jitter: str = JITTER_FULL,
+        max_elapsed: Optional[float] = None,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        idempotent_methods: Collection[str] = DEFAULT_IDEMPOTENT_METHODS,
+        non_idempotent_statuses: Collection[int] = DEFAULT_NON_IDEMPOTENT_STATUSES,
+        retry_non_idempotent: bool = False,
+        retry_idempotency_keyed: bool = False,
+        respect_retry_after: bool = True,
+        retry_after_max: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            backoff_base: Delay in seconds before the first retry
+            backoff_max: Upper bound in seconds for a single backoff delay
+            jitter: Jitter mode, one of "full", "decorrelated" or "none"
+            max_elapsed: Give up once this many seconds would have passed
+                since the first attempt (None for no limit)
+            retry_statuses: HTTP statuses retried for idempotent methods
+            idempotent_methods: Methods that are safe to repeat
+            non_idempotent_statuses: HTTP statuses retried for any method
+            retry_non_idempotent: Retry every method like an idempotent one
+            retry_idempotency_keyed: Retry requests carrying an idempotency
+                key like idempotent ones
+            respect_retry_after: Wait at least the Retry-After delay sent by
+                the server
+            retry_after_max: Longest Retry-After delay waited for, in seconds
+                (defaults to backoff_max); longer ones give up the request
+            sleep: Function used by synchronous clients to wait
+            clock: Monotonic clock used to measure elapsed time
+            rng: Random number generator used for jitter
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+        if backoff_base < 0 or backoff_max < backoff_base:
+            raise ValueError("backoff delays must satisfy 0 <= base <= max")
+        if jitter not in JITTER_MODES:
+            raise ValueError(f"jitter must be one of {', '.join(JITTER_MODES)}")
+        if retry_after_max is not None and retry_after_max < 0:
+            raise ValueError("retry_after_max cannot be negative")
+
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.non_idempotent_statuses = frozenset(non_idempotent_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.retry_idempotency_keyed = retry_idempotency_keyed
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_max = (
+            retry_after_max if retry_after_max is not None else backoff_max
+        )
+        self.sleep = sleep
+        self.clock = clock
+        self._random = rng or random.Random()
+
+    def start(
+        self,
+        method: str,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> RetryState:
+        """Start tracking retries for a request.
+
+        Args:
+            method: HTTP method of the request
+            idempotency_key: Idempotency key sent with every attempt, if any
+            deadline: Seconds the request may take in total, across all
+                attempts and waits (None for no limit)
+
+        Returns:
+            RetryState: State to pass to next_delay() after each failure
+
+        Raises:
+            ValueError: If the deadline is not positive
+        """
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        return RetryState(method, self.clock(), idempotency_key, deadline)
+
+    def time_left(
+        self,
+        state: RetryState,
+        wait: float = 0.0,
+        cause: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """Check that the deadline of a request leaves time for an attempt.
+
+        Args:
+            state: Retry state of the request
+            wait: Seconds that will be waited before the attempt
+            cause: Error of the failed attempt, chained to the deadline error
+
+        Returns:
+            Optional[float]: Seconds left for the attempt after the wait, or
+                None if the request has no deadline
+
+        Raises:
+            DeadlineExceededError: If the deadline expires before the attempt
+                could start
+        """
+        if state.expires is None:
+            return None
+        left = state.expires - self.clock() - wait
+        if left > 0:
+            return left
+        error = DeadlineExceededError(
+            f"Deadline of {state.deadline:g}s exceeded", deadline=state.deadline
+        )
+        error.__cause__ = cause
+        raise error
+
+    def is_retryable(
+        self,
+        method: str,
+        error: Exception,
+        request_sent: bool = True,
+        idempotency_key: Optional[str] = None,
+    ) -> bool:
+        """Check whether a failure may be retried at all.
+
+        Args:
+            method: HTTP method of the request
+            error: API error or transport exception raised by the attempt
+            request_sent: False if the failure happened before the request
+                reached the server (e.g. connection refused)
+            idempotency_key: Idempotency key sent with the request, if any
+
+        Returns:
+            bool: True if the request may be retried
+        """
+        idempotent = (
+            self.retry_non_idempotent
+            or method.upper() in self.idempotent_methods
+            or (self.retry_idempotency_keyed and idempotency_key is not None)
+        )
+        if isinstance(error, APIError):
+            if error.status_code in self.non_idempotent_statuses:
+                return True
+            return idempotent and error.status_code in self.retry_statuses
+        # Transport failures
+        return idempotent or not request_sent
+
+    def backoff(self, state: RetryState) -> float:
+        """Compute the jittered backoff delay for the next retry.
+
+        Args:
+            state: Retry state, with the attempt number of the next retry
+
+        Returns:
+            float: Delay in seconds
+        """
+        if self.jitter == JITTER_DECORRELATED:
+            upper = max(self.backoff_base, state.delay * 3)
+            return min(self.backoff_max, self._random.uniform(self.backoff_base, upper))
+
+        # The exponent is capped so long retry sequences cannot overflow
+        exponent = min(state.attempt - 1, 64)
+        delay = min(self.backoff_max, self.backoff_base * 2.0**exponent)
+        if self.jitter == JITTER_FULL:
+            return self._random.uniform(0, delay)
+        return delay
+
+    def next_delay(
+        self, state: RetryState, error: Exception, request_sent: bool = True
+    ) -> Optional[float]:
+        """Decide whether to retry after a failed attempt.
+
+        Args:
+            state: Retry state of the request, updated in place
+            error: API error or transport exception raised by the attempt
+            request_sent: False if the failure happened before the request
+                reached the server
+
+        Returns:
+            Optional[float]: Seconds to wait before retrying, or None to give
+                up and raise the error
+        """
+        if state.attempt >= self.max_retries:
+            return None
+        if not self.is_retryable(
+            state.method, error, request_sent, state.idempotency_key
+        ):
+            return None
+
+        state.attempt += 1
+        delay = self.backoff(state)
+        retry_after = getattr(error, "retry_after", None)
+        if self.respect_retry_after and retry_after is not None:
+            if retry_after > self.retry_after_max:
+                # Not worth blocking the caller for; the server asked to wait
+                return None
+            delay = max(delay, retry_after)
+
+        if self.max_elapsed is not None:
+            if self.clock() - state.started + delay > self.max_elapsed:
+                return None
+
+        state.delay = delay
+        return delay
+
+    def __repr__(self) -> str:
+        """Return a string representation of the policy."""
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, "
+            f"backoff_base={self.backoff_base}, jitter='{self.jitter}')"
+        )
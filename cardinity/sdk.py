@@ -4,9 +4,10 @@ Cardinity SDK Main Interface
 This module provides the main Cardinity class for interacting with the Cardinity API.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Type, Union
 
 from .auth import CardinityAuth
+from .bulk import DEFAULT_MAX_CONCURRENCY, BulkResult, submit_bulk
 from .client import CardinityClient
 from .models import (
     FinalizePayment,
@@ -24,6 +25,17 @@ from .models import (
     UpdatePaymentLink,
     Void,
 )
+from .pagination import DEFAULT_PAGE_SIZE, Paginator
+from .results import (
+    ChargebackResult,
+    PaymentLinkResult,
+    PaymentResult,
+    RefundResult,
+    Result,
+    SettlementResult,
+    VoidResult,
+)
+from .tracing import traced
 
 
 class Cardinity:
@@ -47,6 +59,11 @@ class Cardinity:
                 currency="EUR",
                 description="Test payment"
             )
+
+    Responses are dictionaries by default. With ``typed_results=True`` they
+    are Result objects (PaymentResult, RefundResult, ...) exposing decoded
+    attributes such as ``payment.amount`` (a Decimal) while still supporting
+    dictionary-style reads.
     """
 
     def __init__(
@@ -54,6 +71,8 @@ class Cardinity:
         consumer_key: str,
         consumer_secret: str,
         base_url: str = "https://api.cardinity.com/v1",
+        typed_results: bool = False,
+        **client_options: Any,
     ) -> None:
         """Initialize the Cardinity SDK.
 
@@ -61,17 +80,49 @@ class Cardinity:
             consumer_key: Your Cardinity consumer key
             consumer_secret: Your Cardinity consumer secret
             base_url: Base URL for the Cardinity API (default: production)
+            typed_results: Return typed, lazily decoded result objects
+                (PaymentResult, RefundResult, ...) instead of dictionaries.
+                Results still support dictionary-style reads.
+            **client_options: Extra options passed to CardinityClient
+                (timeout, connect_timeout, read_timeout, deadline,
+                max_retries, pool_maxsize, pool_block, tcp_keepalive,
+                socket_options, ...)
         """
         self._auth = CardinityAuth(consumer_key, consumer_secret)
-        self._client = CardinityClient(self._auth, base_url)
+        self._client = CardinityClient(self._auth, base_url, **client_options)
+        self.typed_results = typed_results
+
+    def _wrap(self, result_class: Type[Result], data: Any) -> Any:
+        """Wrap a response in its result class if typed results are enabled.
+
+        Args:
+            result_class: Result class matching the endpoint
+            data: Parsed response
+
+        Returns:
+            Any: Result object(s), or the response unchanged
+        """
+        return result_class.wrap(data) if self.typed_results else data
 
     # Payment Operations
 
-    def create_payment(self, **kwargs: Any) -> Dict[str, Any]:
+    @traced
+    def create_payment(
+        self,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Create a new payment.
 
         Args:
             **kwargs: Payment data including amount, currency, description, etc.
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Payment response from the API
@@ -81,16 +132,28 @@ class Cardinity:
             APIError: If the API request fails
         """
         payment = Payment(**kwargs)
-        return self._client.execute_request(payment)
-
+        return self._wrap(
+            PaymentResult,
+            self._client.execute_request(
+                payment, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
     def get_payment(
-        self, payment_id: Optional[str] = None, limit: Optional[int] = None
+        self,
+        payment_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        *,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get payment information.
 
         Args:
             payment_id: Specific payment ID to retrieve (optional)
             limit: Limit for payment listing (optional, used when payment_id is None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Payment data or list of payments
@@ -99,14 +162,61 @@ class Cardinity:
             APIError: If the API request fails
         """
         get_payment = GetPayment(payment_id, limit)
-        return self._client.execute_request(get_payment)
+        return self._wrap(
+            PaymentResult, self._client.execute_request(get_payment, deadline=deadline)
+        )
 
-    def finalize_payment(self, payment_id: str, **kwargs: Any) -> Dict[str, Any]:
+    def iter_payments(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        cursor_param: Optional[str] = None,
+    ) -> Paginator:
+        """Iterate over the payments, fetching pages lazily.
+
+        The Cardinity API lists payments with a ``limit`` only and has no
+        pagination cursor, so by default one page of ``page_size`` payments
+        is listed, with a UserWarning if the page is full. Pass
+        ``cursor_param`` only for endpoints supporting a cursor.
+
+        Args:
+            page_size: Number of payments requested per page
+            cursor: ID of the last payment already processed, to resume an
+                interrupted iteration (see Paginator.cursor); requires
+                cursor_param
+            prefetch: Fetch the next page in the background
+            cursor_param: Query parameter carrying the cursor, if the endpoint
+                supports one
+
+        Returns:
+            Paginator: Iterator yielding payments one by one
+
+        Raises:
+            APIError: If a page request fails (raised during iteration)
+            ValueError: If a cursor is given without cursor_param
+        """
+        return Paginator(
+            self._client,
+            GetPayment().get_endpoint(),
+            page_size=page_size,
+            cursor=cursor,
+            cursor_param=cursor_param,
+            prefetch=prefetch,
+            item_factory=PaymentResult if self.typed_results else None,
+        )
+
+    @traced
+    def finalize_payment(
+        self, payment_id: str, *, deadline: Optional[float] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
         """Finalize a payment (complete 3D Secure authentication).
 
         Args:
             payment_id: ID of the payment to finalize
             **kwargs: Finalization data (authorize_data or cres)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Finalized payment response
@@ -116,13 +226,27 @@ class Cardinity:
             APIError: If the API request fails
         """
         finalize = FinalizePayment(payment_id, **kwargs)
-        return self._client.execute_request(finalize)
+        return self._wrap(
+            PaymentResult, self._client.execute_request(finalize, deadline=deadline)
+        )
 
-    def create_recurring_payment(self, **kwargs: Any) -> Dict[str, Any]:
+    @traced
+    def create_recurring_payment(
+        self,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Create a recurring payment.
 
         Args:
             **kwargs: Recurring payment data including payment_id reference
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Recurring payment response
@@ -132,16 +256,101 @@ class Cardinity:
             APIError: If the API request fails
         """
         recurring = RecurringPayment(**kwargs)
-        return self._client.execute_request(recurring)
+        return self._wrap(
+            PaymentResult,
+            self._client.execute_request(
+                recurring, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    # Bulk Operations
+
+    def create_payments_bulk(
+        self,
+        payments: Iterable[Dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BulkResult]:
+        """Create many payments concurrently.
+
+        Every payment is validated before any request is sent. Requests are
+        then dispatched over a pool of worker threads sharing this SDK's HTTP
+        client, and a BulkResult is produced for each item. A failing item
+        (invalid data or API error) is reported in its result and does not
+        stop the rest of the batch.
+
+        Example:
+            Create payments and collect the failures::
+
+                failed = [
+                    result
+                    for result in cardinity.create_payments_bulk(payments)
+                    if not result.ok
+                ]
+
+        Args:
+            payments: Payment data for each payment, as accepted by
+                create_payment()
+            max_concurrency: Maximum number of requests in flight at once
+            ordered: Yield results in input order if True, otherwise as soon
+                as each request completes
+
+        Returns:
+            Iterator[BulkResult]: Result for every payment
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        return submit_bulk(self._client, Payment, payments, max_concurrency, ordered)
+
+    def create_recurring_payments_bulk(
+        self,
+        payments: Iterable[Dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BulkResult]:
+        """Create many recurring payments concurrently.
+
+        Works like create_payments_bulk() for recurring payments.
+
+        Args:
+            payments: Recurring payment data for each payment, as accepted by
+                create_recurring_payment()
+            max_concurrency: Maximum number of requests in flight at once
+            ordered: Yield results in input order if True, otherwise as soon
+                as each request completes
+
+        Returns:
+            Iterator[BulkResult]: Result for every recurring payment
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        return submit_bulk(
+            self._client, RecurringPayment, payments, max_concurrency, ordered
+        )
 
     # Refund Operations
 
-    def create_refund(self, payment_id: str, **kwargs: Any) -> Dict[str, Any]:
+    @traced
+    def create_refund(
+        self,
+        payment_id: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Create a refund for a payment.
 
         Args:
             payment_id: ID of the payment to refund
             **kwargs: Refund data including amount and description
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Refund response
@@ -151,16 +360,28 @@ class Cardinity:
             APIError: If the API request fails
         """
         refund = Refund(payment_id, **kwargs)
-        return self._client.execute_request(refund)
-
+        return self._wrap(
+            RefundResult,
+            self._client.execute_request(
+                refund, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
     def get_refund(
-        self, payment_id: str, refund_id: Optional[str] = None
+        self,
+        payment_id: str,
+        refund_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get refund information.
 
         Args:
             payment_id: ID of the payment
             refund_id: Specific refund ID (optional, lists all if None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Refund data or list of refunds
@@ -169,16 +390,31 @@ class Cardinity:
             APIError: If the API request fails
         """
         get_refund = GetRefund(payment_id, refund_id)
-        return self._client.execute_request(get_refund)
+        return self._wrap(
+            RefundResult, self._client.execute_request(get_refund, deadline=deadline)
+        )
 
     # Settlement Operations
 
-    def create_settlement(self, payment_id: str, **kwargs: Any) -> Dict[str, Any]:
+    @traced
+    def create_settlement(
+        self,
+        payment_id: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Create a settlement for a payment.
 
         Args:
             payment_id: ID of the payment to settle
             **kwargs: Settlement data including amount and description
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Settlement response
@@ -188,16 +424,28 @@ class Cardinity:
             APIError: If the API request fails
         """
         settlement = Settlement(payment_id, **kwargs)
-        return self._client.execute_request(settlement)
-
+        return self._wrap(
+            SettlementResult,
+            self._client.execute_request(
+                settlement, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
     def get_settlement(
-        self, payment_id: str, settlement_id: Optional[str] = None
+        self,
+        payment_id: str,
+        settlement_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get settlement information.
 
         Args:
             payment_id: ID of the payment
             settlement_id: Specific settlement ID (optional, lists all if None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Settlement data or list of settlements
@@ -206,16 +454,32 @@ class Cardinity:
             APIError: If the API request fails
         """
         get_settlement = GetSettlement(payment_id, settlement_id)
-        return self._client.execute_request(get_settlement)
+        return self._wrap(
+            SettlementResult,
+            self._client.execute_request(get_settlement, deadline=deadline),
+        )
 
     # Void Operations
 
-    def create_void(self, payment_id: str, **kwargs: Any) -> Dict[str, Any]:
+    @traced
+    def create_void(
+        self,
+        payment_id: str,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Create a void for a payment.
 
         Args:
             payment_id: ID of the payment to void
             **kwargs: Optional void data including description
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Void response
@@ -224,16 +488,28 @@ class Cardinity:
             APIError: If the API request fails
         """
         void = Void(payment_id, **kwargs if kwargs else {})
-        return self._client.execute_request(void)
-
+        return self._wrap(
+            VoidResult,
+            self._client.execute_request(
+                void, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
     def get_void(
-        self, payment_id: str, void_id: Optional[str] = None
+        self,
+        payment_id: str,
+        void_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get void information.
 
         Args:
             payment_id: ID of the payment
             void_id: Specific void ID (optional, lists all if None)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Void data or list of voids
@@ -242,14 +518,19 @@ class Cardinity:
             APIError: If the API request fails
         """
         get_void = GetVoid(payment_id, void_id)
-        return self._client.execute_request(get_void)
+        return self._wrap(
+            VoidResult, self._client.execute_request(get_void, deadline=deadline)
+        )
 
     # Chargeback Operations
 
+    @traced
     def get_chargeback(
         self,
         payment_id_or_limit: Optional[Union[str, int]] = None,
         chargeback_id: Optional[str] = None,
+        *,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Get chargeback information.
 
@@ -261,6 +542,8 @@ class Cardinity:
         Args:
             payment_id_or_limit: Payment ID (str) or limit (int) for global listing
             chargeback_id: Specific chargeback ID (optional)
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Chargeback data or list of chargebacks
@@ -269,15 +552,72 @@ class Cardinity:
             APIError: If the API request fails
         """
         get_chargeback = GetChargeback(payment_id_or_limit, chargeback_id)
-        return self._client.execute_request(get_chargeback)
+        return self._wrap(
+            ChargebackResult,
+            self._client.execute_request(get_chargeback, deadline=deadline),
+        )
+
+    def iter_chargebacks(
+        self,
+        payment_id: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        prefetch: bool = True,
+        cursor_param: Optional[str] = None,
+    ) -> Paginator:
+        """Iterate over the chargebacks, fetching pages lazily.
+
+        The Cardinity API lists chargebacks with a ``limit`` only and has no
+        pagination cursor, so by default one page of ``page_size`` chargebacks
+        is listed, with a UserWarning if the page is full. Pass
+        ``cursor_param`` only for endpoints supporting a cursor.
+
+        Args:
+            payment_id: Only list the chargebacks of this payment (optional)
+            page_size: Number of chargebacks requested per page
+            cursor: ID of the last chargeback already processed, to resume an
+                interrupted iteration (see Paginator.cursor); requires
+                cursor_param
+            prefetch: Fetch the next page in the background
+            cursor_param: Query parameter carrying the cursor, if the endpoint
+                supports one
+
+        Returns:
+            Paginator: Iterator yielding chargebacks one by one
+
+        Raises:
+            APIError: If a page request fails (raised during iteration)
+            ValueError: If a cursor is given without cursor_param
+        """
+        return Paginator(
+            self._client,
+            GetChargeback(payment_id).get_endpoint(),
+            page_size=page_size,
+            cursor=cursor,
+            cursor_param=cursor_param,
+            prefetch=prefetch,
+            item_factory=ChargebackResult if self.typed_results else None,
+        )
 
     # Payment Link Operations
 
-    def create_payment_link(self, **kwargs: Any) -> Dict[str, Any]:
+    @traced
+    def create_payment_link(
+        self,
+        *,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         """Create a payment link.
 
         Args:
             **kwargs: Payment link data including amount, currency, description, etc.
+            idempotency_key: Key identifying the operation, so a repeated
+                submission is not processed twice (optional, see
+                CardinityClient.post())
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Payment link response
@@ -287,14 +627,24 @@ class Cardinity:
             APIError: If the API request fails
         """
         payment_link = PaymentLink(kwargs)
-        return self._client.execute_request(payment_link)
-
-    def update_payment_link(self, link_id: str, **kwargs: Any) -> Dict[str, Any]:
+        return self._wrap(
+            PaymentLinkResult,
+            self._client.execute_request(
+                payment_link, idempotency_key=idempotency_key, deadline=deadline
+            ),
+        )
+
+    @traced
+    def update_payment_link(
+        self, link_id: str, *, deadline: Optional[float] = None, **kwargs: Any
+    ) -> Dict[str, Any]:
         """Update an existing payment link.
 
         Args:
             link_id: ID of the payment link to update
             **kwargs: Update data including expiration_date and enabled status
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Updated payment link response
@@ -304,13 +654,21 @@ class Cardinity:
             APIError: If the API request fails
         """
         update_link = UpdatePaymentLink(link_id, kwargs)
-        return self._client.execute_request(update_link)
-
-    def get_payment_link(self, link_id: str) -> Dict[str, Any]:
+        return self._wrap(
+            PaymentLinkResult,
+            self._client.execute_request(update_link, deadline=deadline),
+        )
+
+    @traced
+    def get_payment_link(
+        self, link_id: str, *, deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Get payment link information.
 
         Args:
             link_id: ID of the payment link to retrieve
+            deadline: Seconds the call may take in total, across retries
+                (defaults to the client's deadline)
 
         Returns:
             Dict[str, Any]: Payment link data
@@ -319,7 +677,9 @@ class Cardinity:
             APIError: If the API request fails
         """
         get_link = GetPaymentLink(link_id)
-        return self._client.execute_request(get_link)
+        return self._wrap(
+            PaymentLinkResult, self._client.execute_request(get_link, deadline=deadline)
+        )
 
     # Utility Methods
 
@@ -331,6 +691,14 @@ class Cardinity:
         """
         return self._client
 
+    def get_pool_stats(self) -> Dict[str, int]:
+        """Get connection pool occupancy statistics.
+
+        Returns:
+            Dict[str, int]: Connections in use, idle, created and discarded
+        """
+        return self._client.get_pool_stats()
+
     def get_auth(self) -> CardinityAuth:
         """Get the authentication instance.
 
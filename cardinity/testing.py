@@ -0,0 +1,750 @@
+"""
+Cardinity Test Server
+
+This module contains an in-process stand-in for the Cardinity API, so that
+the SDK can be exercised and load tested end to end without network access.
+It emulates the payment, refund, settlement, void, chargeback and payment
+link endpoints with the test-mode behaviour of the real API (amounts above
+150.00 are declined, 3D Secure test cards require authentication) and can
+inject latency, server errors and rate limiting.
+
+Example:
+    Running the SDK against the stand-in::
+
+        with CardinityTestServer(latency=0.02, rate_limit_rate=0.05) as server:
+            cardinity = Cardinity("key", "secret", base_url=server.base_url)
+            payment = cardinity.create_payment(**payment_data)
+"""
+
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .idempotency import IDEMPOTENCY_HEADER
+from .validation import validate_amount_format, validate_card_number
+
+#: Amounts above this are declined, as in Cardinity's test mode
+DECLINE_THRESHOLD = Decimal("150.00")
+#: Test cards enrolled in 3D Secure
+THREEDS_CARDS = frozenset({"4200000000000000", "5454545454545454", "5454545454540109"})
+#: 3D Secure test cards whose authentication fails
+THREEDS_FAILING_CARDS = frozenset({"4200000000000000", "5454545454540109"})
+#: Descriptions that put a payment through the 3D Secure v2 test flow
+THREEDS2_DESCRIPTIONS = frozenset({"3ds2-pass", "3ds2-fail"})
+#: Description that makes refunds, settlements and voids fail
+FAIL_DESCRIPTION = "fail"
+DEFAULT_LIST_LIMIT = 10
+MAX_LIST_LIMIT = 100
+DEFAULT_MAX_IDEMPOTENT_REPLIES = 10_000
+
+# (HTTP status, JSON body, extra response headers)
+Reply = Tuple[int, Any, Dict[str, str]]
+
+
+class CardinityTestServer:
+    """In-process HTTP server emulating the Cardinity API.
+
+    The server listens on ``host``:``port`` (an ephemeral port by default)
+    in a background thread and keeps everything it creates in memory. Every
+    request can be delayed by ``latency`` seconds plus up to
+    ``latency_jitter`` more, answered with 429 (``rate_limit_rate``) or 503
+    (``error_rate``) instead of being processed, which makes retries, rate
+    limiting and circuit breaking observable. POST requests repeated with
+    the same Idempotency-Key header get the original response; the replies
+    of the ``max_idempotent_replies`` most recently used keys are kept.
+
+    Requests must carry an OAuth Authorization header; with
+    ``consumer_key`` set, it must be signed with that key.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: Optional[float] = 1,
+        payment_links_enabled: bool = True,
+        consumer_key: Optional[str] = None,
+        seed: Optional[int] = None,
+        max_idempotent_replies: int = DEFAULT_MAX_IDEMPOTENT_REPLIES,
+    ) -> None:
+        """Initialize the server without starting it.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one)
+            latency: Seconds every request is delayed by
+            latency_jitter: Maximum random extra delay in seconds
+            error_rate: Fraction of requests answered with 503
+            rate_limit_rate: Fraction of requests answered with 429
+            retry_after: Retry-After seconds sent with injected 429s and 503s,
+                rounded up to whole seconds (None to omit the header)
+            payment_links_enabled: Whether payment links can be created, as
+                on accounts with the feature enabled
+            consumer_key: Consumer key requests must be signed with (None
+                accepts any OAuth signature)
+            seed: Seed of the random fault injection, for reproducible runs
+            max_idempotent_replies: Maximum number of idempotency keys whose
+                reply is kept for replays
+
+        Raises:
+            ValueError: If a rate is outside [0, 1] or max_idempotent_replies
+                is less than 1
+        """
+        if not 0 <= error_rate <= 1 or not 0 <= rate_limit_rate <= 1:
+            raise ValueError("error_rate and rate_limit_rate must be in [0, 1]")
+        if max_idempotent_replies < 1:
+            raise ValueError("max_idempotent_replies must be at least 1")
+
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.payment_links_enabled = payment_links_enabled
+        self.consumer_key = consumer_key
+        self.max_idempotent_replies = max_idempotent_replies
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.reset()
+
+    # Lifecycle
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to the SDK (e.g. ``http://127.0.0.1:8123/v1``).
+
+        Raises:
+            RuntimeError: If the server is not running
+        """
+        if self._httpd is None:
+            raise RuntimeError("CardinityTestServer is not running")
+        port = self._httpd.server_address[1]
+        return f"http://{self.host}:{port}/v1"
+
+    def start(self) -> "CardinityTestServer":
+        """Start serving in a background thread.
+
+        Returns:
+            CardinityTestServer: The server itself
+        """
+        if self._httpd is None:
+            self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+            self._httpd.daemon_threads = True
+            self._httpd.stand_in = self  # type: ignore[attr-defined]
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                name="cardinity-test-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "CardinityTestServer":
+        """Start the server on entering a with block."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the server on leaving a with block."""
+        self.stop()
+
+    # State
+
+    def reset(self) -> None:
+        """Drop every stored resource and reset the counters."""
+        with self._lock:
+            self.payments: Dict[str, Dict[str, Any]] = {}
+            self._children: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+            self.payment_links: Dict[str, Dict[str, Any]] = {}
+            self._idempotent_replies: OrderedDict[str, Reply] = OrderedDict()
+            self.requests = 0
+            self.injected_errors = 0
+            self.injected_rate_limits = 0
+
+    def add_chargeback(
+        self,
+        payment_id: str,
+        amount: Optional[str] = None,
+        reason_code: str = "4837",
+        reason_message: str = "No cardholder authorization",
+    ) -> Dict[str, Any]:
+        """Record a chargeback against a payment, as issued by a card holder.
+
+        Args:
+            payment_id: ID of the charged back payment
+            amount: Disputed amount (defaults to the payment amount)
+            reason_code: Card scheme reason code
+            reason_message: Description of the reason code
+
+        Returns:
+            Dict[str, Any]: The stored chargeback
+
+        Raises:
+            KeyError: If the payment does not exist
+        """
+        with self._lock:
+            payment = self.payments[payment_id]
+            chargeback = self._transaction(
+                "chargeback",
+                payment,
+                amount or payment["amount"],
+                "approved",
+                description="Chargeback",
+            )
+            chargeback["reason_code"] = reason_code
+            chargeback["reason_message"] = reason_message
+            self._children[payment_id]["chargebacks"][chargeback["id"]] = chargeback
+            return dict(chargeback)
+
+    def stats(self) -> Dict[str, int]:
+        """Get the request counters.
+
+        Returns:
+            Dict[str, int]: Numbers of requests received, 503s and 429s
+                injected, and stored payments
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "injected_errors": self.injected_errors,
+                "injected_rate_limits": self.injected_rate_limits,
+                "payments": len(self.payments),
+            }
+
+    # Request handling
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Reply:
+        """Answer one API request.
+
+        This is what the HTTP server runs for every request; it can also be
+        called directly to test the emulation without sockets.
+
+        Args:
+            method: HTTP method
+            path: Request path with query string (e.g. ``/v1/payments?limit=5``)
+            body: Raw request body
+            headers: Request headers
+
+        Returns:
+            Tuple[int, Any, Dict[str, str]]: Status, JSON body and extra
+                response headers
+        """
+        headers = {key.lower(): value for key, value in (headers or {}).items()}
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            roll = self._random.random()
+        if delay > 0:
+            time.sleep(delay)
+
+        fault = self._inject_fault(roll)
+        if fault is not None:
+            return fault
+
+        authorization = headers.get("authorization", "")
+        if not authorization.startswith("OAuth ") or (
+            self.consumer_key is not None
+            and f'oauth_consumer_key="{self.consumer_key}"' not in authorization
+        ):
+            return _error(401, "Unauthorized", "Invalid OAuth credentials")
+
+        key = headers.get(IDEMPOTENCY_HEADER.lower())
+        if method == "POST" and key:
+            with self._lock:
+                replay = self._idempotent_replies.get(key)
+                if replay is not None:
+                    self._idempotent_replies.move_to_end(key)
+            if replay is not None:
+                return replay
+
+        reply = self._route(method, path, body)
+        if method == "POST" and key and reply[0] < 500:
+            with self._lock:
+                self._idempotent_replies[key] = reply
+                self._idempotent_replies.move_to_end(key)
+                while len(self._idempotent_replies) > self.max_idempotent_replies:
+                    self._idempotent_replies.popitem(last=False)
+        return reply
+
+    def _inject_fault(self, roll: float) -> Optional[Reply]:
+        """Pick an injected 429 or 503 reply for a random roll in [0, 1)."""
+        headers = {}
+        if self.retry_after is not None:
+            # The header only carries whole seconds; never shorten the delay
+            headers["Retry-After"] = str(math.ceil(self.retry_after))
+        if roll < self.rate_limit_rate:
+            with self._lock:
+                self.injected_rate_limits += 1
+            status, body, _ = _error(429, "Too Many Requests", "Rate limit exceeded")
+            return status, body, headers
+        if roll < self.rate_limit_rate + self.error_rate:
+            with self._lock:
+                self.injected_errors += 1
+            status, body, _ = _error(
+                503, "Service Unavailable", "Service temporarily unavailable"
+            )
+            return status, body, headers
+        return None
+
+    def _route(self, method: str, path: str, body: Optional[bytes]) -> Reply:
+        """Dispatch a request to the handler of its endpoint."""
+        url = urlsplit(path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        segments = [segment for segment in url.path.split("/") if segment]
+        if segments[:1] == ["v1"]:
+            segments = segments[1:]
+
+        data: Dict[str, Any] = {}
+        if method in ("POST", "PATCH"):
+            try:
+                data = json.loads(body or b"{}")
+            except ValueError:
+                return _error(400, "Bad Request", "Request body is not valid JSON")
+            if not isinstance(data, dict):
+                return _error(400, "Bad Request", "Request body must be an object")
+
+        with self._lock:
+            if segments[:1] == ["paymentLinks"]:
+                return self._payment_links(method, segments[1:], data)
+            if segments[:1] != ["payments"]:
+                return _not_found()
+            if segments[1:2] == ["chargebacks"] and len(segments) == 2:
+                if method != "GET":
+                    return _method_not_allowed()
+                chargebacks = [
+                    chargeback
+                    for children in self._children.values()
+                    for chargeback in children["chargebacks"].values()
+                ]
+                return _listing(chargebacks, params)
+            return self._payments(method, segments[1:], data, params)
+
+    # Payments
+
+    def _payments(
+        self,
+        method: str,
+        segments: List[str],
+        data: Dict[str, Any],
+        params: Dict[str, str],
+    ) -> Reply:
+        """Handle /payments and everything below it."""
+        if not segments:
+            if method == "GET":
+                # Newest first, as listed by the API
+                return _listing(list(reversed(self.payments.values())), params)
+            if method == "POST":
+                return self._create_payment(data)
+            return _method_not_allowed()
+
+        payment = self.payments.get(segments[0])
+        if payment is None:
+            return _not_found()
+        if len(segments) == 1:
+            if method == "GET":
+                return 200, _public(payment), {}
+            if method == "PATCH":
+                return self._finalize_payment(payment, data)
+            return _method_not_allowed()
+
+        kind = segments[1]
+        children = self._children[payment["id"]].get(kind)
+        if children is None:
+            return _not_found()
+        if len(segments) == 3:
+            child = children.get(segments[2])
+            if method != "GET":
+                return _method_not_allowed()
+            return (200, child, {}) if child is not None else _not_found()
+        if method == "GET":
+            return 200, list(children.values()), {}
+        if method == "POST" and kind != "chargebacks":
+            return self._create_child(kind, payment, data)
+        return _method_not_allowed()
+
+    def _create_payment(self, data: Dict[str, Any]) -> Reply:
+        """Create a card or recurring payment."""
+        errors = _validate_amount(data)
+        instrument = data.get("payment_instrument")
+        if not isinstance(instrument, dict):
+            errors.append(_field_error("payment_instrument", None, "is required"))
+            return _validation_failed(errors)
+
+        if data.get("payment_method") == "recurring":
+            parent = self.payments.get(str(instrument.get("payment_id")))
+            if parent is None:
+                errors.append(
+                    _field_error(
+                        "payment_instrument.payment_id",
+                        instrument.get("payment_id"),
+                        "payment not found",
+                    )
+                )
+                return _validation_failed(errors)
+            pan = parent["_pan"]
+            card = dict(parent["payment_instrument"])
+        else:
+            pan = instrument.get("pan")
+            problem = validate_card_number(pan)
+            if problem is None and not _luhn_valid(str(pan)):
+                problem = "Card number is invalid"
+            if problem:
+                errors.append(_field_error("payment_instrument.pan", pan, problem))
+            card = {
+                "card_brand": _card_brand(pan),
+                "pan": str(pan)[-4:],
+                "exp_year": instrument.get("exp_year"),
+                "exp_month": instrument.get("exp_month"),
+                "holder": instrument.get("holder"),
+            }
+        if errors:
+            return _validation_failed(errors)
+
+        settle = data.get("settle", True) is not False
+        payment = {
+            "id": str(uuid.uuid4()),
+            "amount": data["amount"],
+            "currency": data["currency"],
+            "created": _now(),
+            "type": "purchase" if settle else "authorization",
+            "live": False,
+            "settle": settle,
+            "status": "approved",
+            "order_id": data.get("order_id"),
+            "description": data.get("description"),
+            "country": data.get("country"),
+            "payment_method": data.get("payment_method", "card"),
+            "payment_instrument": card,
+        }
+        status = 201
+        recurring = payment["payment_method"] == "recurring"
+        if Decimal(data["amount"]) > DECLINE_THRESHOLD:
+            payment["status"] = "declined"
+            payment["error"] = "33333: Do Not Honor"
+            status = 402
+        elif not recurring and (
+            pan in THREEDS_CARDS or data.get("description") in THREEDS2_DESCRIPTIONS
+        ):
+            payment["status"] = "pending"
+            status = 202
+            if "threeds2_data" in data:
+                payment["threeds2_data"] = {
+                    "acs_url": "https://acs.cardinity.test/3ds2",
+                    "creq": uuid.uuid4().hex,
+                }
+            else:
+                payment["authorization_information"] = {
+                    "url": "https://acs.cardinity.test/3ds",
+                    "data": uuid.uuid4().hex,
+                }
+
+        self._store_payment(payment, pan)
+        return status, _public(payment), {}
+
+    def _finalize_payment(self, payment: Dict[str, Any], data: Dict[str, Any]) -> Reply:
+        """Complete the 3D Secure authentication of a pending payment."""
+        if payment["status"] != "pending":
+            return _error(400, "Bad Request", "Payment is not pending")
+        answer = data.get("cres", data.get("authorize_data"))
+        if not isinstance(answer, str) or not answer:
+            return _validation_failed(
+                [_field_error("cres", answer, "cres or authorize_data is required")]
+            )
+
+        payment.pop("threeds2_data", None)
+        payment.pop("authorization_information", None)
+        if FAIL_DESCRIPTION in answer or payment["_pan"] in THREEDS_FAILING_CARDS:
+            payment["status"] = "declined"
+            payment["error"] = "3D Secure Authorization Failed"
+            return 402, _public(payment), {}
+        payment["status"] = "approved"
+        return 200, _public(payment), {}
+
+    def _store_payment(self, payment: Dict[str, Any], pan: Any) -> None:
+        """Store a payment and make room for its transactions."""
+        payment["_pan"] = pan
+        self.payments[payment["id"]] = payment
+        self._children[payment["id"]] = {
+            "refunds": {},
+            "settlements": {},
+            "voids": {},
+            "chargebacks": {},
+        }
+
+    # Refunds, settlements and voids
+
+    def _create_child(
+        self, kind: str, payment: Dict[str, Any], data: Dict[str, Any]
+    ) -> Reply:
+        """Create a refund, settlement or void of a payment."""
+        if payment["status"] != "approved":
+            return _error(400, "Bad Request", "Payment is not approved")
+
+        if kind == "voids":
+            amount = payment["amount"]
+        else:
+            errors = _validate_amount(data, currency=False)
+            if errors:
+                return _validation_failed(errors)
+            amount = data["amount"]
+            used = sum(
+                Decimal(child["amount"])
+                for child in self._children[payment["id"]][kind].values()
+                if child["status"] == "approved"
+            )
+            if used + Decimal(amount) > Decimal(payment["amount"]):
+                return _validation_failed(
+                    [_field_error("amount", amount, "exceeds the payment amount")]
+                )
+
+        status = (
+            "declined" if data.get("description") == FAIL_DESCRIPTION else "approved"
+        )
+        child = self._transaction(
+            kind[:-1], payment, amount, status, data.get("description")
+        )
+        self._children[payment["id"]][kind][child["id"]] = child
+        if status == "declined":
+            child["error"] = f"33333: {kind[:-1].capitalize()} declined"
+            return 402, child, {}
+        return 201, child, {}
+
+    def _transaction(
+        self,
+        kind: str,
+        payment: Dict[str, Any],
+        amount: str,
+        status: str,
+        description: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build a transaction made against a payment."""
+        return {
+            "id": str(uuid.uuid4()),
+            "amount": amount,
+            "currency": payment["currency"],
+            "created": _now(),
+            "type": kind,
+            "live": False,
+            "parent_id": payment["id"],
+            "status": status,
+            "order_id": payment.get("order_id"),
+            "description": description,
+        }
+
+    # Payment links
+
+    def _payment_links(
+        self, method: str, segments: List[str], data: Dict[str, Any]
+    ) -> Reply:
+        """Handle /paymentLinks and /paymentLinks/<id>."""
+        if not segments:
+            if method != "POST":
+                return _method_not_allowed()
+            if not self.payment_links_enabled:
+                return _error(
+                    400, "Bad Request", "Payment links are disabled for this account"
+                )
+            errors = _validate_amount(data)
+            if not data.get("description"):
+                errors.append(_field_error("description", None, "is required"))
+            if errors:
+                return _validation_failed(errors)
+            link_id = uuid.uuid4().hex
+            link = {
+                "id": link_id,
+                "url": f"https://checkout.cardinity.test/link/{link_id}",
+                "amount": data["amount"],
+                "currency": data["currency"],
+                "country": data.get("country"),
+                "order_id": data.get("order_id"),
+                "description": data["description"],
+                "expiration_date": data.get("expiration_date"),
+                "multiple_use": bool(data.get("multiple_use", False)),
+                "enabled": True,
+            }
+            self.payment_links[link_id] = link
+            return 201, link, {}
+
+        if len(segments) > 1 or segments[0] not in self.payment_links:
+            return _not_found()
+        link = self.payment_links[segments[0]]
+        if method == "GET":
+            return 200, link, {}
+        if method == "PATCH":
+            for field in ("expiration_date", "enabled"):
+                if field in data:
+                    link[field] = data[field]
+            return 200, link, {}
+        return _method_not_allowed()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP request handler forwarding requests to the CardinityTestServer."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    # Headers and body are written separately; without TCP_NODELAY every
+    # response would wait out the client's delayed ACK
+    disable_nagle_algorithm = True
+    server_version = "CardinityTestServer"
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        stand_in: CardinityTestServer = self.server.stand_in  # type: ignore[attr-defined]
+        status, payload, headers = stand_in.handle(
+            self.command, self.path, body, dict(self.headers.items())
+        )
+        content = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch()
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        self._dispatch()
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        self._dispatch()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep request logs out of test and benchmark output."""
+
+
+def _now() -> str:
+    """Return the current time in the API's timestamp format."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _public(payment: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a payment without the fields kept for emulation only."""
+    return {key: value for key, value in payment.items() if not key.startswith("_")}
+
+
+def _luhn_valid(pan: str) -> bool:
+    """Check the Luhn checksum of a card number."""
+    digits = [int(digit) for digit in pan if digit.isdigit()]
+    for index in range(len(digits) - 2, -1, -2):
+        digits[index] = (
+            digits[index] * 2 - 9 if digits[index] > 4 else digits[index] * 2
+        )
+    return sum(digits) % 10 == 0
+
+
+def _card_brand(pan: Any) -> str:
+    """Guess the card brand from the first digit of a card number."""
+    return {"4": "Visa", "5": "MasterCard"}.get(str(pan)[:1], "Unknown")
+
+
+def _listing(items: List[Dict[str, Any]], params: Dict[str, str]) -> Reply:
+    """Return a page of a listing, honouring the limit and after parameters.
+
+    The ``after`` cursor is an extension of the emulation (the real API only
+    takes ``limit``), for exercising Paginator's opt-in cursor_param.
+    """
+    try:
+        limit = min(int(params.get("limit", DEFAULT_LIST_LIMIT)), MAX_LIST_LIMIT)
+    except ValueError:
+        return _validation_failed(
+            [_field_error("limit", params["limit"], "must be a number")]
+        )
+    after = params.get("after")
+    if after is not None:
+        ids = [item["id"] for item in items]
+        items = items[ids.index(after) + 1 :] if after in ids else []
+    return 200, [_public(item) for item in items[:limit]], {}
+
+
+def _validate_amount(data: Dict[str, Any], currency: bool = True) -> List[Dict]:
+    """Validate the amount (and currency) fields of a request."""
+    errors = []
+    problem = validate_amount_format(data.get("amount"))
+    if problem:
+        errors.append(_field_error("amount", data.get("amount"), problem))
+    else:
+        try:
+            Decimal(data["amount"])
+        except InvalidOperation:  # pragma: no cover - excluded by the format
+            errors.append(_field_error("amount", data["amount"], "is invalid"))
+    if currency:
+        code = data.get("currency")
+        if not isinstance(code, str) or len(code) != 3 or not code.isupper():
+            errors.append(_field_error("currency", code, "must be an ISO 4217 code"))
+    return errors
+
+
+def _field_error(field: str, rejected: Any, message: str) -> Dict[str, Any]:
+    """Build one entry of a validation error response."""
+    return {"field": field, "rejected": rejected, "message": message}
+
+
+def _validation_failed(errors: List[Dict[str, Any]]) -> Reply:
+    """Build a 400 validation error response."""
+    status, body, headers = _error(
+        400,
+        "Validation Failed",
+        f"The content you've sent contains {len(errors)} validation errors.",
+    )
+    body["errors"] = errors
+    return status, body, headers
+
+
+def _not_found() -> Reply:
+    """Build a 404 response."""
+    return _error(404, "Not Found", "The requested resource could not be found")
+
+
+def _method_not_allowed() -> Reply:
+    """Build a 405 response."""
+    return _error(405, "Method Not Allowed", "Method not allowed on this resource")
+
+
+def _error(status: int, title: str, detail: str) -> Reply:
+    """Build an error response in the API's problem format."""
+    body = {
+        "type": "https://developers.cardinity.com/api/v1/",
+        "title": title,
+        "status": status,
+        "detail": detail,
+    }
+    return status, body, {}
@@ -0,0 +1,222 @@
+"""
+Cardinity Tracing
+
+This module contains the optional OpenTelemetry integration. With tracing
+enabled, every SDK operation (create_payment, create_refund, ...) is traced
+as a span, with child spans for model validation, each HTTP attempt, OAuth
+signing and response parsing, and outgoing requests carry W3C trace context
+headers. The module imports without OpenTelemetry, which is installable with
+``pip install cardinity-python[tracing]``; tracing is then a no-op.
+"""
+
+import functools
+import inspect
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover - exercised only without opentelemetry
+    propagate = None  # type: ignore[assignment]
+    trace = None  # type: ignore[assignment]
+
+#: Name of the tracer used when none is given
+TRACER_NAME = "cardinity"
+TRACEPARENT_HEADER = "traceparent"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Tracing of the SDK operation running in the current thread or task, so
+# models validated during the operation can add their span to it
+_active: ContextVar[Optional["Tracing"]] = ContextVar("cardinity_tracing", default=None)
+
+
+class Tracing:
+    """OpenTelemetry tracing of Cardinity SDK operations.
+
+    Pass an instance as the ``tracing`` option of a client or SDK. Spans are
+    started with the tracer's ``start_as_current_span()``, so any
+    OpenTelemetry tracer (or an object with a compatible method) can be used;
+    exceptions are recorded on the spans they escape from.
+
+    Without a tracer and without OpenTelemetry installed, tracing is disabled
+    and the clients skip it entirely.
+    """
+
+    def __init__(self, tracer: Any = None, propagate_context: bool = True) -> None:
+        """Initialize tracing.
+
+        Args:
+            tracer: Tracer to start spans with; defaults to the "cardinity"
+                tracer of OpenTelemetry's global tracer provider
+            propagate_context: Send the trace context of each HTTP attempt in
+                the request headers (``traceparent``), so the API side can
+                join the trace
+        """
+        if tracer is None and trace is not None:
+            tracer = trace.get_tracer(TRACER_NAME)
+        self.tracer = tracer
+        self.propagate_context = propagate_context
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return self.tracer is not None
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        client: bool = False,
+    ) -> Iterator[Any]:
+        """Trace a block of code as a span, child of the current span.
+
+        Args:
+            name: Span name
+            attributes: Span attributes
+            client: Mark the span as an outgoing request (SpanKind.CLIENT)
+
+        Yields:
+            Any: The span, or None while tracing is disabled
+        """
+        if self.tracer is None:
+            yield None
+            return
+        options: Dict[str, Any] = {}
+        if attributes:
+            options["attributes"] = attributes
+        if client and trace is not None:
+            options["kind"] = trace.SpanKind.CLIENT
+        with self.tracer.start_as_current_span(name, **options) as span:
+            yield span
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[Any]:
+        """Trace an SDK operation as the parent span of its validation and
+        requests.
+
+        Args:
+            name: Operation name (e.g. ``Cardinity.create_payment``)
+
+        Yields:
+            Any: The span, or None while tracing is disabled
+        """
+        token = _active.set(self)
+        try:
+            with self.span(name) as span:
+                yield span
+        finally:
+            _active.reset(token)
+
+    def inject(self, headers: Dict[str, str], span: Any = None) -> None:
+        """Add the current trace context to request headers.
+
+        OpenTelemetry's configured propagators are used when it is installed;
+        otherwise a W3C ``traceparent`` header is built from the span.
+
+        Args:
+            headers: Request headers to update
+            span: Span of the request, for the fallback without OpenTelemetry
+        """
+        if not self.propagate_context:
+            return
+        if propagate is not None:
+            propagate.inject(headers)
+            return
+        context = span.get_span_context() if span is not None else None
+        if context is not None and context.trace_id:
+            headers[TRACEPARENT_HEADER] = (
+                f"00-{context.trace_id:032x}-{context.span_id:016x}-"
+                f"{int(context.trace_flags):02x}"
+            )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the tracing."""
+        return f"Tracing(enabled={self.enabled})"
+
+
+class _DisabledTracing(Tracing):
+    """Tracing that records nothing, used by clients without tracing."""
+
+    def __init__(self) -> None:
+        self.tracer = None
+        self.propagate_context = False
+
+
+#: Tracing that records nothing
+DISABLED = _DisabledTracing()
+
+
+def active_tracing() -> Optional[Tracing]:
+    """Return the tracing of the SDK operation running in this context.
+
+    Returns:
+        Optional[Tracing]: Tracing of the current operation, or None outside
+            traced operations
+    """
+    return _active.get()
+
+
+def validation_span(model: Any) -> ContextManager[Any]:
+    """Trace the validation of a model if it runs within a traced operation.
+
+    Args:
+        model: Model being validated
+
+    Returns:
+        ContextManager[Any]: Span context manager (a no-op outside traced
+            operations)
+    """
+    tracing = _active.get()
+    if tracing is None:
+        return nullcontext()
+    return tracing.span(f"{model.__class__.__name__}.validate")
+
+
+def traced(method: _F) -> _F:
+    """Trace an SDK method as an operation span.
+
+    For methods of Cardinity and AsyncCardinity: the span is recorded with
+    the tracing of the SDK's client, and the method runs untouched when the
+    client has no tracing.
+
+    Args:
+        method: Synchronous or asynchronous SDK method
+
+    Returns:
+        Callable: Wrapped method
+    """
+    name = method.__qualname__
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            tracing = self._client.tracing
+            if tracing is None:
+                return await method(self, *args, **kwargs)
+            with tracing.operation(name):
+                return await method(self, *args, **kwargs)
+
+        return cast(_F, async_wrapper)
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        tracing = self._client.tracing
+        if tracing is None:
+            return method(self, *args, **kwargs)
+        with tracing.operation(name):
+            return method(self, *args, **kwargs)
+
+    return cast(_F, wrapper)
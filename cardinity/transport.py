@@ -0,0 +1,253 @@
+"""
+Cardinity HTTP Transport
+
+This module contains the requests transport adapter used by CardinityClient.
+It makes the urllib3 connection pool configurable (size, blocking, TCP
+keep-alive and socket options) and keeps occupancy statistics for it.
+"""
+
+import queue
+import socket
+import threading
+import weakref
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.poolmanager import PoolManager, pool_classes_by_scheme
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_POOL_BLOCK = False
+
+# Keep-alive probing: start after 60s idle, probe every 10s, give up after 5
+KEEPALIVE_IDLE = 60
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 5
+
+SocketOption = Tuple[int, int, int]
+
+
+def keepalive_socket_options(
+    idle: int = KEEPALIVE_IDLE,
+    interval: int = KEEPALIVE_INTERVAL,
+    count: int = KEEPALIVE_COUNT,
+) -> List[SocketOption]:
+    """Build socket options enabling TCP keep-alive probes.
+
+    The probe timing options are only added on platforms that support them.
+
+    Args:
+        idle: Seconds a connection is idle before probes are sent
+        interval: Seconds between probes
+        count: Unanswered probes before the connection is dropped
+
+    Returns:
+        List[SocketOption]: urllib3 default socket options plus keep-alive
+    """
+    options: List[SocketOption] = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPALIVE", idle),  # macOS name for TCP_KEEPIDLE
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class PoolStats:
+    """Thread-safe occupancy statistics for a set of connection pools.
+
+    Counts connections checked out of the pools (in use), opened (created)
+    and closed because their pool was already full when they were returned
+    (discarded). Idle connections are read from the pools when a snapshot is
+    taken.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self._lock = threading.Lock()
+        self._pools: weakref.WeakSet[HTTPConnectionPool] = weakref.WeakSet()
+        self.in_use = 0
+        self.created = 0
+        self.discarded = 0
+
+    def register(self, pool: HTTPConnectionPool) -> None:
+        """Track idle connections of a pool.
+
+        Args:
+            pool: Connection pool reporting to these statistics
+        """
+        with self._lock:
+            self._pools.add(pool)
+
+    def record(self, in_use: int = 0, created: int = 0, discarded: int = 0) -> None:
+        """Update the counters.
+
+        Args:
+            in_use: Change in the number of checked-out connections
+            created: Number of newly opened connections
+            discarded: Number of connections discarded on return
+        """
+        with self._lock:
+            self.in_use += in_use
+            self.created += created
+            self.discarded += discarded
+
+    @property
+    def idle(self) -> int:
+        """Number of open connections waiting in the pools."""
+        with self._lock:
+            pools = list(self._pools)
+        idle = 0
+        for pool in pools:
+            pool_queue = pool.pool
+            if pool_queue is not None:
+                # Unused slots are filled with None placeholders
+                idle += sum(1 for conn in list(pool_queue.queue) if conn is not None)
+        return idle
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the current statistics.
+
+        Returns:
+            Dict[str, int]: Counts of in_use, idle, created and discarded
+                connections
+        """
+        idle = self.idle
+        with self._lock:
+            return {
+                "in_use": self.in_use,
+                "idle": idle,
+                "created": self.created,
+                "discarded": self.discarded,
+            }
+
+    def __repr__(self) -> str:
+        """Return a string representation of the statistics."""
+        fields = ", ".join(f"{key}={value}" for key, value in self.snapshot().items())
+        return f"PoolStats({fields})"
+
+
+class _TrackingLifoQueue(queue.LifoQueue):
+    """Pool queue reporting connections that do not fit back into it."""
+
+    stats: Optional[PoolStats] = None
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        """Put a connection back, counting it as discarded if the queue is full."""
+        try:
+            super().put(item, block, timeout)
+        except queue.Full:
+            if item is not None and self.stats is not None:
+                self.stats.record(discarded=1)
+            raise
+
+
+class _TrackingPoolMixin:
+    """Connection pool mixin reporting checkouts and new connections."""
+
+    QueueCls = _TrackingLifoQueue
+
+    def __init__(self, *args: Any, stats: PoolStats, **kwargs: Any) -> None:
+        self._stats = stats
+        super().__init__(*args, **kwargs)  # type: ignore[call-arg]
+        self.pool.stats = stats  # type: ignore[attr-defined]
+        stats.register(self)  # type: ignore[arg-type]
+
+    def _new_conn(self) -> Any:
+        self._stats.record(created=1)
+        return super()._new_conn()  # type: ignore[misc]
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        self._stats.record(in_use=1)
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        self._stats.record(in_use=-1)
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class TrackedHTTPConnectionPool(_TrackingPoolMixin, HTTPConnectionPool):
+    """HTTP connection pool reporting to PoolStats."""
+
+
+class TrackedHTTPSConnectionPool(_TrackingPoolMixin, HTTPSConnectionPool):
+    """HTTPS connection pool reporting to PoolStats."""
+
+
+class CardinityHTTPAdapter(HTTPAdapter):
+    """requests transport adapter with a configurable, instrumented pool.
+
+    Retries are left to CardinityClient, so the adapter itself never retries.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options"]
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = DEFAULT_POOL_BLOCK,
+        socket_options: Optional[Sequence[SocketOption]] = None,
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept per host
+            pool_block: Wait for a free connection when the pool is
+                exhausted instead of opening (and later discarding) an extra
+                one
+            socket_options: Socket options set on every new connection, or
+                None for urllib3's defaults
+        """
+        self.stats = PoolStats()
+        self.socket_options = list(socket_options) if socket_options else None
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        """Create the pool manager with tracked pools and socket options."""
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self._track(self.poolmanager)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        """Create proxy managers with tracked pools and socket options."""
+        if self.socket_options is not None:
+            proxy_kwargs.setdefault("socket_options", self.socket_options)
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        self._track(manager)
+        return manager
+
+    def _track(self, manager: PoolManager) -> None:
+        """Make a pool manager create pools reporting to this adapter's stats.
+
+        Managers with their own pool classes (e.g. SOCKS proxies) are left
+        untouched.
+        """
+        if manager.pool_classes_by_scheme is not pool_classes_by_scheme:
+            return
+        pool_classes: Dict[str, Any] = {
+            "http": partial(TrackedHTTPConnectionPool, stats=self.stats),
+            "https": partial(TrackedHTTPSConnectionPool, stats=self.stats),
+        }
+        manager.pool_classes_by_scheme = pool_classes
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the adapter after unpickling, with fresh statistics."""
+        self.stats = PoolStats()
+        super().__setstate__(state)  # type: ignore[misc]
@@ -6,4 +6,16 @@ This package contains utility functions and helpers.
 
 from typing import List
 
-__all__: List[str] = []
+from .endpoints import ENDPOINT_FAMILIES, endpoint_family, endpoint_template
+from .frozen import FrozenDict, FrozenList, FrozenSetList, freeze, thaw
+
+__all__: List[str] = [
+    "ENDPOINT_FAMILIES",
+    "endpoint_family",
+    "endpoint_template",
+    "FrozenDict",
+    "FrozenList",
+    "FrozenSetList",
+    "freeze",
+    "thaw",
+]
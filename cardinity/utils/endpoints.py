@@ -0,0 +1,49 @@
+"""
+Cardinity Endpoint Helpers
+
+This module contains helpers for classifying Cardinity API endpoint paths.
+"""
+
+#: Resource families of the Cardinity API, as they appear in endpoint paths
+ENDPOINT_FAMILIES = frozenset(
+    {"payments", "refunds", "settlements", "voids", "chargebacks", "paymentLinks"}
+)
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Return the resource family an endpoint belongs to.
+
+    The family is the innermost known resource in the path, so
+    ``/payments/{id}/refunds/{refund_id}`` belongs to ``refunds`` and
+    ``/payments/{id}`` to ``payments``. Query strings are ignored.
+
+    Args:
+        endpoint: API endpoint path (e.g., "/payments/123/refunds")
+
+    Returns:
+        str: Family name, or the first path segment for unknown paths
+    """
+    segments = [segment for segment in endpoint.split("?", 1)[0].split("/") if segment]
+    for segment in reversed(segments):
+        if segment in ENDPOINT_FAMILIES:
+            return segment
+    return segments[0] if segments else ""
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Return an endpoint path with its resource IDs replaced by ``{id}``.
+
+    Used to group requests by endpoint without one group per resource, so
+    ``/payments/123/refunds/456`` becomes ``/payments/{id}/refunds/{id}``.
+    Query strings are dropped.
+
+    Args:
+        endpoint: API endpoint path
+
+    Returns:
+        str: Endpoint template
+    """
+    segments = [segment for segment in endpoint.split("?", 1)[0].split("/") if segment]
+    return "/" + "/".join(
+        segment if segment in ENDPOINT_FAMILIES else "{id}" for segment in segments
+    )
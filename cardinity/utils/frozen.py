@@ -0,0 +1,160 @@
+"""
+Cardinity Read-Only Containers
+
+This module provides read-only dict and list types used for data that is
+built once and shared, such as the cached validation schemas.
+"""
+
+from typing import Any, NoReturn
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    """Reject any attempt to mutate a read-only container."""
+    raise TypeError(f"{self.__class__.__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """Read-only, hashable dictionary.
+
+    FrozenDict is a dict subclass, so it still passes isinstance(..., dict)
+    checks, compares equal to plain dicts and serializes like one. All
+    mutating methods raise TypeError; copy() returns a mutable plain dict.
+    """
+
+    __slots__ = ("_hash",)
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        """Return a hash of the items, computed once and cached."""
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self):
+        """Support copy and pickle without going through __setitem__."""
+        return (self.__class__, (dict(self),))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the dictionary."""
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """Read-only, hashable list.
+
+    FrozenList is a list subclass, so it still passes isinstance(..., list)
+    checks and compares equal to plain lists. All mutating methods raise
+    TypeError; copy() returns a mutable plain list.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        """Return a hash of the items."""
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        """Support copy and pickle without going through mutating methods."""
+        return (self.__class__, (list(self),))
+
+    def __repr__(self) -> str:
+        """Return a string representation of the list."""
+        return f"{self.__class__.__name__}({list.__repr__(self)})"
+
+
+class FrozenSetList(FrozenList):
+    """Read-only list backed by a frozenset for O(1) membership tests.
+
+    Keeps the order and list equality of the values it was built from, while
+    ``in`` checks go through a frozenset instead of a linear scan. Intended for
+    large allow-lists such as the supported country and currency codes.
+    """
+
+    __slots__ = ("_members",)
+
+    def __init__(self, values: Any = ()) -> None:
+        """Initialize the list and its backing frozenset.
+
+        Args:
+            values: Hashable values to store
+        """
+        list.__init__(self, values)
+        self._members = frozenset(self)
+
+    @property
+    def members(self) -> frozenset:
+        """Return the backing frozenset of the values."""
+        return self._members
+
+    def __contains__(self, value: object) -> bool:
+        """Check membership through the backing frozenset."""
+        try:
+            return value in self._members
+        except TypeError:
+            # Unhashable values cannot be members of a set of hashables
+            return False
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only containers.
+
+    Values that are already frozen are returned as-is, so frozen parts can
+    be shared between several frozen structures.
+
+    Args:
+        value: Value to freeze
+
+    Returns:
+        Any: FrozenDict/FrozenList for dicts/lists, the value itself otherwise
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert read-only containers back into mutable ones.
+
+    FrozenSetList values are immutable constants rather than containers meant
+    for editing, and are returned as-is so their O(1) lookups are kept.
+
+    Args:
+        value: Value to thaw
+
+    Returns:
+        Any: A mutable deep copy for dicts/lists, the value itself otherwise
+    """
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, FrozenSetList):
+        return value
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
@@ -4,22 +4,35 @@ Cardinity Validation Package
 This package provides validation functionality for the Cardinity API SDK.
 """
 
-from .constraints import CHALLENGE_WINDOW_SIZES, Constraints
+from .constraints import (
+    CHALLENGE_WINDOW_SIZES,
+    SUPPORTED_COUNTRY_CODES,
+    SUPPORTED_CURRENCY_CODES,
+    Constraints,
+)
 from .validators import (
     CardinityValidator,
+    ValidatorRegistry,
     validate_amount_format,
     validate_card_number,
     validate_country_code,
     validate_currency_code,
     validate_data,
+    validate_model_data,
     validate_required_fields,
+    validator_registry,
 )
 
 __all__ = [
     "Constraints",
     "CHALLENGE_WINDOW_SIZES",
+    "SUPPORTED_COUNTRY_CODES",
+    "SUPPORTED_CURRENCY_CODES",
     "CardinityValidator",
+    "ValidatorRegistry",
+    "validator_registry",
     "validate_data",
+    "validate_model_data",
     "validate_required_fields",
     "validate_amount_format",
     "validate_card_number",
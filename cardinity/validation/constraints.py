@@ -5,7 +5,11 @@ This module defines all validation constraints for the Cardinity API data struct
 It uses Cerberus schema format for consistent validation across the SDK.
 """
 
-from typing import Any, Dict
+import inspect
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict
+
+from ..utils import FrozenSetList, freeze
 
 # 3D Secure v2 challenge window sizes
 CHALLENGE_WINDOW_SIZES = ["01", "02", "03", "04", "05"]
@@ -278,11 +282,52 @@ SUPPORTED_COUNTRIES = [
     "ZW",
 ]
 
+# Frozen sets of the supported codes for O(1) membership pre-checks
+SUPPORTED_CURRENCY_CODES = frozenset(SUPPORTED_CURRENCIES)
+SUPPORTED_COUNTRY_CODES = frozenset(SUPPORTED_COUNTRIES)
+
+
+def cached_schema(
+    builder: Callable[..., Dict[str, Any]],
+) -> Callable[..., Dict[str, Any]]:
+    """Build a schema once per process and share it as a read-only mapping.
+
+    The returned schema is a FrozenDict whose nested rules are frozen as well,
+    so callers cannot mutate the shared copy. Use ``thaw()`` or ``.copy()``
+    to obtain a mutable version.
+
+    Args:
+        builder: Function building a Cerberus schema
+
+    Returns:
+        Callable: Memoized builder returning a frozen schema
+    """
+
+    signature = inspect.signature(builder)
+
+    @lru_cache(maxsize=None)
+    def build(*args: Any) -> Dict[str, Any]:
+        return freeze(builder(*args))
+
+    @wraps(builder)
+    def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        # Bind defaults so f(), f(False) and f(flag=False) share one entry
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return build(*bound.args)
+
+    return wrapper
+
 
 class Constraints:
-    """Collection of validation constraints for Cardinity API fields."""
+    """Collection of validation constraints for Cardinity API fields.
+
+    Every schema builder is memoized: the schema is built on first use and the
+    same read-only mapping is returned on every later call.
+    """
 
     @staticmethod
+    @cached_schema
     def amount() -> Dict[str, Any]:
         """Constraint for monetary amounts.
 
@@ -297,6 +342,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def currency() -> Dict[str, Any]:
         """Constraint for currency codes.
 
@@ -308,11 +354,12 @@ class Constraints:
             "required": True,
             "minlength": 3,
             "maxlength": 3,
-            "allowed": SUPPORTED_CURRENCIES,
+            "allowed": FrozenSetList(SUPPORTED_CURRENCIES),
             "regex": r"^[A-Z]{3}$",
         }
 
     @staticmethod
+    @cached_schema
     def country() -> Dict[str, Any]:
         """Constraint for country codes.
 
@@ -324,11 +371,12 @@ class Constraints:
             "required": True,
             "minlength": 2,
             "maxlength": 2,
-            "allowed": SUPPORTED_COUNTRIES,
+            "allowed": FrozenSetList(SUPPORTED_COUNTRIES),
             "regex": r"^[A-Z]{2}$",
         }
 
     @staticmethod
+    @cached_schema
     def description() -> Dict[str, Any]:
         """Constraint for payment descriptions.
 
@@ -338,6 +386,7 @@ class Constraints:
         return {"type": "string", "required": False, "maxlength": 255, "nullable": True}
 
     @staticmethod
+    @cached_schema
     def order_id() -> Dict[str, Any]:
         """Constraint for order IDs.
 
@@ -353,6 +402,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def payment_id() -> Dict[str, Any]:
         """Constraint for payment IDs (UUIDs).
 
@@ -362,6 +412,7 @@ class Constraints:
         return {"type": "string", "required": True, "check_with": "validate_payment_id"}
 
     @staticmethod
+    @cached_schema
     def payment_instrument() -> Dict[str, Any]:
         """Constraint for payment instrument (card) data.
 
@@ -403,6 +454,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def billing_address() -> Dict[str, Any]:
         """Constraint for billing address data.
 
@@ -434,6 +486,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def threeds2_data() -> Dict[str, Any]:
         """Constraint for 3D Secure v2 data.
 
@@ -508,6 +561,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def recurring_data() -> Dict[str, Any]:
         """Constraint for recurring payment data.
 
@@ -522,6 +576,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def refund_amount() -> Dict[str, Any]:
         """Constraint for refund amounts.
 
@@ -536,6 +591,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def settlement_amount() -> Dict[str, Any]:
         """Constraint for settlement amounts.
 
@@ -550,6 +606,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def payment_link_data() -> Dict[str, Any]:
         """Constraint for payment link creation data.
 
@@ -576,6 +633,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def finalize_payment() -> Dict[str, Any]:
         """Constraint for payment finalization data.
 
@@ -602,6 +660,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def create_payment_schema() -> Dict[str, Any]:
         """Complete schema for payment creation.
 
@@ -621,6 +680,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def create_recurring_payment_schema() -> Dict[str, Any]:
         """Complete schema for recurring payment creation.
 
@@ -638,6 +698,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def create_refund_schema() -> Dict[str, Any]:
         """Complete schema for refund creation.
 
@@ -650,6 +711,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def create_settlement_schema() -> Dict[str, Any]:
         """Complete schema for settlement creation.
 
@@ -662,6 +724,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def finalize_payment_schema(is_threedsv2: bool = False) -> Dict[str, Any]:
         """Complete schema for payment finalization.
 
@@ -679,6 +742,7 @@ class Constraints:
             }
 
     @staticmethod
+    @cached_schema
     def create_payment_link_schema() -> Dict[str, Any]:
         """Complete schema for payment link creation.
 
@@ -700,6 +764,7 @@ class Constraints:
         }
 
     @staticmethod
+    @cached_schema
     def update_payment_link_schema() -> Dict[str, Any]:
         """Complete schema for payment link updates.
 
@@ -4,9 +4,13 @@ Cardinity Validation Engine
 This module provides the validation functionality using Cerberus validator.
 """
 
-from typing import Any, Dict, List, Optional
+import threading
+from collections.abc import Iterable, Mapping, Set
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
-from cerberus import Validator
+from cerberus import Validator, errors
+
+from ..utils import FrozenDict, FrozenSetList, thaw
 
 
 class CardinityValidator(Validator):
@@ -16,6 +20,28 @@ class CardinityValidator(Validator):
     specific to Cardinity API requirements.
     """
 
+    # Cerberus reads the rule's own schema from the docstring, so the
+    # explanation lives here: allow-lists given as a FrozenSetList or a set
+    # are checked with O(1) set membership instead of a linear list scan.
+    def _validate_allowed(self, allowed_values: Any, field: str, value: Any) -> None:
+        """{'type': 'container'}"""
+        if isinstance(allowed_values, FrozenSetList):
+            allowed_values = allowed_values.members
+        if not isinstance(allowed_values, Set):
+            super()._validate_allowed(allowed_values, field, value)
+            return
+
+        try:
+            if isinstance(value, Iterable) and not isinstance(value, str):
+                unallowed = tuple(x for x in value if x not in allowed_values)
+                if unallowed:
+                    self._error(field, errors.UNALLOWED_VALUES, unallowed)
+            elif value not in allowed_values:
+                self._error(field, errors.UNALLOWED_VALUE, value)
+        except TypeError:
+            # Unhashable values: fall back to Cerberus' equality-based check
+            super()._validate_allowed(list(allowed_values), field, value)
+
     def _check_with_validate_amount(self, field: str, value: Any) -> None:
         """Custom validator for amount field.
 
@@ -63,6 +89,160 @@ class CardinityValidator(Validator):
                 self._error(field, "Expiry date cannot be in the past")
 
 
+# Cerberus rules that rewrite the document during normalization
+NORMALIZATION_RULES = frozenset(
+    {
+        "coerce",
+        "default",
+        "default_setter",
+        "purge_unknown",
+        "rename",
+        "rename_handler",
+    }
+)
+
+
+def _uses_normalization(schema: Any) -> bool:
+    """Check whether a schema, including nested sub-schemas, needs normalization.
+
+    Args:
+        schema: A Cerberus schema or rules set
+
+    Returns:
+        bool: True if any normalization rule is present
+    """
+    if isinstance(schema, Mapping):
+        return any(
+            key in NORMALIZATION_RULES or _uses_normalization(value)
+            for key, value in schema.items()
+        )
+    if isinstance(schema, (list, tuple)):
+        return any(_uses_normalization(item) for item in schema)
+    return False
+
+
+class ValidatorRegistry:
+    """Registry of compiled validators keyed by model schema.
+
+    Compiling a Cerberus schema (expansion and schema validation) is far more
+    expensive than validating a document against it. The registry compiles
+    each schema once per process and hands out validators built on the shared
+    compiled schema. Cerberus validators keep per-document state, so every
+    thread gets its own validator instances.
+
+    Schemas without normalization rules are validated with normalization
+    disabled, which skips Cerberus' per-call copy and re-check of the schema.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._schemas: Dict[Hashable, Tuple[Any, bool]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._generation = 0
+
+    def get_validator(
+        self, key: Hashable, schema_factory: Callable[[], Dict[str, Any]]
+    ) -> CardinityValidator:
+        """Get the validator for a schema key, compiling the schema on first use.
+
+        Args:
+            key: Hashable key identifying the schema (e.g. the model class)
+            schema_factory: Callable returning the schema, only called on a miss
+
+        Returns:
+            CardinityValidator: Validator owned by the calling thread
+        """
+        return self._get_entry(key, schema_factory)[0]
+
+    def validate(
+        self,
+        data: Dict[str, Any],
+        key: Hashable,
+        schema_factory: Callable[[], Dict[str, Any]],
+    ) -> Optional[Dict[str, List[str]]]:
+        """Validate data against the schema registered under a key.
+
+        Args:
+            data: The data to validate
+            key: Hashable key identifying the schema
+            schema_factory: Callable returning the schema, only called on a miss
+
+        Returns:
+            Dictionary of validation errors if any, None if validation passes
+        """
+        validator, normalize = self._get_entry(key, schema_factory)
+
+        if validator.validate(data, normalize=normalize):
+            return None
+        else:
+            return validator.errors
+
+    def _get_entry(
+        self, key: Hashable, schema_factory: Callable[[], Dict[str, Any]]
+    ) -> Tuple[CardinityValidator, bool]:
+        """Get the calling thread's validator and normalization flag for a key."""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.entries = {}
+            local.generation = self._generation
+
+        entry = local.entries.get(key)
+        if entry is None:
+            schema, normalize = self._get_schema(key, schema_factory)
+            entry = (CardinityValidator(schema), normalize)
+            local.entries[key] = entry
+        return entry
+
+    def _get_schema(
+        self, key: Hashable, schema_factory: Callable[[], Dict[str, Any]]
+    ) -> Tuple[Any, bool]:
+        """Get the compiled schema for a key, compiling it at most once."""
+        entry = self._schemas.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._schemas.get(key)
+                if entry is None:
+                    # Cerberus expands schemas in place, so compile a mutable copy
+                    schema = thaw(schema_factory())
+                    compiled = CardinityValidator(schema).schema
+                    entry = (compiled, _uses_normalization(schema))
+                    self._schemas[key] = entry
+        return entry
+
+    def clear(self) -> None:
+        """Drop all compiled schemas and per-thread validators."""
+        with self._lock:
+            self._schemas.clear()
+            self._generation += 1
+
+    def __len__(self) -> int:
+        """Return the number of compiled schemas."""
+        return len(self._schemas)
+
+
+#: Process-wide registry used by the models
+validator_registry = ValidatorRegistry()
+
+
+def validate_model_data(
+    data: Dict[str, Any],
+    key: Hashable,
+    schema_factory: Callable[[], Dict[str, Any]],
+) -> Optional[Dict[str, List[str]]]:
+    """Validate data against a schema compiled once and cached under a key.
+
+    Args:
+        data: The data to validate
+        key: Hashable key identifying the schema
+        schema_factory: Callable returning the schema, only called on a miss
+
+    Returns:
+        Dictionary of validation errors if any, None if validation passes
+    """
+    return validator_registry.validate(data, key, schema_factory)
+
+
 def validate_data(
     data: Dict[str, Any], schema: Dict[str, Any]
 ) -> Optional[Dict[str, List[str]]]:
@@ -75,6 +255,9 @@ def validate_data(
     Returns:
         Dictionary of validation errors if any, None if validation passes
     """
+    if isinstance(schema, FrozenDict):
+        # Cerberus expands schemas in place, so validate against a mutable copy
+        schema = thaw(schema)
     validator = CardinityValidator(schema)
 
     if validator.validate(data):
@@ -0,0 +1,46 @@
+"""
+Shared test doubles for the Cardinity client tests.
+"""
+
+from unittest.mock import Mock
+
+from cardinity.auth import CardinityAuth
+from cardinity.client import CardinityClient
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def make_response(status_code, body=None, headers=None):
+    """Build a mocked requests response."""
+    response = Mock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.reason = "Reason"
+    response.headers = headers or {}
+    response.json.return_value = body if body is not None else {}
+    return response
+
+
+def make_client(**kwargs):
+    """Build a client with test credentials.
+
+    Unless a retry policy is passed, the default policy does not sleep
+    between retries.
+    """
+    client = CardinityClient(CardinityAuth("test_key", "test_secret"), **kwargs)
+    if "retry_policy" not in kwargs:
+        client.retry_policy.sleep = Mock()
+    return client
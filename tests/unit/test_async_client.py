@@ -0,0 +1,291 @@
+"""
+Unit tests for the asynchronous Cardinity client and SDK facade.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from cardinity import AsyncCardinity  # noqa: E402
+from cardinity.async_client import AsyncCardinityClient  # noqa: E402
+from cardinity.auth import CardinityAuth  # noqa: E402
+from cardinity.exceptions import (  # noqa: E402
+    APIError,
+    AuthenticationError,
+    CardinityError,
+    DeadlineExceededError,
+    NotFoundError,
+    ServerError,
+    ValidationError,
+)
+from cardinity.ratelimit import RateLimiter  # noqa: E402
+from cardinity.retry import RetryPolicy  # noqa: E402
+from tests.fixtures.test_data import TestPaymentData  # noqa: E402
+
+
+def make_client(handler, **kwargs):
+    """Build an async client whose transport is served by ``handler``."""
+    auth = CardinityAuth("test_key", "test_secret")
+    return AsyncCardinityClient(auth, transport=httpx.MockTransport(handler), **kwargs)
+
+
+def run(coro):
+    """Run a coroutine to completion."""
+    return asyncio.run(coro)
+
+
+class TestAsyncCardinityClient:
+    """Test cases for AsyncCardinityClient."""
+
+    def test_successful_get_request(self):
+        """Test GET requests are signed and parsed."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"id": "test_id"})
+
+        async def scenario():
+            async with make_client(handler) as client:
+                return await client.get("/payments", params={"limit": 5})
+
+        assert run(scenario()) == {"id": "test_id"}
+        request = seen[0]
+        assert str(request.url) == "https://api.cardinity.com/v1/payments?limit=5"
+        assert request.headers["Authorization"].startswith("OAuth ")
+        assert 'oauth_signature_method="HMAC-SHA1"' in request.headers["Authorization"]
+        assert "cardinity-python" in request.headers["User-Agent"]
+
+    def test_post_sends_json_body(self):
+        """Test POST requests send the payload as JSON."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json={"id": "new_payment"})
+
+        async def scenario():
+            async with make_client(handler) as client:
+                return await client.post("/payments", {"amount": "10.00"})
+
+        assert run(scenario()) == {"id": "new_payment"}
+        assert bodies == [{"amount": "10.00"}]
+
+    @pytest.mark.parametrize(
+        "status_code,exception",
+        [
+            (401, AuthenticationError),
+            (404, NotFoundError),
+            (400, APIError),
+        ],
+    )
+    def test_error_mapping(self, status_code, exception):
+        """Test error responses map onto the same exceptions as the sync client."""
+
+        def handler(request):
+            return httpx.Response(status_code, json={"error": "boom"})
+
+        async def scenario():
+            async with make_client(handler) as client:
+                await client.get("/payments")
+
+        with pytest.raises(exception) as exc_info:
+            run(scenario())
+        assert exc_info.value.status_code == status_code
+
+    def test_retries_server_errors_without_blocking(self):
+        """Test 5xx responses are retried with asyncio.sleep backoff."""
+        responses = [
+            httpx.Response(503, json={"error": "unavailable"}),
+            httpx.Response(429, json={"error": "slow down"}),
+            httpx.Response(200, json={"id": "ok"}),
+        ]
+
+        def handler(request):
+            return responses.pop(0)
+
+        async def scenario():
+            policy = RetryPolicy(jitter="none")
+            async with make_client(handler, retry_policy=policy) as client:
+                return await client.get("/payments")
+
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        with patch("cardinity.async_client.asyncio.sleep", new=fake_sleep):
+            assert run(scenario()) == {"id": "ok"}
+
+        assert delays == [1, 2]
+
+    def test_retries_exhausted(self):
+        """Test the last error is raised once retries are exhausted."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"error": "Internal server error"})
+
+        async def scenario():
+            async with make_client(handler, max_retries=1) as client:
+                await client.get("/payments")
+
+        async def fake_sleep(delay):
+            return None
+
+        with patch("cardinity.async_client.asyncio.sleep", new=fake_sleep):
+            with pytest.raises(ServerError):
+                run(scenario())
+        assert len(calls) == 2
+
+    def test_deadline_shortens_timeouts_and_stops_retries(self):
+        """Test the deadline caps each attempt's timeouts and the retries."""
+        timeouts = []
+
+        def handler(request):
+            timeouts.append(request.extensions["timeout"])
+            return httpx.Response(503, json={"error": "unavailable"})
+
+        now = [0.0]
+        policy = RetryPolicy(jitter="none", clock=lambda: now[0])
+
+        async def fake_sleep(delay):
+            now[0] += delay
+
+        async def scenario():
+            async with make_client(
+                handler,
+                retry_policy=policy,
+                connect_timeout=2,
+                read_timeout=10,
+                deadline=2.5,
+            ) as client:
+                await client.get("/payments")
+
+        with patch("cardinity.async_client.asyncio.sleep", new=fake_sleep):
+            with pytest.raises(DeadlineExceededError) as exc_info:
+                run(scenario())
+
+        assert isinstance(exc_info.value.__cause__, ServerError)
+        assert [(t["connect"], t["read"]) for t in timeouts] == [(2, 2.5), (1.5, 1.5)]
+
+    def test_deadline_abort_releases_rate_limiter_token(self):
+        """Test a call aborted before sending gives its token back."""
+        limiter = RateLimiter(rate=1, burst=1)
+        limiter.reserve("/payments")
+
+        def handler(request):
+            raise AssertionError("request should not be sent")
+
+        async def scenario():
+            async with make_client(handler, rate_limiter=limiter) as client:
+                await client.get("/payments", deadline=0.5)
+
+        with pytest.raises(DeadlineExceededError):
+            run(scenario())
+        assert limiter.reserve("/payments") == pytest.approx(1.0, abs=0.01)
+
+    def test_transport_errors_raise_cardinity_error(self):
+        """Test connection failures surface as CardinityError."""
+
+        def handler(request):
+            raise httpx.ConnectError("Connection failed")
+
+        async def scenario():
+            async with make_client(handler, max_retries=0) as client:
+                await client.get("/payments")
+
+        with pytest.raises(CardinityError, match="Connection failed"):
+            run(scenario())
+
+    @pytest.mark.parametrize(
+        "error",
+        [httpx.TooManyRedirects("Too many redirects"), httpx.DecodingError("bad")],
+    )
+    def test_other_http_errors_raise_cardinity_error(self, error):
+        """Test non-transport httpx errors surface as CardinityError too."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise error
+
+        async def scenario():
+            async with make_client(handler) as client:
+                await client.get("/payments")
+
+        with pytest.raises(CardinityError, match=str(error)) as exc_info:
+            run(scenario())
+        assert not isinstance(exc_info.value, httpx.HTTPError)
+        assert len(calls) == 1
+
+
+class TestAsyncCardinity:
+    """Test cases for the AsyncCardinity facade."""
+
+    def test_create_payment(self):
+        """Test create_payment validates and posts the payment model."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json={"id": "pay_1", "status": "approved"})
+
+        async def scenario():
+            async with AsyncCardinity(
+                "test_key", "test_secret", transport=httpx.MockTransport(handler)
+            ) as cardinity:
+                return await cardinity.create_payment(
+                    **TestPaymentData.successful_payment()
+                )
+
+        result = run(scenario())
+        assert result["status"] == "approved"
+        assert bodies[0]["payment_method"] == "card"
+
+    def test_validation_happens_before_request(self):
+        """Test invalid input raises before any request is sent."""
+
+        def handler(request):  # pragma: no cover - must not be called
+            raise AssertionError("request should not be sent")
+
+        async def scenario():
+            async with AsyncCardinity(
+                "test_key", "test_secret", transport=httpx.MockTransport(handler)
+            ) as cardinity:
+                await cardinity.create_refund("payment_id", amount="invalid")
+
+        with pytest.raises(ValidationError):
+            run(scenario())
+
+    def test_read_operations_use_model_endpoints(self):
+        """Test get_* methods hit the same endpoints as the sync facade."""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.raw_path.decode())
+            return httpx.Response(200, json={})
+
+        async def scenario():
+            async with AsyncCardinity(
+                "test_key", "test_secret", transport=httpx.MockTransport(handler)
+            ) as cardinity:
+                await cardinity.get_payment("pay_1")
+                await cardinity.get_payment(limit=10)
+                await cardinity.get_refund("pay_1", "ref_1")
+                await cardinity.get_chargeback(5)
+                await cardinity.get_payment_link("link_1")
+
+        run(scenario())
+        assert paths == [
+            "/v1/payments/pay_1",
+            "/v1/payments?limit=10",
+            "/v1/payments/pay_1/refunds/ref_1",
+            "/v1/payments/chargebacks?limit=5",
+            "/v1/paymentLinks/link_1",
+        ]
@@ -86,6 +86,61 @@ class TestCardinityAuth:
             auth_header = auth_header.decode("utf-8")
         assert "oauth_signature" in auth_header
 
+    def test_get_auth_headers_signs_request(self):
+        """Test get_auth_headers returns a signed OAuth Authorization header."""
+        auth = CardinityAuth("test_key", "test_secret")
+
+        headers = auth.get_auth_headers(
+            "get", "https://api.cardinity.com/v1/payments?limit=5"
+        )
+
+        assert list(headers) == ["Authorization"]
+        assert isinstance(headers["Authorization"], str)
+        assert headers["Authorization"].startswith("OAuth ")
+        assert 'oauth_consumer_key="test_key"' in headers["Authorization"]
+        assert "oauth_signature=" in headers["Authorization"]
+
+    def test_get_auth_reuses_signer(self):
+        """Test the OAuth1 signer is built once per credential pair."""
+        auth = CardinityAuth("test_key", "test_secret")
+
+        assert auth.get_auth() is auth.get_auth()
+
+    def test_get_auth_rebuilds_signer_on_credential_change(self):
+        """Test a new signer is built when the credentials change."""
+        auth = CardinityAuth("test_key", "test_secret")
+        first = auth.get_auth()
+
+        auth.consumer_secret = "rotated_secret"
+        second = auth.get_auth()
+
+        assert second is not first
+        assert second.client.client_secret == "rotated_secret"
+        assert auth.get_auth() is second
+
+    def test_cached_signer_is_thread_safe(self):
+        """Test concurrent signing shares one signer with fresh nonces."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from requests import Request
+
+        auth = CardinityAuth("test_key", "test_secret")
+
+        def sign(_):
+            prepared = Request("GET", "https://api.cardinity.com/v1/payments").prepare()
+            signer = auth.get_auth()
+            header = signer(prepared).headers["Authorization"]
+            if isinstance(header, bytes):
+                header = header.decode("utf-8")
+            nonce = header.split('oauth_nonce="')[1].split('"')[0]
+            return signer, nonce
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(sign, range(64)))
+
+        assert len({id(signer) for signer, _ in results}) == 1
+        assert len({nonce for _, nonce in results}) == 64
+
     def test_auth_immutability(self):
         """Test that auth credentials cannot be modified after creation."""
         auth = CardinityAuth("test_key", "test_secret")
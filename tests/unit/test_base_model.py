@@ -4,12 +4,16 @@ Unit tests for Cardinity base model classes.
 This module tests the BaseModel and ReadOnlyModel abstract base classes.
 """
 
+import copy
+import pickle
 from typing import Any, Dict
 
 import pytest
 
 from cardinity.exceptions import ValidationError
+from cardinity.models import GetChargeback, Payment, Refund
 from cardinity.models.base import BaseModel, ReadOnlyModel
+from tests.fixtures.test_data import TestPaymentData
 
 
 class TestModel(BaseModel):
@@ -144,8 +148,8 @@ class TestBaseModelFunctionality:
         errors = model.validate()
         assert errors is None
 
-        # Invalid model (modify internal data to make it invalid)
-        model._data["currency"] = None
+        # Invalid model (replace internal data to make it invalid)
+        model._data = {**model._data, "currency": None}
         errors = model.validate()
         assert errors is not None
         assert "currency" in errors
@@ -156,7 +160,7 @@ class TestBaseModelFunctionality:
         assert model.is_valid() is True
 
         # Make model invalid
-        model._data["currency"] = None
+        model._data = {**model._data, "currency": None}
         assert model.is_valid() is False
 
     def test_model_equality(self):
@@ -364,3 +368,78 @@ class TestEdgeCases:
         # Invalid currency
         with pytest.raises(ValidationError):
             ComplexModel(amount="10.50", currency="JPY")
+
+
+class TestModelStorage:
+    """Test the slotted, read-only storage of model data."""
+
+    def test_models_have_no_instance_dict(self):
+        payment = Payment(**TestPaymentData.successful_payment())
+        assert not hasattr(payment, "__dict__")
+        assert not hasattr(GetChargeback("pay_123", "cb_1"), "__dict__")
+
+    def test_data_view_is_read_only_and_shared(self):
+        model = TestModel(amount="10.50", currency="EUR")
+        assert model.data is model.data
+        assert model.data == {"amount": "10.50", "currency": "EUR"}
+        with pytest.raises(TypeError):
+            model.data["amount"] = "0.00"
+
+    def test_kwargs_are_not_shared(self):
+        data = {"amount": "10.50", "currency": "EUR"}
+        model = TestModel(**data)
+        data["amount"] = "0.00"
+        assert model.get_field("amount") == "10.50"
+
+    def test_update_replaces_data(self):
+        model = TestModel(amount="10.50", currency="EUR")
+        view = model.data
+        model.update_data(amount="20.00")
+        assert view["amount"] == "10.50"
+        assert model.data["amount"] == "20.00"
+
+    def test_copies_are_independent(self):
+        model = TestModel(amount="10.50", currency="EUR")
+        copied = model.to_dict()
+        copied["amount"] = "0.00"
+        assert model.get_data() == {"amount": "10.50", "currency": "EUR"}
+
+    def test_pickle_and_copy(self):
+        refund = Refund("pay_123", amount="5.00", description="Return")
+        for restored in (pickle.loads(pickle.dumps(refund)), copy.deepcopy(refund)):
+            assert restored == refund
+            assert restored.get_endpoint() == "/payments/pay_123/refunds"
+            with pytest.raises(TypeError):
+                restored.data["amount"] = "0.00"
+
+    def test_nested_data_is_frozen(self):
+        data = TestPaymentData.successful_payment()
+        payment = Payment(**data)
+        data["payment_instrument"]["holder"] = "Someone Else"
+
+        instrument = payment.data["payment_instrument"]
+        assert instrument["holder"] != "Someone Else"
+        with pytest.raises(TypeError):
+            instrument["holder"] = "Someone Else"
+        with pytest.raises(TypeError):
+            payment.to_dict()["payment_instrument"]["holder"] = "Someone Else"
+
+        thawed = payment.get_data()
+        thawed["payment_instrument"]["holder"] = "Someone Else"
+        assert payment.get_field("payment_instrument") == instrument
+
+    def test_nested_models_are_hashable(self):
+        data = TestPaymentData.successful_payment()
+        reordered = dict(reversed(list(data.items())))
+        first, second = Payment(**data), Payment(**reordered)
+
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+        assert {first: "sent"}[second] == "sent"
+
+    def test_hash_follows_updates(self):
+        model = TestModel(amount="10.50", currency="EUR")
+        before = hash(model)
+        model.update_data(amount="20.00")
+        assert hash(model) == hash(TestModel(amount="20.00", currency="EUR"))
+        assert hash(model) != before
@@ -0,0 +1,42 @@
+"""
+Unit tests for the benchmark suite's statistics and regression checks.
+"""
+
+import json
+
+from benchmarks.suite import compare, main, summarize
+
+
+def result(p50_us):
+    return {"p50_us": p50_us, "p95_us": p50_us, "p99_us": p50_us}
+
+
+class TestBenchmarkSuite:
+    """Test cases for the benchmark suite."""
+
+    def test_summarize(self):
+        summary = summarize([i / 1e6 for i in range(1, 101)])
+        assert summary["p50_us"] == 50.5
+        assert summary["p99_us"] == 99.01
+        assert summary["samples"] == 100
+        assert summary["ops_per_sec"] == round(100 / (5050 / 1e6), 1)
+
+    def test_compare(self):
+        baseline = {"fast": result(10.0), "slow": result(10.0)}
+        results = {"fast": result(12.0), "slow": result(13.0), "new": result(1.0)}
+        regressions = compare(results, baseline, tolerance=0.25)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("slow:")
+
+    def test_main_fails_on_regression(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        output = tmp_path / "latest.json"
+        args = ["--only", "json.encode", "--scale", "0.1", "--output", str(output)]
+
+        assert main([*args, "--baseline", str(baseline), "--update-baseline"]) == 0
+        stored = json.loads(baseline.read_text())
+        assert list(stored["results"]) == ["json.encode_payment"]
+
+        stored["results"]["json.encode_payment"]["p50_us"] = 1e-6
+        baseline.write_text(json.dumps(stored))
+        assert main([*args, "--baseline", str(baseline)]) == 1
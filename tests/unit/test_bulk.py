@@ -0,0 +1,181 @@
+"""
+Unit tests for bulk payment submission.
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cardinity import BulkResult, Cardinity
+from cardinity.client import CardinityClient
+from cardinity.exceptions import APIError, ValidationError
+from cardinity.models import Payment, RecurringPayment
+from tests.fixtures.test_data import TestPaymentData
+
+PAYMENT_ID = "12345678-1234-1234-1234-123456789012"
+
+
+def payments(count):
+    """Build valid payment data whose description carries its index."""
+    items = []
+    for index in range(count):
+        data = TestPaymentData.successful_payment()
+        data["description"] = f"payment {index}"
+        items.append(data)
+    return items
+
+
+class TestBulkPayments:
+    """Test cases for Cardinity.create_payments_bulk()."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cardinity = Cardinity("test_key", "test_secret")
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_results_in_input_order(self, mock_execute):
+        """Test ordered results follow input order despite uneven latency."""
+
+        def execute(model):
+            index = int(model.to_dict()["description"].split()[1])
+            time.sleep(0.001 * (10 - index))
+            return {"id": f"pay_{index}"}
+
+        mock_execute.side_effect = execute
+
+        results = list(
+            self.cardinity.create_payments_bulk(payments(10), max_concurrency=4)
+        )
+
+        assert [r.position for r in results] == list(range(10))
+        assert [r.response["id"] for r in results] == [f"pay_{i}" for i in range(10)]
+        assert all(isinstance(r, BulkResult) and r.ok for r in results)
+        assert all(isinstance(m.args[0], Payment) for m in mock_execute.mock_calls)
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_results_in_completion_order(self, mock_execute):
+        """Test unordered results are yielded as requests complete."""
+        release = threading.Event()
+
+        def execute(model):
+            if model.to_dict()["description"] == "payment 0":
+                release.wait(timeout=5)
+            return {"description": model.to_dict()["description"]}
+
+        mock_execute.side_effect = execute
+        results = self.cardinity.create_payments_bulk(
+            payments(3), max_concurrency=3, ordered=False
+        )
+
+        first = next(results)
+        release.set()
+        rest = list(results)
+
+        assert first.position != 0
+        assert sorted(r.position for r in [first, *rest]) == [0, 1, 2]
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_failures_do_not_abort_batch(self, mock_execute):
+        """Test invalid items and API errors are reported per item."""
+        items = payments(3)
+        items[1]["amount"] = "invalid"
+
+        def execute(model):
+            if model.to_dict()["description"] == "payment 2":
+                raise APIError("declined", status_code=402)
+            return {"id": "ok"}
+
+        mock_execute.side_effect = execute
+
+        results = list(self.cardinity.create_payments_bulk(items))
+
+        assert [r.ok for r in results] == [True, False, False]
+        assert isinstance(results[1].error, ValidationError)
+        assert isinstance(results[2].error, APIError)
+        assert results[1].data is items[1]
+        # The invalid item is never sent
+        assert mock_execute.call_count == 2
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_validates_before_sending(self, mock_execute):
+        """Test every item is validated before the first request is sent."""
+        with patch.object(
+            Payment, "__init__", side_effect=ValidationError("bad")
+        ) as mock_init:
+            results = self.cardinity.create_payments_bulk(payments(5))
+
+            assert mock_init.call_count == 5
+            mock_execute.assert_not_called()
+            assert all(not r.ok for r in results)
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_malformed_items_do_not_abort_batch(self, mock_execute):
+        """Test items that cannot build a model fail on their own."""
+        mock_execute.return_value = {"id": PAYMENT_ID, "status": "approved"}
+        items = [payments(1)[0], None, ["amount"], payments(1)[0]]
+
+        with patch.object(
+            Payment, "_validate_data", side_effect=[None, KeyError("amount")]
+        ):
+            results = list(self.cardinity.create_payments_bulk(items))
+
+        assert [r.ok for r in results] == [True, False, False, False]
+        assert isinstance(results[1].error, TypeError)
+        assert isinstance(results[2].error, TypeError)
+        assert isinstance(results[3].error, KeyError)
+        assert mock_execute.call_count == 1
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_max_concurrency_is_respected(self, mock_execute):
+        """Test no more than max_concurrency requests are in flight."""
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def execute(model):
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            time.sleep(0.005)
+            with lock:
+                state["current"] -= 1
+            return {}
+
+        mock_execute.side_effect = execute
+
+        results = list(
+            self.cardinity.create_payments_bulk(payments(20), max_concurrency=3)
+        )
+
+        assert len(results) == 20
+        assert 1 < state["peak"] <= 3
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_abandoned_iterator_stops_dispatching(self, mock_execute):
+        """Test closing the iterator early stops submitting requests."""
+        mock_execute.return_value = {}
+
+        results = self.cardinity.create_payments_bulk(payments(50), max_concurrency=2)
+        next(results)
+        results.close()
+
+        assert mock_execute.call_count <= 4
+
+    def test_invalid_max_concurrency(self):
+        """Test max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            self.cardinity.create_payments_bulk(payments(1), max_concurrency=0)
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_recurring_payments_bulk(self, mock_execute):
+        """Test recurring payments are built as RecurringPayment models."""
+        mock_execute.return_value = {"id": "pay_r", "status": "approved"}
+        items = [TestPaymentData.recurring_payment_data(PAYMENT_ID)] * 3
+
+        results = list(self.cardinity.create_recurring_payments_bulk(items))
+
+        assert [r.response["status"] for r in results] == ["approved"] * 3
+        assert all(
+            isinstance(m.args[0], RecurringPayment) for m in mock_execute.mock_calls
+        )
@@ -0,0 +1,180 @@
+"""
+Unit tests for the Cardinity response cache.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from cardinity import Cardinity
+from cardinity.cache import ResponseCache
+from cardinity.models import GetPayment, GetRefund, Refund
+from tests.fixtures.mocks import FakeClock, make_client
+
+
+def make_cache(**kwargs):
+    clock = FakeClock()
+    return ResponseCache(clock=clock, **kwargs), clock
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_hit_and_miss_counters(self):
+        cache, _ = make_cache()
+        assert cache.get("/payments/p1") is None
+        cache.set("/payments/p1", {"id": "p1", "status": "pending"})
+        assert cache.get("/payments/p1") == {"id": "p1", "status": "pending"}
+
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+
+    def test_pending_resource_expires(self):
+        cache, clock = make_cache(ttl=5)
+        cache.set("/payments/p1", {"id": "p1", "status": "pending"})
+        clock.now = 4.9
+        assert cache.get("/payments/p1") is not None
+        clock.now = 5.0
+        assert cache.get("/payments/p1") is None
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize("status", ["approved", "declined"])
+    def test_terminal_status_is_kept_longer(self, status):
+        cache, clock = make_cache(ttl=5, terminal_ttl=300)
+        cache.set("/payments/p1", {"id": "p1", "status": status})
+        clock.now = 299
+        assert cache.get("/payments/p1") is not None
+
+    def test_resource_ttls(self):
+        cache, clock = make_cache(ttl=5, resource_ttls={"refunds": 1, "voids": 0})
+        cache.set("/payments/p1/refunds/r1", {"id": "r1", "status": "pending"})
+        cache.set("/payments/p1/voids/v1", {"id": "v1", "status": "pending"})
+        cache.set("/payments/p1", {"id": "p1", "status": "pending"})
+        clock.now = 2
+
+        assert cache.get("/payments/p1/refunds/r1") is None
+        assert cache.get("/payments/p1") is not None
+        # A TTL of 0 disables caching for the resource
+        assert len(cache) == 1
+
+    def test_lru_eviction(self):
+        cache, _ = make_cache(max_entries=2)
+        cache.set("/payments/a", {"id": "a"})
+        cache.set("/payments/b", {"id": "b"})
+        cache.get("/payments/a")
+        cache.set("/payments/c", {"id": "c"})
+
+        assert cache.get("/payments/b") is None
+        assert cache.get("/payments/a") == {"id": "a"}
+        assert cache.stats()["evictions"] == 1
+
+    def test_returns_copies(self):
+        cache, _ = make_cache()
+        response = {"id": "p1", "status": "pending", "card": {"pan": "4111"}}
+        cache.set("/payments/p1", response)
+        response["card"]["pan"] = "changed"
+
+        cached = cache.get("/payments/p1")
+        cached["status"] = "changed"
+        assert cache.get("/payments/p1")["card"] == {"pan": "4111"}
+        assert cache.get("/payments/p1")["status"] == "pending"
+
+    def test_invalidate_nested_write(self):
+        cache, _ = make_cache()
+        for endpoint in (
+            "/payments/p1",
+            "/payments/p1/refunds/r1",
+            "/payments/p2",
+            "/payments?limit=10",
+        ):
+            cache.set(endpoint, {"id": endpoint})
+
+        cache.invalidate("/payments/p1/refunds")
+        assert cache.get("/payments/p1") is None
+        assert cache.get("/payments/p1/refunds/r1") is None
+        assert cache.get("/payments/p2") is not None
+
+        cache.invalidate("/payments")
+        assert cache.get("/payments?limit=10") is None
+        assert cache.get("/payments/p2") is not None
+
+    def test_clear(self):
+        cache, _ = make_cache()
+        cache.set("/payments/p1", {"id": "p1"})
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestClientCaching:
+    """Test cases for the cache inside CardinityClient.execute_request."""
+
+    def make_client(self, **kwargs):
+        return make_client(response_cache=ResponseCache(**kwargs))
+
+    def test_read_only_models_are_cached(self):
+        client = self.make_client()
+        payment = {"id": "p1", "status": "approved"}
+
+        with patch.object(client, "get", return_value=payment) as get:
+            assert client.execute_request(GetPayment("p1")) == payment
+            assert client.execute_request(GetPayment("p1")) == payment
+            client.execute_request(GetRefund("p1", "r1"))
+
+        assert get.call_count == 2
+        assert client.response_cache.stats()["hits"] == 1
+
+    def test_writes_invalidate_and_are_not_cached(self):
+        client = self.make_client()
+        refund = Refund(amount="1.00", payment_id="p1")
+
+        with patch.object(
+            client, "get", return_value={"id": "p1", "status": "approved"}
+        ) as get, patch.object(client, "post", return_value={"id": "r1"}) as post:
+            client.execute_request(GetPayment("p1"))
+            client.execute_request(refund)
+            client.execute_request(refund)
+            client.execute_request(GetPayment("p1"))
+
+        assert post.call_count == 2
+        assert get.call_count == 2
+
+    def test_get_during_write_is_not_kept(self):
+        client = self.make_client()
+        refund = Refund(amount="1.00", payment_id="p1")
+        states = iter(["approved", "refunded"])
+
+        def get(endpoint, deadline=None):
+            return {"id": "p1", "status": next(states)}
+
+        def post(*args):
+            # A concurrent read lands between the invalidation and the write
+            client.execute_request(GetPayment("p1"))
+            raise RuntimeError("timeout after the refund was made")
+
+        with patch.object(client, "get", side_effect=get), patch.object(
+            client, "post", side_effect=post
+        ):
+            with pytest.raises(RuntimeError):
+                client.execute_request(refund)
+            payment = client.execute_request(GetPayment("p1"))
+
+        assert payment["status"] == "refunded"
+
+    def test_errors_are_not_cached(self):
+        client = self.make_client()
+
+        with patch.object(client, "get", side_effect=RuntimeError("down")):
+            with pytest.raises(RuntimeError):
+                client.execute_request(GetPayment("p1"))
+        assert len(client.response_cache) == 0
+
+    def test_cache_is_optional(self):
+        cardinity = Cardinity("test_key", "test_secret")
+        assert cardinity.get_client().response_cache is None
+
+        cache = ResponseCache()
+        cardinity = Cardinity("test_key", "test_secret", response_cache=cache)
+        assert cardinity.get_client().response_cache is cache
@@ -0,0 +1,311 @@
+"""
+Unit tests for the Cardinity circuit breaker.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from cardinity.auth import CardinityAuth
+from cardinity.circuit import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    is_failure,
+)
+from cardinity.client import CardinityClient
+from cardinity.exceptions import (
+    APIError,
+    CardinityError,
+    CircuitOpenError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+)
+from cardinity.ratelimit import RateLimiter
+from cardinity.retry import RetryPolicy
+from tests.fixtures.mocks import FakeClock, make_response
+
+
+def make_breaker(**kwargs):
+    """Build a breaker on a fake clock recording its transitions."""
+    clock = FakeClock()
+    changes = []
+    options = {"window_size": 4, "minimum_calls": 4, "open_duration": 10}
+    options.update(kwargs)
+    breaker = CircuitBreaker(
+        clock=clock,
+        on_state_change=lambda *change: changes.append(change),
+        **options,
+    )
+    return breaker, clock, changes
+
+
+def call(breaker, endpoint="payments", error=None):
+    """Run one guarded call, optionally failing with ``error``."""
+    with breaker.call(endpoint):
+        if error is not None:
+            raise error
+
+
+def fail(breaker, endpoint="payments", times=1):
+    """Run failing guarded calls."""
+    for _ in range(times):
+        with pytest.raises(ServerError):
+            call(breaker, endpoint, ServerError())
+
+
+class TestIsFailure:
+    """Test cases for is_failure()."""
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (ServerError(), True),
+            (ConnectionError(), True),
+            (OSError(), True),
+            (RateLimitError(), False),
+            (NotFoundError(), False),
+            (APIError("Bad request", 400), False),
+            (CardinityError("other"), False),
+        ],
+    )
+    def test_classification(self, error, expected):
+        assert is_failure(error) is expected
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker state transitions."""
+
+    def test_opens_on_failure_rate(self):
+        breaker, _, changes = make_breaker(failure_rate_threshold=0.5)
+        call(breaker)
+        call(breaker)
+        fail(breaker)
+        assert breaker.state("payments") == STATE_CLOSED
+        fail(breaker)
+
+        assert breaker.state("payments") == STATE_OPEN
+        assert changes == [("payments", STATE_CLOSED, STATE_OPEN)]
+
+    def test_minimum_calls_before_opening(self):
+        breaker, _, _ = make_breaker()
+        fail(breaker, times=3)
+        assert breaker.state("payments") == STATE_CLOSED
+
+    def test_client_errors_do_not_count(self):
+        breaker, _, _ = make_breaker()
+        for _ in range(4):
+            with pytest.raises(NotFoundError):
+                call(breaker, error=NotFoundError())
+        assert breaker.state("payments") == STATE_CLOSED
+
+    def test_opens_on_slow_calls(self):
+        breaker, clock, _ = make_breaker(
+            slow_call_duration=2, slow_call_rate_threshold=0.75
+        )
+        for duration in (3, 3, 0, 3):
+            with breaker.call("payments"):
+                clock.now += duration
+        assert breaker.state("payments") == STATE_OPEN
+
+    def test_open_circuit_fails_fast(self):
+        breaker, clock, _ = make_breaker()
+        fail(breaker, times=4)
+        clock.now += 4
+        body = Mock()
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            with breaker.call("payments/abc"):
+                body()
+
+        body.assert_not_called()
+        assert exc_info.value.family == "payments"
+        assert exc_info.value.retry_after == pytest.approx(6)
+        assert isinstance(exc_info.value, CardinityError)
+
+    def test_families_are_isolated(self):
+        breaker, _, _ = make_breaker()
+        fail(breaker, times=4)
+        call(breaker, "payments/abc/refunds")
+        assert breaker.get_states() == {"payments": STATE_OPEN, "refunds": "closed"}
+
+    def test_half_open_closes_after_successful_trials(self):
+        breaker, clock, changes = make_breaker(half_open_calls=2)
+        fail(breaker, times=4)
+        clock.now += 10
+
+        call(breaker)
+        assert breaker.state("payments") == STATE_HALF_OPEN
+        call(breaker)
+
+        assert breaker.state("payments") == STATE_CLOSED
+        assert [change[2] for change in changes] == [
+            STATE_OPEN,
+            STATE_HALF_OPEN,
+            STATE_CLOSED,
+        ]
+
+    def test_half_open_reopens_on_failure(self):
+        breaker, clock, _ = make_breaker(half_open_calls=2)
+        fail(breaker, times=4)
+        clock.now += 10
+        fail(breaker)
+
+        assert breaker.state("payments") == STATE_OPEN
+        with pytest.raises(CircuitOpenError):
+            call(breaker)
+
+    def test_half_open_limits_trial_calls(self):
+        breaker, clock, _ = make_breaker(half_open_calls=1)
+        fail(breaker, times=4)
+        clock.now += 10
+
+        breaker.allow("payments")
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.allow("payments")
+        assert exc_info.value.retry_after is None
+
+        breaker.record("payments", 0.1, failed=False)
+        assert breaker.state("payments") == STATE_CLOSED
+
+    def test_cancelled_trial_releases_slot(self):
+        breaker, clock, _ = make_breaker(half_open_calls=1)
+        fail(breaker, times=4)
+        clock.now += 10
+
+        with pytest.raises(KeyboardInterrupt):
+            call(breaker, error=KeyboardInterrupt())
+        assert breaker.state("payments") == STATE_HALF_OPEN
+        call(breaker)
+        assert breaker.state("payments") == STATE_CLOSED
+
+    def test_check_does_not_admit(self):
+        breaker, clock, _ = make_breaker(half_open_calls=1)
+        breaker.check("payments")
+        fail(breaker, times=4)
+        with pytest.raises(CircuitOpenError):
+            breaker.check("payments")
+
+        clock.now += 10
+        breaker.check("payments")
+        breaker.check("payments")
+        assert breaker.state("payments") == STATE_OPEN
+
+    def test_reset(self):
+        breaker, _, changes = make_breaker()
+        fail(breaker, times=4)
+        breaker.reset()
+        assert breaker.state("payments") == STATE_CLOSED
+        assert changes[-1] == ("payments", STATE_OPEN, STATE_CLOSED)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"minimum_calls": 0},
+            {"window_size": 5, "minimum_calls": 6},
+            {"failure_rate_threshold": 0},
+            {"slow_call_rate_threshold": 1.5},
+            {"half_open_calls": 0},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            CircuitBreaker(**kwargs)
+
+
+class TestClientIntegration:
+    """Test cases for the circuit breaker inside the clients."""
+
+    def test_open_circuit_stops_retries(self):
+        breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        auth = CardinityAuth("test_key", "test_secret")
+        client = CardinityClient(
+            auth,
+            retry_policy=RetryPolicy(max_retries=5, sleep=Mock()),
+            circuit_breaker=breaker,
+        )
+
+        with patch.object(
+            client.session, "request", return_value=make_response(503)
+        ) as request, pytest.raises(CircuitOpenError):
+            client.get("payments/abc")
+
+        # Two failures open the circuit; the third attempt is never sent
+        assert request.call_count == 2
+        assert breaker.state("payments") == STATE_OPEN
+
+        with patch.object(client.session, "request") as request:
+            with pytest.raises(CircuitOpenError):
+                client.get("payments/abc")
+            request.assert_not_called()
+        client.close()
+
+    def test_circuit_opening_during_token_wait_releases_token(self):
+        breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        clock = FakeClock()
+
+        def sleep(delay):
+            # Other requests trip the circuit while this one waits
+            clock.sleep(delay)
+            for _ in range(2):
+                breaker.record("payments", 0.0, True)
+
+        limiter = RateLimiter(rate=1, burst=1, sleep=sleep, clock=clock)
+        limiter.reserve("payments")
+        client = CardinityClient(
+            CardinityAuth("test_key", "test_secret"),
+            circuit_breaker=breaker,
+            rate_limiter=limiter,
+        )
+
+        with patch.object(client.session, "request") as request, pytest.raises(
+            CircuitOpenError
+        ):
+            client.get("payments/abc")
+
+        request.assert_not_called()
+        # The rejected request gave its token back
+        assert limiter.reserve("payments") == pytest.approx(0.0)
+        client.close()
+
+    def test_successful_requests_are_recorded(self):
+        breaker = CircuitBreaker()
+        auth = CardinityAuth("test_key", "test_secret")
+        client = CardinityClient(auth, circuit_breaker=breaker)
+
+        with patch.object(
+            client.session, "request", return_value=make_response(200, {"id": "x"})
+        ):
+            assert client.get("payments") == {"id": "x"}
+
+        assert breaker.get_states() == {"payments": STATE_CLOSED}
+        client.close()
+
+    def test_async_client_fails_fast(self):
+        httpx = pytest.importorskip("httpx")
+        from cardinity.async_client import AsyncCardinityClient
+
+        breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"detail": "Down"})
+
+        async def scenario():
+            client = AsyncCardinityClient(
+                CardinityAuth("test_key", "test_secret"),
+                retry_policy=RetryPolicy(max_retries=5, backoff_base=0),
+                circuit_breaker=breaker,
+                transport=httpx.MockTransport(handler),
+            )
+            async with client:
+                with pytest.raises(CircuitOpenError):
+                    await client.get("payments")
+
+        asyncio.run(scenario())
+        assert len(calls) == 2
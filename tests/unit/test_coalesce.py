@@ -0,0 +1,216 @@
+"""
+Unit tests for single-flight request coalescing.
+"""
+
+import asyncio
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from cardinity.auth import CardinityAuth
+from cardinity.client import CardinityClient
+from cardinity.coalesce import AsyncSingleFlight, SingleFlight, request_key
+from cardinity.exceptions import NotFoundError
+
+
+class TestRequestKey:
+    """Test cases for request_key()."""
+
+    def test_parameter_order_is_ignored(self):
+        assert request_key("get", "/payments", {"a": 1, "b": 2}) == request_key(
+            "GET", "/payments", {"b": "2", "a": "1"}
+        )
+
+    def test_differences_matter(self):
+        key = request_key("GET", "/payments/p1")
+        assert key != request_key("GET", "/payments/p2")
+        assert key != request_key("HEAD", "/payments/p1")
+        assert key != request_key("GET", "/payments/p1", {"limit": 1})
+
+
+class TestSingleFlight:
+    """Test cases for the threaded SingleFlight."""
+
+    def test_concurrent_calls_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {"id": "p1", "card": {"pan": "4111"}}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(flight.do, "key", fn) for _ in range(5)]
+            while flight.stats()["shared"] < 4:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert len(calls) == 1
+        assert all(
+            result == {"id": "p1", "card": {"pan": "4111"}} for result in results
+        )
+        # Every caller gets its own copy
+        assert len({id(result) for result in results}) == 5
+        assert flight.stats() == {"calls": 1, "shared": 4, "in_flight": 0}
+
+    def test_errors_are_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fn():
+            release.wait(timeout=5)
+            raise NotFoundError()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(flight.do, "key", fn) for _ in range(3)]
+            while flight.stats()["shared"] < 2:
+                threading.Event().wait(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(NotFoundError):
+                    future.result(timeout=5)
+
+        assert flight.stats()["calls"] == 1
+
+    def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight()
+        results = iter([1, 2])
+
+        assert flight.do("key", lambda: next(results)) == 1
+        assert flight.do("key", lambda: next(results)) == 2
+
+    def test_unshared_result_is_returned_as_is(self):
+        flight = SingleFlight()
+        result = {"id": "p1"}
+        assert flight.do("key", lambda: result) is result
+
+    def test_different_keys_run_separately(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.stats()["calls"] == 2
+
+
+class TestAsyncSingleFlight:
+    """Test cases for AsyncSingleFlight."""
+
+    def test_concurrent_calls_share_one_call(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "p1"}
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+
+        results = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert results == [{"id": "p1"}] * 5
+        assert len({id(result) for result in results}) == 5
+        assert flight.stats() == {"calls": 1, "shared": 4, "in_flight": 0}
+
+    def test_cancelling_one_caller_keeps_shared_call(self):
+        flight = AsyncSingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        async def scenario():
+            first = asyncio.ensure_future(flight.do("key", fn))
+            second = asyncio.ensure_future(flight.do("key", fn))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(scenario()) == "done"
+
+    def test_error_without_callers_is_retrieved(self):
+        flight = AsyncSingleFlight()
+        unhandled = []
+
+        async def fn():
+            await asyncio.sleep(0.01)
+            raise NotFoundError()
+
+        async def scenario():
+            asyncio.get_running_loop().set_exception_handler(
+                lambda loop, context: unhandled.append(context)
+            )
+            caller = asyncio.ensure_future(flight.do("key", fn))
+            await asyncio.sleep(0)
+            caller.cancel()
+            await asyncio.sleep(0.02)
+            gc.collect()
+
+        asyncio.run(scenario())
+        assert unhandled == []
+        assert flight.stats()["in_flight"] == 0
+
+    def test_errors_are_shared(self):
+        flight = AsyncSingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0)
+            raise NotFoundError()
+
+        async def scenario():
+            return await asyncio.gather(
+                flight.do("key", fn), flight.do("key", fn), return_exceptions=True
+            )
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(result, NotFoundError) for result in results)
+        assert flight.stats()["calls"] == 1
+
+
+class TestClientCoalescing:
+    """Test cases for coalescing inside CardinityClient."""
+
+    def test_identical_gets_share_one_request(self):
+        client = CardinityClient(CardinityAuth("test_key", "test_secret"))
+        release = threading.Event()
+        calls = []
+
+        def request(method, endpoint, data=None, params=None, deadline=None):
+            calls.append((method, endpoint, params))
+            release.wait(timeout=5)
+            return {"id": endpoint}
+
+        with patch.object(client, "_request", side_effect=request):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(client.get, "/payments/p1") for _ in range(3)
+                ]
+                futures.append(executor.submit(client.get, "/payments/p2"))
+                while client.single_flight.stats()["shared"] < 2:
+                    threading.Event().wait(0.001)
+                release.set()
+                results = [future.result(timeout=5) for future in futures]
+
+        assert results[:3] == [{"id": "/payments/p1"}] * 3
+        assert sorted(endpoint for _, endpoint, _ in calls) == [
+            "/payments/p1",
+            "/payments/p2",
+        ]
+
+    def test_coalescing_can_be_disabled(self):
+        client = CardinityClient(
+            CardinityAuth("test_key", "test_secret"), coalesce_reads=False
+        )
+        assert client.single_flight is None
+
+        with patch.object(client, "_request", return_value={"id": "p1"}) as request:
+            assert client.get("/payments/p1") == {"id": "p1"}
+        request.assert_called_once_with(
+            "GET", "/payments/p1", params=None, deadline=None
+        )
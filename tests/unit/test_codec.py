@@ -0,0 +1,117 @@
+"""
+Unit tests for the Cardinity JSON codecs.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from requests import Response
+
+from cardinity.client import decode_response
+from cardinity.codec import JSONCodec, available_codecs, get_codec
+from cardinity.exceptions import ServerError
+from tests.fixtures.mocks import make_client
+
+PAYLOAD = {
+    "amount": "10.00",
+    "currency": "EUR",
+    "description": "Ünïcödé €",
+    "payment_instrument": {"exp_year": 2030, "holder": "Mike Dough"},
+    "settle": True,
+    "threeds2_data": None,
+    "items": [1, 2.5, "three"],
+}
+
+
+@pytest.fixture(params=available_codecs())
+def codec(request):
+    """Every codec installed in this environment."""
+    return get_codec(request.param)
+
+
+class TestCodecs:
+    """Test cases shared by every installed codec."""
+
+    def test_round_trip(self, codec):
+        data = codec.dumps(PAYLOAD)
+        assert isinstance(data, bytes)
+        assert codec.loads(data) == PAYLOAD
+
+    def test_output_is_standard_json(self, codec):
+        assert json.loads(codec.dumps(PAYLOAD).decode("utf-8")) == PAYLOAD
+
+    def test_invalid_json_raises_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b"<html>Bad gateway</html>")
+
+
+class TestGetCodec:
+    """Test cases for get_codec()."""
+
+    def test_default_is_fastest_installed(self):
+        assert get_codec().name == available_codecs()[0]
+
+    def test_stdlib_always_available(self):
+        assert available_codecs()[-1] == "json"
+        assert type(get_codec("json")) is JSONCodec
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_missing_library(self):
+        with patch.dict("cardinity.codec._CODECS", {"ujson": (JSONCodec, None)}):
+            with pytest.raises(ImportError):
+                get_codec("ujson")
+
+
+class TestClientCodec:
+    """Test cases for the codec inside CardinityClient."""
+
+    def test_codec_option(self):
+        assert make_client(json_codec="json").codec.name == "json"
+        codec = JSONCodec()
+        assert make_client(json_codec=codec).codec is codec
+
+    def test_body_is_serialized_once(self):
+        codec = Mock(spec=JSONCodec, wraps=JSONCodec())
+        client = make_client(json_codec=codec)
+        failure = Mock(status_code=429, ok=False, reason="Too Many", headers={})
+        failure.json.return_value = {}
+        success = Mock(status_code=201, ok=True, headers={})
+        success.json.return_value = {"id": "p1"}
+
+        with patch.object(
+            client.session, "request", side_effect=[failure, success]
+        ) as request:
+            assert client.post("/payments", PAYLOAD) == {"id": "p1"}
+
+        codec.dumps.assert_called_once_with(PAYLOAD)
+        bodies = [call.kwargs["data"] for call in request.call_args_list]
+        assert bodies[0] is bodies[1]
+        assert json.loads(bodies[0]) == PAYLOAD
+
+    def test_response_decoded_from_bytes(self, codec):
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps([PAYLOAD, PAYLOAD]).encode("utf-8")
+
+        with patch.object(Response, "json", side_effect=AssertionError):
+            assert decode_response(codec, response) == [PAYLOAD, PAYLOAD]
+
+    def test_falls_back_to_response_json(self):
+        response = Mock()
+        response.json.return_value = {"id": "p1"}
+        assert decode_response(JSONCodec(), response) == {"id": "p1"}
+
+    def test_invalid_json_response(self):
+        client = make_client()
+        response = Response()
+        response.status_code = 502
+        response.reason = "Bad Gateway"
+        response._content = b"<html>Bad gateway</html>"
+
+        with pytest.raises(ServerError) as exc_info:
+            client._parse_response(response)
+        assert exc_info.value.status_code == 502
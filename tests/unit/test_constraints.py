@@ -4,6 +4,17 @@ Unit tests for Cardinity validation constraints.
 This module tests the validation constraints functionality.
 """
 
+import copy
+import pickle
+
+import pytest
+
+from cardinity.utils import FrozenDict, FrozenSetList, thaw
+from cardinity.validation import (
+    SUPPORTED_COUNTRY_CODES,
+    SUPPORTED_CURRENCY_CODES,
+    validate_data,
+)
 from cardinity.validation.constraints import (
     CHALLENGE_WINDOW_SIZES,
     SUPPORTED_COUNTRIES,
@@ -109,3 +120,114 @@ class TestConstraints:
         assert len(CHALLENGE_WINDOW_SIZES) == 5
         assert "01" in CHALLENGE_WINDOW_SIZES
         assert "05" in CHALLENGE_WINDOW_SIZES
+
+
+class TestCachedSchemas:
+    """Test that schema builders return shared, read-only schemas."""
+
+    def test_schema_built_once(self):
+        """Test repeated calls return the same schema object."""
+        assert (
+            Constraints.create_payment_schema() is Constraints.create_payment_schema()
+        )
+        assert Constraints.country() is Constraints.country()
+
+    def test_nested_schemas_are_shared(self):
+        """Test composite schemas reuse the cached field schemas."""
+        schema = Constraints.create_payment_schema()
+
+        assert schema["country"] is Constraints.country()
+        assert schema["billing_address"]["schema"]["country"] is Constraints.country()
+
+    def test_finalize_schema_cached_per_flag(self):
+        """Test default, positional and keyword flags share one cache entry."""
+        v1 = Constraints.finalize_payment_schema()
+
+        assert Constraints.finalize_payment_schema(False) is v1
+        assert Constraints.finalize_payment_schema(is_threedsv2=False) is v1
+        assert Constraints.finalize_payment_schema(True) is not v1
+        assert "cres" in Constraints.finalize_payment_schema(True)
+
+    def test_schema_cannot_be_mutated(self):
+        """Test the shared schema rejects mutation at every level."""
+        schema = Constraints.create_payment_schema()
+
+        assert isinstance(schema, FrozenDict)
+        with pytest.raises(TypeError):
+            schema["amount"] = {}
+        with pytest.raises(TypeError):
+            schema["amount"]["required"] = False
+        with pytest.raises(TypeError):
+            del schema["currency"]
+        with pytest.raises(TypeError):
+            schema.update({"extra": {}})
+        with pytest.raises(TypeError):
+            schema["country"]["allowed"].append("XX")
+
+        assert "XX" not in Constraints.country()["allowed"]
+
+    def test_mutable_copies(self):
+        """Test callers can derive mutable copies of a cached schema."""
+        schema = Constraints.create_refund_schema()
+
+        shallow = schema.copy()
+        shallow["extra"] = {"type": "string"}
+        deep = thaw(schema)
+        deep["amount"]["required"] = False
+
+        assert "extra" not in schema
+        assert schema["amount"]["required"] is True
+        assert copy.deepcopy(schema) == schema
+        assert pickle.loads(pickle.dumps(schema)) == schema
+
+    def test_frozen_schema_validates(self):
+        """Test frozen schemas can be used with validate_data directly."""
+        schema = Constraints.create_refund_schema()
+
+        assert validate_data({"amount": "10.00"}, schema) is None
+        assert "amount" in validate_data({"amount": "0.10"}, schema)
+
+
+class TestAllowLists:
+    """Test the set-backed currency and country allow-lists."""
+
+    def test_code_sets(self):
+        """Test the public frozensets mirror the supported code lists."""
+        assert SUPPORTED_CURRENCY_CODES == frozenset(SUPPORTED_CURRENCIES)
+        assert SUPPORTED_COUNTRY_CODES == frozenset(SUPPORTED_COUNTRIES)
+        assert "EUR" in SUPPORTED_CURRENCY_CODES
+        assert "LT" in SUPPORTED_COUNTRY_CODES
+
+    def test_schemas_use_set_backed_lists(self):
+        """Test schemas keep list semantics while using O(1) membership."""
+        currency = Constraints.currency()["allowed"]
+        country = Constraints.country()["allowed"]
+
+        assert isinstance(currency, FrozenSetList)
+        assert isinstance(country, FrozenSetList)
+        assert list(country) == SUPPORTED_COUNTRIES
+        assert country.members == SUPPORTED_COUNTRY_CODES
+        assert "LT" in country
+        assert "XX" not in country
+        assert {"unhashable": True} not in country
+
+    def test_thaw_keeps_set_backed_lists(self):
+        """Test thawed schemas keep the set-backed allow-lists."""
+        schema = thaw(Constraints.create_payment_link_schema())
+
+        assert isinstance(schema["country"]["allowed"], FrozenSetList)
+
+    def test_unsupported_codes_rejected(self):
+        """Test unsupported codes are still rejected by validation."""
+        schema = Constraints.create_payment_link_schema()
+        data = {
+            "amount": "10.00",
+            "currency": "XXX",
+            "description": "test",
+            "country": "ZZ",
+        }
+
+        errors = validate_data(data, schema)
+
+        assert errors["currency"] == ["unallowed value XXX"]
+        assert errors["country"] == ["unallowed value ZZ"]
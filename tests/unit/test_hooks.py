@@ -0,0 +1,221 @@
+"""
+Unit tests for the Cardinity request hooks.
+"""
+
+import asyncio
+import json
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from cardinity import Cardinity
+from cardinity.auth import CardinityAuth
+from cardinity.exceptions import CardinityError, NotFoundError
+from cardinity.hooks import EVENTS, RequestEvent, RequestHooks
+from cardinity.retry import RetryPolicy
+from cardinity.testing import CardinityTestServer
+from tests.fixtures.mocks import make_client
+from tests.fixtures.test_data import TestPaymentData
+
+
+def response(status_code=200, body=None):
+    """Build a mocked requests response."""
+    mock = Mock(status_code=status_code, ok=status_code < 400, headers={})
+    mock.reason = "Not Found" if status_code == 404 else "OK"
+    mock.elapsed = timedelta(milliseconds=5)
+    mock.content = json.dumps(body if body is not None else {"id": "p1"}).encode()
+    return mock
+
+
+class Recorder:
+    """Hooks recording the name and a snapshot of every event."""
+
+    def __init__(self):
+        self.calls = []
+        self.hooks = RequestHooks()
+        for name in EVENTS:
+            self.hooks.add(name, self._recorder(name))
+
+    def _recorder(self, name):
+        return lambda event: self.calls.append((name, event.to_dict()))
+
+    @property
+    def names(self):
+        return [name for name, _ in self.calls]
+
+
+class TestRequestHooks:
+    """Test cases for the RequestHooks registry."""
+
+    def test_empty_registry_is_falsy(self):
+        hooks = RequestHooks()
+        assert not hooks
+
+        handler = hooks.add("on_response", Mock())
+        assert hooks
+        hooks.remove("on_response", handler)
+        assert not hooks
+
+    def test_constructor_handlers(self):
+        handler = Mock()
+        hooks = RequestHooks(on_complete=handler)
+        event = hooks.start("GET", "/payments", "https://api/payments")
+        hooks.complete(event)
+        handler.assert_called_once_with(event)
+        assert event.elapsed >= 0
+
+    def test_unknown_hook(self):
+        with pytest.raises(ValueError):
+            RequestHooks().add("on_nothing", Mock())
+
+    def test_attempt_resets_per_attempt_fields(self):
+        hooks = RequestHooks()
+        event = RequestEvent("GET", "/payments", "https://api/payments")
+        hooks.attempt(event)
+        event.status_code = 503
+        event.phases["send"] = 1.0
+        hooks.attempt(event)
+        assert event.attempt == 2
+        assert event.status_code is None
+        assert event.phases == {}
+
+    def test_url_without_query(self):
+        event = RequestEvent(
+            "GET", "/payments?limit=10", "https://api/payments?limit=10"
+        )
+        assert event.url == "https://api/payments"
+        assert event.endpoint == "/payments?limit=10"
+
+
+class TestClientHooks:
+    """Test cases for hooks in CardinityClient."""
+
+    def test_no_instrumentation_without_handlers(self):
+        client = make_client()
+        with patch.object(client, "_send_traced") as traced:
+            with patch.object(client.session, "request", return_value=response()):
+                client.get("/payments/p1")
+        traced.assert_not_called()
+
+    def test_successful_request(self):
+        recorder = Recorder()
+        client = make_client(hooks=recorder.hooks)
+        with patch.object(client.session, "request", return_value=response()):
+            client.get("/payments/p1")
+
+        assert recorder.names == ["on_request_start", "on_response", "on_complete"]
+        _, complete = recorder.calls[-1]
+        assert complete["method"] == "GET"
+        assert complete["endpoint"] == "/payments/p1"
+        assert complete["attempt"] == 1
+        assert complete["status_code"] == 200
+        assert complete["error"] is None
+        assert set(complete["phases"]) == {"send", "read", "parse"}
+        assert complete["phases"]["send"] == 0.005
+        assert complete["response_size"] == len(b'{"id": "p1"}')
+
+    def test_retried_request(self):
+        recorder = Recorder()
+        client = make_client(hooks=recorder.hooks)
+        with patch.object(
+            client.session,
+            "request",
+            side_effect=[ConnectionError("reset"), response(503), response()],
+        ):
+            client.get("/payments/p1")
+
+        assert recorder.names == [
+            "on_request_start",
+            "on_error",
+            "on_retry",
+            "on_response",
+            "on_error",
+            "on_retry",
+            "on_response",
+            "on_complete",
+        ]
+        retry = recorder.calls[5][1]
+        assert retry["attempt"] == 2
+        assert retry["status_code"] == 503
+        assert retry["retry_delay"] is not None
+        assert recorder.calls[-1][1]["attempt"] == 3
+
+    def test_failed_request(self):
+        recorder = Recorder()
+        client = make_client(hooks=recorder.hooks)
+        with patch.object(client.session, "request", return_value=response(404)):
+            with pytest.raises(NotFoundError):
+                client.get("/payments/missing")
+
+        assert recorder.names[-2:] == ["on_error", "on_complete"]
+        complete = recorder.calls[-1][1]
+        assert isinstance(complete["error"], NotFoundError)
+        assert complete["status_code"] == 404
+
+    def test_transport_failure(self):
+        recorder = Recorder()
+        client = make_client(hooks=recorder.hooks)
+        with patch.object(
+            client.session, "request", side_effect=ConnectionError("refused")
+        ):
+            with pytest.raises(CardinityError):
+                client.post("/payments", {"amount": "10.00"})
+
+        assert recorder.names == ["on_request_start", "on_error", "on_complete"]
+        assert isinstance(recorder.calls[-1][1]["error"], CardinityError)
+
+    def test_signing_is_timed_end_to_end(self):
+        recorder = Recorder()
+        with CardinityTestServer() as server:
+            cardinity = Cardinity(
+                "key", "secret", base_url=server.base_url, hooks=recorder.hooks
+            )
+            cardinity.create_payment(**TestPaymentData.successful_payment())
+
+        assert recorder.names == [
+            "on_request_start",
+            "on_signed",
+            "on_response",
+            "on_complete",
+        ]
+        phases = recorder.calls[-1][1]["phases"]
+        assert set(phases) == {"sign", "send", "read", "parse"}
+        assert all(duration >= 0 for duration in phases.values())
+
+
+class TestAsyncClientHooks:
+    """Test cases for hooks in AsyncCardinityClient."""
+
+    def test_retried_request(self):
+        httpx = pytest.importorskip("httpx")
+        from cardinity.async_client import AsyncCardinityClient
+
+        statuses = iter([503, 200])
+        recorder = Recorder()
+
+        def handler(request):
+            return httpx.Response(next(statuses), json={"id": "p1"})
+
+        async def scenario():
+            async with AsyncCardinityClient(
+                CardinityAuth("test_key", "test_secret"),
+                transport=httpx.MockTransport(handler),
+                hooks=recorder.hooks,
+                retry_policy=RetryPolicy(backoff_base=0),
+            ) as client:
+                return await client.get("/payments/p1")
+
+        assert asyncio.run(scenario()) == {"id": "p1"}
+        assert recorder.names == [
+            "on_request_start",
+            "on_signed",
+            "on_response",
+            "on_error",
+            "on_retry",
+            "on_signed",
+            "on_response",
+            "on_complete",
+        ]
+        assert set(recorder.calls[-1][1]["phases"]) == {"sign", "send", "parse"}
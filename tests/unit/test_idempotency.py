@@ -0,0 +1,261 @@
+"""
+Unit tests for Cardinity idempotency keys and the idempotency ledger.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from cardinity import Cardinity
+from cardinity.auth import CardinityAuth
+from cardinity.client import CardinityClient
+from cardinity.exceptions import CardinityError, IdempotencyError, ServerError
+from cardinity.idempotency import (
+    IDEMPOTENCY_HEADER,
+    IdempotencyLedger,
+    derive_idempotency_key,
+)
+from cardinity.retry import RetryPolicy
+from tests.fixtures.mocks import FakeClock, make_client
+from tests.fixtures.test_data import TestPaymentData
+
+PAYMENT = {"amount": "10.00", "currency": "EUR", "order_id": "order-1"}
+
+
+def response(status_code=201, body=None):
+    """Build a mocked requests response."""
+    mock = Mock(status_code=status_code, ok=status_code < 400, headers={})
+    mock.reason = "Service Unavailable" if status_code >= 500 else "Created"
+    mock.json.return_value = body if body is not None else {"id": "p1"}
+    return mock
+
+
+class TestIdempotencyKeys:
+    """Test cases for idempotency key derivation."""
+
+    def test_derived_from_order_id(self):
+        key = derive_idempotency_key("/payments", PAYMENT)
+        assert key == derive_idempotency_key("/payments", dict(PAYMENT))
+        assert key != derive_idempotency_key("/payments", {"order_id": "order-2"})
+        assert key != derive_idempotency_key("/payments/p1/refunds", PAYMENT)
+
+    def test_derived_from_whole_payload(self):
+        """Charges on the same order with another payload get other keys."""
+        key = derive_idempotency_key("/payments", PAYMENT)
+        assert key != derive_idempotency_key(
+            "/payments", {**PAYMENT, "amount": "20.00"}
+        )
+        recurring = {**PAYMENT, "payment_id": "p1"}
+        assert key != derive_idempotency_key("/payments", recurring)
+        reordered = dict(reversed(list(PAYMENT.items())))
+        assert key == derive_idempotency_key("/payments", reordered)
+
+    def test_no_order_id(self):
+        assert derive_idempotency_key("/payments", {"amount": "10.00"}) is None
+        assert derive_idempotency_key("/payments", {"order_id": ""}) is None
+        assert derive_idempotency_key("/payments", None) is None
+
+
+class TestIdempotencyLedger:
+    """Test cases for IdempotencyLedger."""
+
+    def test_replays_recorded_response(self):
+        ledger = IdempotencyLedger()
+        assert ledger.get("k1", PAYMENT) is None
+        ledger.record("k1", PAYMENT, {"id": "p1"})
+
+        replayed = ledger.get("k1", dict(PAYMENT))
+        assert replayed == {"id": "p1"}
+        replayed["id"] = "changed"
+        assert ledger.get("k1", PAYMENT) == {"id": "p1"}
+        assert ledger.stats() == {"replays": 2, "entries": 1}
+
+    def test_payload_mismatch(self):
+        ledger = IdempotencyLedger()
+        ledger.record("k1", PAYMENT, {"id": "p1"})
+        with pytest.raises(IdempotencyError) as exc_info:
+            ledger.get("k1", {**PAYMENT, "amount": "20.00"})
+        assert exc_info.value.key == "k1"
+
+    def test_entries_expire(self):
+        clock = FakeClock()
+        ledger = IdempotencyLedger(ttl=60, clock=clock)
+        ledger.record("k1", PAYMENT, {"id": "p1"})
+        clock.now = 60
+        assert ledger.get("k1", PAYMENT) is None
+        assert len(ledger) == 0
+
+    def test_oldest_entry_is_evicted(self):
+        ledger = IdempotencyLedger(max_entries=2)
+        for key in ("k1", "k2", "k3"):
+            ledger.record(key, PAYMENT, {"id": key})
+        assert ledger.get("k1", PAYMENT) is None
+        assert ledger.get("k3", PAYMENT) == {"id": "k3"}
+
+    def test_forget(self):
+        ledger = IdempotencyLedger()
+        ledger.record("k1", PAYMENT, {"id": "p1"})
+        ledger.forget("k1")
+        assert ledger.get("k1", PAYMENT) is None
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            IdempotencyLedger(max_entries=0)
+
+
+class TestClientIdempotency:
+    """Test cases for idempotency keys in CardinityClient."""
+
+    def test_key_is_sent_and_kept_across_retries(self):
+        client = make_client(derive_idempotency_keys=True)
+        with patch.object(
+            client.session,
+            "request",
+            side_effect=[response(429), response()],
+        ) as request:
+            client.post("/payments", PAYMENT)
+
+        headers = [call.kwargs["headers"] for call in request.call_args_list]
+        assert headers[0] == headers[1]
+        assert headers[0][IDEMPOTENCY_HEADER] == derive_idempotency_key(
+            "/payments", PAYMENT
+        )
+
+    def test_no_key_by_default(self):
+        client = make_client(idempotency_ledger=IdempotencyLedger())
+        with patch.object(client.session, "request", return_value=response()) as req:
+            client.post("/payments", PAYMENT)
+            client.post("/payments", PAYMENT)
+            client.post("/payments", PAYMENT, idempotency_key="explicit")
+
+        headers = [call.kwargs["headers"] for call in req.call_args_list]
+        assert headers == [None, None, {IDEMPOTENCY_HEADER: "explicit"}]
+
+    def test_no_derived_key_without_order_id(self):
+        client = make_client(derive_idempotency_keys=True)
+        with patch.object(client.session, "request", return_value=response()) as req:
+            client.post("/payments", {"amount": "10.00"})
+        assert req.call_args.kwargs["headers"] is None
+
+    def test_ledger_replays_repeated_submission(self):
+        client = make_client(
+            idempotency_ledger=IdempotencyLedger(), derive_idempotency_keys=True
+        )
+        with patch.object(client.session, "request", return_value=response()) as req:
+            first = client.post("/payments", PAYMENT)
+            second = client.post("/payments", dict(PAYMENT))
+            third = client.post("/payments", PAYMENT, idempotency_key="explicit")
+
+        assert first == second == third == {"id": "p1"}
+        assert req.call_count == 2
+
+    def test_ledger_charges_other_payloads_on_the_same_order(self):
+        """A recurring charge reusing the order_id is not replayed."""
+        client = make_client(
+            idempotency_ledger=IdempotencyLedger(), derive_idempotency_keys=True
+        )
+        with patch.object(client.session, "request", return_value=response()) as req:
+            client.post("/payments", PAYMENT)
+            client.post("/payments", {**PAYMENT, "payment_id": "p1"})
+        assert req.call_count == 2
+
+    def test_failures_are_not_recorded(self):
+        client = make_client(
+            idempotency_ledger=IdempotencyLedger(), derive_idempotency_keys=True
+        )
+        with patch.object(
+            client.session, "request", side_effect=[response(503), response()]
+        ) as request:
+            with pytest.raises(ServerError):
+                client.post("/payments", PAYMENT)
+            assert client.post("/payments", PAYMENT) == {"id": "p1"}
+        assert request.call_count == 2
+
+    def test_concurrent_submissions_share_one_request(self):
+        client = make_client(
+            idempotency_ledger=IdempotencyLedger(), derive_idempotency_keys=True
+        )
+
+        def slow_request(**kwargs):
+            time.sleep(0.05)
+            return response()
+
+        with patch.object(client.session, "request", side_effect=slow_request) as req:
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(client.post("/payments", PAYMENT))
+                )
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert results == [{"id": "p1"}] * 4
+        assert req.call_count == 1
+
+    def test_keyed_posts_retried_when_enabled(self):
+        policy = RetryPolicy(retry_idempotency_keyed=True, sleep=Mock())
+        client = make_client(retry_policy=policy, derive_idempotency_keys=True)
+        with patch.object(
+            client.session,
+            "request",
+            side_effect=[response(503), ConnectionError("reset"), response()],
+        ) as request:
+            assert client.post("/payments", PAYMENT) == {"id": "p1"}
+        assert request.call_count == 3
+
+    def test_keyed_posts_not_retried_by_default(self):
+        client = make_client(derive_idempotency_keys=True)
+        with patch.object(
+            client.session, "request", side_effect=ConnectionError("reset")
+        ) as request:
+            with pytest.raises(CardinityError):
+                client.post("/payments", PAYMENT)
+        assert request.call_count == 1
+
+
+class TestSdkIdempotency:
+    """Test cases for idempotency keys in the SDK."""
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_explicit_key_is_forwarded(self, mock_execute):
+        mock_execute.return_value = {"id": "p1"}
+        cardinity = Cardinity("key", "secret")
+
+        cardinity.create_payment(
+            idempotency_key="checkout-42", **TestPaymentData.successful_payment()
+        )
+        assert mock_execute.call_args.kwargs["idempotency_key"] == "checkout-42"
+
+    def test_async_ledger_replays_repeated_submission(self):
+        httpx = pytest.importorskip("httpx")
+        from cardinity.async_client import AsyncCardinityClient
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers[IDEMPOTENCY_HEADER])
+            return httpx.Response(201, json={"id": "p1"})
+
+        async def scenario():
+            async with AsyncCardinityClient(
+                CardinityAuth("test_key", "test_secret"),
+                transport=httpx.MockTransport(handler),
+                idempotency_ledger=IdempotencyLedger(),
+                derive_idempotency_keys=True,
+            ) as client:
+                return await asyncio.gather(
+                    *(client.post("/payments", PAYMENT) for _ in range(3))
+                ), await client.post("/payments", PAYMENT)
+
+        concurrent, repeated = asyncio.run(scenario())
+        assert concurrent == [{"id": "p1"}] * 3
+        assert repeated == {"id": "p1"}
+        assert calls == [derive_idempotency_key("/payments", PAYMENT)]
@@ -0,0 +1,193 @@
+"""
+Unit tests for the Cardinity client metrics.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from cardinity import Cardinity
+from cardinity.exceptions import APIError, CardinityError
+from cardinity.hooks import RequestHooks
+from cardinity.metrics import (
+    BUCKET_COUNT,
+    ClientMetrics,
+    LatencyHistogram,
+    bucket_index,
+    bucket_upper_bound,
+)
+from cardinity.testing import CardinityTestServer
+from cardinity.utils import endpoint_template
+from tests.fixtures.test_data import TestPaymentData
+
+
+def complete(hooks, endpoint="/payments/p1", status_code=200, elapsed=0.01, **kw):
+    """Report a finished request to hooks, as a client does."""
+    event = hooks.start(kw.get("method", "GET"), endpoint, "https://api" + endpoint)
+    hooks.attempt(event)
+    if status_code:
+        hooks.response(event, status_code, 10, 100)
+    event.started -= elapsed
+    hooks.complete(event, kw.get("error"))
+    return event
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram and its buckets."""
+
+    @pytest.mark.parametrize("seconds", [1e-4, 0.001, 0.0123, 0.5, 1.0, 42.0])
+    def test_bucket_bounds(self, seconds):
+        index = bucket_index(seconds)
+        assert bucket_upper_bound(index - 1) <= seconds < bucket_upper_bound(index)
+        assert bucket_upper_bound(index) <= seconds * 1.25
+
+    def test_out_of_range(self):
+        assert bucket_index(0) == 0
+        assert bucket_index(1e-9) == 0
+        assert bucket_index(1e9) == BUCKET_COUNT - 1
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+        assert histogram.count == 100
+        assert 0.05 <= histogram.percentile(50) <= 0.05 * 1.25
+        assert histogram.percentile(99) == histogram.percentile(100) == 0.1
+        assert LatencyHistogram().percentile(50) == 0.0
+
+    def test_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.01)
+        second.record(1.0)
+        first.merge(second)
+        assert (first.count, first.min, first.max) == (2, 0.01, 1.0)
+
+
+class TestClientMetrics:
+    """Test cases for ClientMetrics."""
+
+    def test_endpoint_template(self):
+        assert endpoint_template("/payments/p1/refunds/r1") == (
+            "/payments/{id}/refunds/{id}"
+        )
+        assert endpoint_template("/payments?limit=10") == "/payments"
+
+    def test_snapshot(self):
+        metrics = ClientMetrics()
+        hooks = metrics.hooks
+        complete(hooks, "/payments/p1")
+        complete(hooks, "/payments/p2", elapsed=0.02)
+        complete(hooks, "/payments/p3", status_code=404, error=APIError("x"))
+
+        snapshot = metrics.snapshot()
+        ok, missing = snapshot["latency"]
+        assert (ok["endpoint"], ok["status"], ok["count"]) == (
+            "/payments/{id}",
+            "200",
+            2,
+        )
+        assert missing["status"] == "404"
+        assert snapshot["endpoints"] == [
+            {
+                "method": "GET",
+                "endpoint": "/payments/{id}",
+                "requests": 3,
+                "errors": 1,
+                "retries": 0,
+                "timeouts": 0,
+                "bytes_sent": 30,
+                "bytes_received": 300,
+            }
+        ]
+
+    def test_retries_and_timeouts(self):
+        metrics = ClientMetrics()
+        hooks = metrics.hooks
+        event = hooks.start("POST", "/payments", "https://api/payments")
+        hooks.attempt(event)
+        hooks.error(event, ReadTimeout("slow"))
+        hooks.retry(event, 0.5)
+        hooks.complete(event, CardinityError("failed"))
+
+        (counters,) = metrics.snapshot()["endpoints"]
+        assert (counters["retries"], counters["timeouts"]) == (1, 1)
+        assert metrics.snapshot()["latency"][0]["status"] == "error"
+
+    def test_threads_are_merged(self):
+        metrics = ClientMetrics()
+
+        def work():
+            for _ in range(100):
+                complete(metrics.hooks)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.snapshot()["latency"][0]["count"] == 400
+        metrics.reset()
+        assert metrics.snapshot() == {"latency": [], "endpoints": []}
+
+    def test_finished_threads_are_retired(self):
+        metrics = ClientMetrics()
+        complete(metrics.hooks)
+
+        for _ in range(3):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda _: complete(metrics.hooks), range(40)))
+
+        assert repr(metrics) == "ClientMetrics(shards=1)"
+        (latency,) = metrics.snapshot()["latency"]
+        assert latency["count"] == 121
+        (counters,) = metrics.snapshot()["endpoints"]
+        assert counters["requests"] == 121
+
+    def test_attach_and_detach(self):
+        metrics = ClientMetrics()
+        hooks = RequestHooks()
+        metrics.attach(hooks)
+        complete(hooks)
+        metrics.detach(hooks)
+        complete(hooks)
+        assert not hooks
+        assert metrics.snapshot()["endpoints"][0]["requests"] == 1
+
+    def test_prometheus(self):
+        metrics = ClientMetrics()
+        complete(metrics.hooks, "/payments/p1", elapsed=0.003)
+
+        text = metrics.render_prometheus()
+        assert "# TYPE cardinity_request_duration_seconds histogram" in text
+        assert (
+            'cardinity_request_duration_seconds_bucket{method="GET",'
+            'endpoint="/payments/{id}",status="200",le="+Inf"} 1'
+        ) in text
+        assert 'le="0.00390625"} 1' in text
+        assert 'le="0.001953125"} 0' in text
+        assert (
+            'cardinity_bytes_received_total{method="GET",endpoint="/payments/{id}"} 100'
+            in (text)
+        )
+        assert text.endswith("\n")
+
+    def test_end_to_end(self):
+        metrics = ClientMetrics()
+        with CardinityTestServer() as server:
+            cardinity = Cardinity(
+                "key", "secret", base_url=server.base_url, hooks=metrics.hooks
+            )
+            payment = cardinity.create_payment(**TestPaymentData.successful_payment())
+            cardinity.get_payment(payment["id"])
+
+        endpoints = {
+            (entry["method"], entry["endpoint"]): entry
+            for entry in metrics.snapshot()["endpoints"]
+        }
+        created = endpoints[("POST", "/payments")]
+        assert created["requests"] == 1
+        assert created["bytes_sent"] > 0
+        assert endpoints[("GET", "/payments/{id}")]["bytes_received"] > 0
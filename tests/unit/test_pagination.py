@@ -0,0 +1,210 @@
+"""
+Unit tests for the Cardinity pagination iterators.
+"""
+
+import threading
+import warnings
+
+import pytest
+
+from cardinity import Cardinity
+from cardinity.exceptions import CardinityError, ServerError
+from cardinity.pagination import Paginator
+
+
+class FakeListingClient:
+    """Client serving ``items`` page by page with an ``after`` cursor."""
+
+    def __init__(self, items, fail_after=None, ignore_cursor=False):
+        self.items = items
+        self.fail_after = fail_after
+        self.ignore_cursor = ignore_cursor
+        self.calls = []
+        self.threads = set()
+
+    def get(self, endpoint, params=None):
+        self.calls.append((endpoint, dict(params)))
+        self.threads.add(threading.current_thread().name)
+        start = 0
+        cursor = params.get("after")
+        if cursor is not None and not self.ignore_cursor:
+            if cursor == self.fail_after:
+                raise ServerError("Gateway down", 503)
+            ids = [item["id"] for item in self.items]
+            start = ids.index(cursor) + 1
+        return self.items[start : start + params["limit"]]
+
+
+def make_items(count):
+    return [{"id": f"p{i}"} for i in range(count)]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+class TestPaginator:
+    """Test cases for Paginator, with and without prefetching."""
+
+    def test_walks_every_page(self, prefetch):
+        client = FakeListingClient(make_items(7))
+        pages = Paginator(
+            client, "/payments", page_size=3, prefetch=prefetch, cursor_param="after"
+        )
+
+        assert [item["id"] for item in pages] == [f"p{i}" for i in range(7)]
+        assert [params for _, params in client.calls] == [
+            {"limit": 3},
+            {"limit": 3, "after": "p2"},
+            {"limit": 3, "after": "p5"},
+        ]
+        assert pages.cursor == "p6"
+
+    def test_exact_multiple_ends_on_empty_page(self, prefetch):
+        client = FakeListingClient(make_items(4))
+        pages = Paginator(
+            client, "/payments", page_size=2, prefetch=prefetch, cursor_param="after"
+        )
+
+        assert len(list(pages)) == 4
+        assert len(client.calls) == 3
+
+    def test_empty_listing(self, prefetch):
+        client = FakeListingClient([])
+        assert (
+            list(
+                Paginator(client, "/payments", prefetch=prefetch, cursor_param="after")
+            )
+            == []
+        )
+
+    def test_is_lazy(self, prefetch):
+        client = FakeListingClient(make_items(10))
+        pages = Paginator(
+            client, "/payments", page_size=2, prefetch=prefetch, cursor_param="after"
+        )
+        assert client.calls == []
+
+        iterator = iter(pages)
+        next(iterator)
+        next(iterator)
+        # At most the current page and the prefetched next one
+        assert len(client.calls) <= 2
+        iterator.close()
+
+    def test_resume_from_cursor_after_crash(self, prefetch):
+        items = make_items(6)
+        client = FakeListingClient(items, fail_after="p3")
+        pages = Paginator(
+            client, "/payments", page_size=2, prefetch=prefetch, cursor_param="after"
+        )
+
+        seen = []
+        with pytest.raises(ServerError):
+            for item in pages:
+                seen.append(item["id"])
+        assert pages.cursor == "p3"
+
+        client.fail_after = None
+        resumed = Paginator(
+            client,
+            "/payments",
+            page_size=2,
+            cursor=pages.cursor,
+            prefetch=prefetch,
+            cursor_param="after",
+        )
+        assert seen + [item["id"] for item in resumed] == [f"p{i}" for i in range(6)]
+
+    def test_cursor_tracks_processed_items(self, prefetch):
+        client = FakeListingClient(make_items(5))
+        pages = Paginator(
+            client, "/payments", page_size=2, prefetch=prefetch, cursor_param="after"
+        )
+
+        for item in pages:
+            if item["id"] == "p2":
+                break
+        # p2 was handed out but the consumer never finished with it
+        assert pages.cursor == "p1"
+
+    def test_ignored_cursor_is_detected(self, prefetch):
+        client = FakeListingClient(make_items(4), ignore_cursor=True)
+        pages = Paginator(
+            client, "/payments", page_size=2, prefetch=prefetch, cursor_param="after"
+        )
+
+        with pytest.raises(CardinityError, match="did not advance"):
+            list(pages)
+
+    def test_non_list_response(self, prefetch):
+        class DictClient:
+            def get(self, endpoint, params=None):
+                return {"id": "p1"}
+
+        with pytest.raises(CardinityError, match="Expected a list"):
+            list(
+                Paginator(
+                    DictClient(), "/payments", prefetch=prefetch, cursor_param="after"
+                )
+            )
+
+
+class TestPaginatorOptions:
+    """Test cases for Paginator options."""
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_single_page_without_cursor_param(self, prefetch):
+        """Without a cursor the first page is the last, with a warning if full."""
+        client = FakeListingClient(make_items(5))
+        pages = Paginator(client, "/payments", page_size=2, prefetch=prefetch)
+
+        with pytest.warns(UserWarning, match="may be truncated"):
+            assert [item["id"] for item in pages] == ["p0", "p1"]
+        assert [params for _, params in client.calls] == [{"limit": 2}]
+
+    def test_partial_page_does_not_warn(self):
+        client = FakeListingClient(make_items(1))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert len(list(Paginator(client, "/payments", page_size=2))) == 1
+
+    def test_cursor_requires_cursor_param(self):
+        with pytest.raises(ValueError, match="cursor_param"):
+            Paginator(FakeListingClient([]), "/payments", cursor="p1")
+
+    def test_prefetch_uses_background_thread(self):
+        client = FakeListingClient(make_items(5))
+        list(Paginator(client, "/payments", page_size=2, cursor_param="after"))
+        assert all(name.startswith("cardinity-pages") for name in client.threads)
+
+    def test_extra_params(self):
+        client = FakeListingClient(make_items(1))
+        list(Paginator(client, "/payments", params={"status": "approved"}))
+        assert client.calls[0][1] == {"status": "approved", "limit": 100}
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            Paginator(FakeListingClient([]), "/payments", page_size=0)
+
+
+class TestSdkIterators:
+    """Test cases for the Cardinity iter_* methods."""
+
+    def test_iter_payments(self):
+        cardinity = Cardinity("test_key", "test_secret")
+        client = FakeListingClient(make_items(3))
+        cardinity._client = client
+
+        pages = cardinity.iter_payments(page_size=2, cursor="p0", cursor_param="after")
+        assert [item["id"] for item in pages] == ["p1", "p2"]
+        assert client.calls[0] == ("/payments", {"limit": 2, "after": "p0"})
+
+    def test_iter_chargebacks(self):
+        cardinity = Cardinity("test_key", "test_secret")
+        client = FakeListingClient(make_items(1))
+        cardinity._client = client
+
+        list(cardinity.iter_chargebacks())
+        list(cardinity.iter_chargebacks("payment_1", prefetch=False))
+        assert [endpoint for endpoint, _ in client.calls] == [
+            "/payments/chargebacks",
+            "/payments/payment_1/chargebacks/",
+        ]
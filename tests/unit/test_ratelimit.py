@@ -0,0 +1,237 @@
+"""
+Unit tests for the Cardinity client-side rate limiter.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cardinity.exceptions import DeadlineExceededError, RateLimitError
+from cardinity.ratelimit import RateLimiter, TokenBucket
+from cardinity.retry import RetryPolicy
+from cardinity.utils import endpoint_family
+from tests.fixtures.mocks import FakeClock, make_client, make_response
+
+
+class TestEndpointFamily:
+    """Test cases for endpoint_family()."""
+
+    @pytest.mark.parametrize(
+        "endpoint, family",
+        [
+            ("payments", "payments"),
+            ("/payments/abc", "payments"),
+            ("payments/abc/refunds", "refunds"),
+            ("payments/abc/refunds/def", "refunds"),
+            ("payments/abc/settlements", "settlements"),
+            ("payments/abc/voids", "voids"),
+            ("paymentLinks/xyz", "paymentLinks"),
+            ("payments?limit=10", "payments"),
+            ("chargebacks", "chargebacks"),
+            ("other/thing", "other"),
+            ("", ""),
+        ],
+    )
+    def test_families(self, endpoint, family):
+        assert endpoint_family(endpoint) == family
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_spacing(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+        # Further callers queue up behind each other at the bucket's rate
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refill_is_capped(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=3, clock=clock)
+        for _ in range(3):
+            bucket.reserve()
+        clock.now = 100.0
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() > 0
+
+    def test_refund(self):
+        bucket = TokenBucket(rate=1, capacity=1, clock=FakeClock())
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+        bucket.refund()
+        assert bucket.reserve() == pytest.approx(1.0)
+        bucket.refund(5)
+        # Refunds never fill the bucket past its capacity
+        assert [bucket.reserve() for _ in range(2)] == [0.0, pytest.approx(1.0)]
+
+    def test_pause(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=4, clock=clock)
+        bucket.pause(2.0)
+        assert bucket.reserve() == pytest.approx(2.25)
+
+    @pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1, "capacity": 0}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            TokenBucket(**kwargs)
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    def make_limiter(self, **kwargs):
+        clock = FakeClock()
+        limiter = RateLimiter(sleep=clock.sleep, clock=clock, **kwargs)
+        return limiter, clock
+
+    def test_acquire_sleeps_for_tokens(self):
+        limiter, clock = self.make_limiter(rate=1, burst=1)
+        limiter.acquire("payments")
+        limiter.acquire("payments")
+        limiter.acquire("payments/abc")
+        assert clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+
+    def test_families_are_isolated(self):
+        limiter, clock = self.make_limiter(rate=1, burst=1)
+        limiter.acquire("payments/abc/refunds")
+        limiter.acquire("payments")
+        limiter.acquire("payments/abc/settlements")
+        assert clock.sleeps == []
+        assert limiter.bucket("payments/x/refunds/y") is limiter.bucket("refunds")
+
+    def test_family_rates(self):
+        limiter, _ = self.make_limiter(rate=10, family_rates={"refunds": 2})
+        limiter.acquire("payments")
+        limiter.acquire("payments/abc/refunds")
+        assert limiter.get_rates() == {"payments": 10.0, "refunds": 2.0}
+
+    def test_decrease_on_rate_limit(self):
+        limiter, clock = self.make_limiter(rate=8, min_rate=1.5)
+        limiter.on_rate_limited("payments")
+        assert limiter.bucket("payments").rate == 4.0
+        for _ in range(2):
+            clock.now += 1
+            limiter.on_rate_limited("payments")
+        assert limiter.bucket("payments").rate == 1.5
+        assert limiter.bucket("refunds").rate == 8.0
+
+    def test_concurrent_rate_limits_decrease_once(self):
+        limiter, clock = self.make_limiter(rate=8, decrease_interval=0.5)
+        for _ in range(4):
+            limiter.on_rate_limited("payments", retry_after=2)
+        assert limiter.bucket("payments").rate == 4.0
+
+        # The Retry-After delay outlasts the decrease interval
+        clock.now += 1
+        limiter.on_rate_limited("payments")
+        assert limiter.bucket("payments").rate == 4.0
+        clock.now += 1
+        limiter.on_rate_limited("payments")
+        assert limiter.bucket("payments").rate == 2.0
+
+    def test_increase_on_success_up_to_target(self):
+        limiter, _ = self.make_limiter(rate=8, increase=1)
+        limiter.on_rate_limited("payments")
+        for expected in (5.0, 6.0, 7.0, 8.0, 8.0):
+            limiter.on_success("payments")
+            assert limiter.bucket("payments").rate == expected
+
+    def test_retry_after_pauses_family(self):
+        limiter, clock = self.make_limiter(rate=2, burst=2)
+        limiter.on_rate_limited("payments", retry_after=3)
+        limiter.acquire("payments")
+        # Paused for 3s, then one token at the halved rate of 1/s
+        assert clock.sleeps == [pytest.approx(4.0)]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_rate": 0},
+            {"decrease_factor": 1},
+            {"decrease_factor": 0},
+            {"decrease_interval": -1},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+    def test_thread_safety(self):
+        limiter, _ = self.make_limiter(rate=100, burst=100)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                wait = limiter.reserve("payments")
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 400 reservations on a frozen clock: 100 free, then one every 10ms
+        assert len(limiter.get_rates()) == 1
+        assert sorted(waits)[-1] == pytest.approx(3.0)
+        assert waits.count(0.0) == 100
+
+
+class TestClientIntegration:
+    """Test cases for the rate limiter inside CardinityClient."""
+
+    def make_client(self, limiter):
+        policy = RetryPolicy(jitter="none", sleep=Mock())
+        return make_client(retry_policy=policy, rate_limiter=limiter)
+
+    def test_rate_limited_request_slows_family(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=4, sleep=clock.sleep, clock=clock)
+        client = self.make_client(limiter)
+        responses = [
+            make_response(429, {"detail": "Slow down"}, {"Retry-After": "1"}),
+            make_response(200, {"id": "ok"}),
+        ]
+
+        with patch.object(client.session, "request", side_effect=responses):
+            assert client.post("payments", {"amount": "1.00"}) == {"id": "ok"}
+
+        # Halved once on the 429, then nudged back up by the success
+        assert limiter.bucket("payments").rate == pytest.approx(2.04)
+        assert clock.sleeps == [pytest.approx(1.5)]
+        client.close()
+
+    def test_deadline_abort_releases_token(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=1, burst=1, sleep=clock.sleep, clock=clock)
+        client = self.make_client(limiter)
+        limiter.reserve("payments")
+
+        with patch.object(client.session, "request") as request, pytest.raises(
+            DeadlineExceededError
+        ):
+            client.get("payments/abc", deadline=0.5)
+
+        request.assert_not_called()
+        # Only the first reservation holds a slot
+        assert limiter.reserve("payments") == pytest.approx(1.0)
+        client.close()
+
+    def test_exhausted_retries_still_raise(self):
+        limiter = RateLimiter(rate=1000)
+        client = self.make_client(limiter)
+        client.retry_policy.max_retries = 0
+
+        with patch.object(
+            client.session, "request", return_value=make_response(429)
+        ), pytest.raises(RateLimitError):
+            client.get("payments/abc/refunds")
+
+        assert limiter.get_rates() == {"refunds": 500.0}
+        client.close()
@@ -0,0 +1,149 @@
+"""
+Unit tests for the typed Cardinity response objects.
+"""
+
+import asyncio
+import pickle
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cardinity import AsyncCardinity, Cardinity
+from cardinity.async_client import AsyncCardinityClient
+from cardinity.client import CardinityClient
+from cardinity.results import (
+    ChargebackResult,
+    PaymentInstrument,
+    PaymentResult,
+    RefundResult,
+    parse_datetime,
+)
+
+PAYMENT = {
+    "id": "90095d47-11bb-468b-8764-fd4fbb49a9f9",
+    "amount": "10.50",
+    "currency": "EUR",
+    "created": "2024-01-15T12:00:00Z",
+    "type": "authorization",
+    "live": False,
+    "settle": True,
+    "status": "approved",
+    "payment_method": "card",
+    "payment_instrument": {"card_brand": "Visa", "pan": "1111", "exp_year": 2030},
+    "unknown_field": "kept",
+}
+
+
+class TestResult:
+    """Test cases for Result and its fields."""
+
+    def test_fields_are_decoded(self):
+        payment = PaymentResult(PAYMENT)
+        assert payment.amount == Decimal("10.50")
+        assert payment.created == datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+        assert payment.settle is True
+        assert payment.is_approved
+        assert not payment.is_pending
+
+    def test_decoding_is_lazy_and_cached(self):
+        payment = PaymentResult(PAYMENT)
+        assert payment._cache is None
+
+        created = payment.created
+        assert payment.created is created
+        assert payment._cache == {"created": created}
+
+    def test_nested_objects(self):
+        instrument = PaymentResult(PAYMENT).payment_instrument
+        assert isinstance(instrument, PaymentInstrument)
+        assert instrument.card_brand == "Visa"
+        assert instrument.exp_year == 2030
+
+    def test_missing_fields_are_none(self):
+        payment = PaymentResult({"id": "p1"})
+        assert payment.amount is None
+        assert payment.threeds2_data is None
+
+    def test_mapping_interface(self):
+        payment = PaymentResult(PAYMENT)
+        assert payment == PAYMENT
+        assert payment["status"] == "approved"
+        assert payment.get("unknown_field") == "kept"
+        assert dict(payment) == PAYMENT
+        assert payment.to_dict() == PAYMENT
+
+    def test_wrap_lists(self):
+        refunds = RefundResult.wrap([{"id": "r1", "parent_id": "p1"}, {"id": "r2"}])
+        assert [type(refund) for refund in refunds] == [RefundResult, RefundResult]
+        assert refunds[0].parent_id == "p1"
+
+    def test_no_instance_dict(self):
+        payment = PaymentResult(PAYMENT)
+        assert not hasattr(payment, "__dict__")
+        with pytest.raises(AttributeError):
+            payment.extra = 1
+
+    def test_pickle(self):
+        payment = PaymentResult(PAYMENT)
+        payment.amount
+        restored = pickle.loads(pickle.dumps(payment))
+        assert restored == PAYMENT
+        assert restored.amount == Decimal("10.50")
+
+    def test_parse_datetime_with_offset(self):
+        assert parse_datetime("2024-01-15T12:00:00+02:00").utcoffset().seconds == 7200
+
+    def test_parse_datetime_short_fraction(self):
+        value = parse_datetime("2024-01-15T12:00:00.12Z")
+        assert value == datetime(2024, 1, 15, 12, 0, 0, 120000, tzinfo=timezone.utc)
+
+
+class TestTypedResultsOption:
+    """Test cases for the typed_results option of the SDK."""
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_dicts_by_default(self, mock_execute):
+        mock_execute.return_value = dict(PAYMENT)
+        payment = Cardinity("key", "secret").get_payment(PAYMENT["id"])
+        assert type(payment) is dict
+
+    @patch.object(CardinityClient, "execute_request")
+    def test_typed_results(self, mock_execute):
+        cardinity = Cardinity("key", "secret", typed_results=True)
+
+        mock_execute.return_value = dict(PAYMENT)
+        payment = cardinity.get_payment(PAYMENT["id"])
+        assert isinstance(payment, PaymentResult)
+        assert payment.amount == Decimal("10.50")
+
+        mock_execute.return_value = [{"id": "c1", "reason_code": "4837"}]
+        chargebacks = cardinity.get_chargeback(PAYMENT["id"])
+        assert isinstance(chargebacks[0], ChargebackResult)
+
+    @patch.object(CardinityClient, "get")
+    def test_typed_pagination(self, mock_get):
+        mock_get.side_effect = [[{"id": "p1"}, {"id": "p2"}], []]
+        cardinity = Cardinity("key", "secret", typed_results=True)
+
+        pages = cardinity.iter_payments(
+            page_size=2, prefetch=False, cursor_param="after"
+        )
+        payments = list(pages)
+        assert [type(payment) for payment in payments] == [PaymentResult] * 2
+        assert pages.cursor == "p2"
+
+    def test_async_typed_results(self):
+        async def run():
+            async with AsyncCardinity("key", "secret", typed_results=True) as client:
+                return await client.get_payment(PAYMENT["id"])
+
+        with patch.object(
+            AsyncCardinityClient,
+            "execute_request",
+            new=AsyncMock(return_value=dict(PAYMENT)),
+        ):
+            payment = asyncio.run(run())
+        assert isinstance(payment, PaymentResult)
+        assert payment.status == "approved"
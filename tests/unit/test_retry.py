@@ -0,0 +1,384 @@
+"""
+Unit tests for the Cardinity retry policy.
+"""
+
+import random
+from email.utils import formatdate
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+from cardinity import Cardinity
+from cardinity.client import CardinityClient
+from cardinity.exceptions import (
+    APIError,
+    CardinityError,
+    DeadlineExceededError,
+    RateLimitError,
+    ServerError,
+)
+from cardinity.retry import RetryPolicy, parse_retry_after
+from tests.fixtures.mocks import FakeClock, make_client, make_response
+
+
+class TestParseRetryAfter:
+    """Test cases for parse_retry_after()."""
+
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        delay = parse_retry_after(formatdate(usegmt=True, timeval=None))
+        assert delay is not None and 0.0 <= delay <= 1.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-1", Mock()])
+    def test_invalid_values(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+
+    def test_exponential_backoff_without_jitter(self):
+        """Test delays double up to backoff_max."""
+        policy = RetryPolicy(max_retries=5, backoff_max=5, jitter="none")
+        state = policy.start("GET")
+
+        delays = [policy.next_delay(state, ServerError()) for _ in range(6)]
+
+        assert delays == [1, 2, 4, 5, 5, None]
+
+    def test_full_jitter(self):
+        """Test full jitter stays within [0, exponential delay]."""
+        policy = RetryPolicy(max_retries=3, rng=random.Random(1))
+        state = policy.start("GET")
+
+        delays = [policy.next_delay(state, ServerError()) for _ in range(3)]
+
+        for attempt, delay in enumerate(delays, start=1):
+            assert 0 <= delay <= 2 ** (attempt - 1)
+        assert len(set(delays)) == 3
+
+    def test_decorrelated_jitter(self):
+        """Test decorrelated jitter grows from the previous delay."""
+        policy = RetryPolicy(
+            max_retries=10,
+            backoff_max=20,
+            jitter="decorrelated",
+            rng=random.Random(2),
+        )
+        state = policy.start("GET")
+
+        previous = policy.next_delay(state, ServerError())
+        assert previous == 1
+        for _ in range(9):
+            delay = policy.next_delay(state, ServerError())
+            assert 1 <= delay <= min(20, previous * 3)
+            previous = delay
+
+    def test_jitter_desynchronizes_workers(self):
+        """Test workers failing together do not retry in lockstep."""
+        policy = RetryPolicy()
+        delays = {
+            policy.next_delay(policy.start("GET"), ServerError()) for _ in range(50)
+        }
+
+        assert len(delays) > 40
+
+    def test_retry_after_sets_minimum_delay(self):
+        """Test a Retry-After value overrides shorter backoff delays."""
+        policy = RetryPolicy(jitter="none")
+        state = policy.start("POST")
+
+        assert policy.next_delay(state, RateLimitError(retry_after=12)) == 12
+        assert policy.next_delay(state, RateLimitError(retry_after=0.5)) == 2
+
+    def test_long_retry_after_gives_up(self):
+        """Test a Retry-After beyond retry_after_max is not waited for."""
+        policy = RetryPolicy(jitter="none")
+        assert policy.retry_after_max == policy.backoff_max == 30
+        assert policy.next_delay(policy.start("GET"), ServerError()) == 1
+        assert (
+            policy.next_delay(policy.start("GET"), RateLimitError(retry_after=30)) == 30
+        )
+        assert (
+            policy.next_delay(policy.start("GET"), RateLimitError(retry_after=3600))
+            is None
+        )
+
+        patient = RetryPolicy(jitter="none", retry_after_max=7200)
+        assert (
+            patient.next_delay(patient.start("GET"), RateLimitError(retry_after=3600))
+            == 3600
+        )
+
+    def test_retry_after_can_be_ignored(self):
+        """Test respect_retry_after=False uses plain backoff."""
+        policy = RetryPolicy(jitter="none", respect_retry_after=False)
+
+        assert (
+            policy.next_delay(policy.start("GET"), RateLimitError(retry_after=9)) == 1
+        )
+
+    def test_max_elapsed(self):
+        """Test retrying stops once the next wait would exceed max_elapsed."""
+        clock = FakeClock()
+        policy = RetryPolicy(max_retries=10, jitter="none", max_elapsed=10, clock=clock)
+        state = policy.start("GET")
+
+        delays = []
+        while True:
+            delay = policy.next_delay(state, ServerError())
+            if delay is None:
+                break
+            delays.append(delay)
+            clock.sleep(delay)
+
+        assert delays == [1, 2, 4]
+
+    def test_status_rules(self):
+        """Test only configured statuses are retried."""
+        policy = RetryPolicy(retry_statuses={503})
+
+        assert policy.is_retryable("GET", ServerError(status_code=503))
+        assert not policy.is_retryable("GET", ServerError(status_code=500))
+        assert not policy.is_retryable("GET", APIError("bad", status_code=400))
+        assert policy.is_retryable("GET", RateLimitError())
+
+    def test_method_rules(self):
+        """Test non-idempotent methods are only retried when safe."""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable("GET", ServerError())
+        assert not policy.is_retryable("POST", ServerError())
+        assert not policy.is_retryable("patch", ServerError(status_code=503))
+        assert policy.is_retryable("POST", RateLimitError())
+        assert policy.is_retryable("POST", ConnectionError(), request_sent=False)
+        assert not policy.is_retryable("POST", ConnectionError())
+        assert policy.is_retryable("GET", ConnectionError())
+
+    def test_retry_non_idempotent(self):
+        """Test retry_non_idempotent treats every method as idempotent."""
+        policy = RetryPolicy(retry_non_idempotent=True)
+
+        assert policy.is_retryable("POST", ServerError())
+        assert policy.is_retryable("POST", ConnectionError())
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_retries": -1},
+            {"backoff_base": 2, "backoff_max": 1},
+            {"jitter": "x"},
+            {"retry_after_max": -1},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
+
+
+class TestClientRetries:
+    """Test the client's iterative retry loop."""
+
+    def setup_method(self):
+        """Set up a client whose waits are recorded instead of slept."""
+        self.sleeps = []
+        policy = RetryPolicy(jitter="none", sleep=self.sleeps.append)
+        self.client = make_client(retry_policy=policy)
+
+    def test_default_policy_uses_max_retries(self):
+        client = make_client(max_retries=5)
+
+        assert client.retry_policy.max_retries == 5
+        assert client.retry_policy.backoff_base == CardinityClient.RETRY_DELAY
+        assert client.retry_policy.jitter == "full"
+
+    @patch("requests.Session.request")
+    def test_get_retried_on_server_errors(self, mock_request):
+        mock_request.side_effect = [
+            make_response(502, {"error": "bad gateway"}),
+            make_response(503, {"error": "unavailable"}),
+            make_response(200, {"id": "ok"}),
+        ]
+
+        assert self.client.get("/payments") == {"id": "ok"}
+        assert self.sleeps == [1, 2]
+
+    @patch("requests.Session.request")
+    def test_server_error_keeps_status_code(self, mock_request):
+        mock_request.return_value = make_response(503, {"error": "unavailable"})
+
+        with pytest.raises(ServerError) as exc_info:
+            self.client.get("/payments")
+
+        assert exc_info.value.status_code == 503
+        assert mock_request.call_count == 4
+
+    @patch("requests.Session.request")
+    def test_post_not_retried_on_server_error(self, mock_request):
+        mock_request.return_value = make_response(500, {"error": "boom"})
+
+        with pytest.raises(ServerError):
+            self.client.post("/payments", {"amount": "10.00"})
+
+        assert mock_request.call_count == 1
+        assert self.sleeps == []
+
+    @patch("requests.Session.request")
+    def test_post_retried_on_rate_limit_with_retry_after(self, mock_request):
+        mock_request.side_effect = [
+            make_response(429, {"error": "slow down"}, {"Retry-After": "5"}),
+            make_response(201, {"id": "pay_1"}),
+        ]
+
+        assert self.client.post("/payments", {"amount": "10.00"}) == {"id": "pay_1"}
+        assert self.sleeps == [5]
+
+    @patch("requests.Session.request")
+    def test_long_retry_after_is_not_slept(self, mock_request):
+        mock_request.return_value = make_response(
+            429, {"error": "slow down"}, {"Retry-After": "3600"}
+        )
+
+        with pytest.raises(RateLimitError):
+            self.client.post("/payments", {"amount": "10.00"})
+        assert mock_request.call_count == 1
+        assert self.sleeps == []
+
+    @patch("requests.Session.request")
+    def test_rate_limit_error_exposes_retry_after(self, mock_request):
+        mock_request.return_value = make_response(
+            429, {"error": "slow down"}, {"Retry-After": "2"}
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            self.client.get("/payments")
+
+        assert exc_info.value.retry_after == 2.0
+
+    @patch("requests.Session.request")
+    def test_post_retried_when_connection_refused(self, mock_request):
+        refused = ConnectionError(
+            MaxRetryError(None, "/payments", NewConnectionError(None, "refused"))
+        )
+        mock_request.side_effect = [
+            refused,
+            ConnectTimeout("connect"),
+            make_response(201),
+        ]
+
+        assert self.client.post("/payments", {"amount": "10.00"}) == {}
+        assert mock_request.call_count == 3
+
+    @patch("requests.Session.request")
+    def test_post_not_retried_after_read_timeout(self, mock_request):
+        mock_request.side_effect = ReadTimeout("read timed out")
+
+        with pytest.raises(CardinityError, match="read timed out"):
+            self.client.post("/payments", {"amount": "10.00"})
+
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_retries_are_iterative(self, mock_request):
+        """Test many retries do not grow the call stack."""
+        policy = RetryPolicy(max_retries=2000, jitter="none", sleep=lambda _: None)
+        client = make_client(retry_policy=policy)
+        mock_request.side_effect = [make_response(503)] * 2000 + [make_response(200)]
+
+        assert client.get("/payments") == {}
+
+
+class TestDeadlines:
+    """Test timeouts and deadlines capping the total time of a call."""
+
+    def setup_method(self):
+        """Set up a client on a manually advanced clock."""
+        self.clock = FakeClock()
+        self.policy = RetryPolicy(
+            jitter="none", sleep=self.clock.sleep, clock=self.clock
+        )
+
+    def make_client(self, **kwargs):
+        return make_client(retry_policy=self.policy, **kwargs)
+
+    def test_time_left(self):
+        state = self.policy.start("GET", deadline=5)
+        assert self.policy.time_left(state) == 5
+        self.clock.sleep(3)
+        assert self.policy.time_left(state) == 2
+
+        cause = ServerError()
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            self.policy.time_left(state, 2, cause=cause)
+        assert exc_info.value.deadline == 5
+        assert exc_info.value.__cause__ is cause
+
+        assert self.policy.time_left(self.policy.start("GET")) is None
+
+    @pytest.mark.parametrize("deadline", [0, -1])
+    def test_invalid_deadline(self, deadline):
+        with pytest.raises(ValueError):
+            self.policy.start("GET", deadline=deadline)
+        with pytest.raises(ValueError):
+            self.make_client(deadline=deadline)
+
+    @patch("requests.Session.request")
+    def test_connect_and_read_timeouts(self, mock_request):
+        mock_request.return_value = make_response(200)
+
+        self.make_client().get("/payments")
+        assert mock_request.call_args.kwargs["timeout"] == (30, 30)
+
+        client = self.make_client(timeout=10, connect_timeout=3.05)
+        assert (client.connect_timeout, client.read_timeout) == (3.05, 10)
+        client.get("/payments")
+        assert mock_request.call_args.kwargs["timeout"] == (3.05, 10)
+
+    @patch("requests.Session.request")
+    def test_timeouts_are_shortened_to_the_deadline(self, mock_request):
+        mock_request.side_effect = [make_response(503), make_response(200)]
+        client = self.make_client(connect_timeout=2, read_timeout=10, deadline=4)
+
+        assert client.get("/payments") == {}
+        timeouts = [call.kwargs["timeout"] for call in mock_request.call_args_list]
+        assert timeouts == [(2, 4), (2, 3)]
+
+    @patch("requests.Session.request")
+    def test_deadline_stops_retries(self, mock_request):
+        mock_request.return_value = make_response(503)
+        client = self.make_client(deadline=2.5)
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            client.get("/payments")
+
+        # The second retry would wait 2s with 1.5s left
+        assert mock_request.call_count == 2
+        assert self.clock.now == 1
+        assert isinstance(exc_info.value.__cause__, ServerError)
+
+    @patch("requests.Session.request")
+    def test_errors_not_retried_are_raised_unchanged(self, mock_request):
+        mock_request.side_effect = ReadTimeout("read timed out")
+        client = self.make_client(deadline=5)
+
+        with pytest.raises(CardinityError, match="read timed out") as exc_info:
+            client.post("/payments", {"amount": "10.00"})
+        assert not isinstance(exc_info.value, DeadlineExceededError)
+
+    @patch("requests.Session.request")
+    def test_per_call_deadline(self, mock_request):
+        mock_request.return_value = make_response(503)
+        cardinity = Cardinity(
+            "test_key", "test_secret", retry_policy=self.policy, deadline=60
+        )
+
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            cardinity.get_payment("cb5e1c95-a51a-4a2c-a3ae-2f5e52ef9a5b", deadline=1.5)
+
+        assert exc_info.value.deadline == 1.5
+        assert mock_request.call_count == 2
+        assert mock_request.call_args.kwargs["timeout"] == (0.5, 0.5)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the Cardinity OAuth 1.0 signer.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from requests import Request
+
+from cardinity.auth import CardinityAuth
+from cardinity.signing import OAuthSigner, encode_base_uri
+
+NONCE = "4572616e48616d6d65724c61686176"
+TIMESTAMP = "1700000000"
+
+CREDENTIALS = [
+    ("test_key", "test_secret"),
+    ("key with spaces", "secret&with=reserved~chars!"),
+    ("test_key_ñáéíóú", "test_secret_ñáéíóú"),
+]
+
+REQUESTS = [
+    ("GET", "https://api.cardinity.com/v1/payments", None),
+    ("GET", "https://api.cardinity.com/v1/payments?limit=10", None),
+    ("GET", "https://api.cardinity.com/v1/payments/chargebacks?limit=5&b=&a=x+y", None),
+    ("GET", "https://api.cardinity.com/v1/payments?z=2&z=1&q=%C3%BC%2F", None),
+    ("POST", "https://api.cardinity.com/v1/payments", {"amount": "10.00"}),
+    ("POST", "https://api.cardinity.com/v1/payments/pay_1/refunds", {"amount": "1"}),
+    ("PATCH", "https://api.cardinity.com/v1/payments/pay_1", {"cres": "abc"}),
+    ("PATCH", "https://api.cardinity.com/v1/paymentLinks/link_1", {"enabled": True}),
+    ("GET", "https://API.Cardinity.com:443/v1/payments", None),
+    ("GET", "http://localhost:8080/v1/payments?limit=1", None),
+    ("DELETE", "https://api.cardinity.com/v1/payments/pay_1", None),
+]
+
+
+def oauth1_header(auth, method, url, body):
+    """Sign a prepared request with requests_oauthlib using a fixed nonce."""
+    prepared = Request(
+        method, url, headers={"Content-Type": "application/json"}, json=body
+    ).prepare()
+    with patch("oauthlib.oauth1.rfc5849.generate_nonce", return_value=NONCE):
+        with patch(
+            "oauthlib.oauth1.rfc5849.generate_timestamp", return_value=TIMESTAMP
+        ):
+            signed = auth.get_auth()(prepared)
+    return prepared.url, signed.headers["Authorization"].decode("utf-8")
+
+
+class TestOAuthSigner:
+    """Test cases for OAuthSigner."""
+
+    @pytest.mark.parametrize("key,secret", CREDENTIALS)
+    @pytest.mark.parametrize("method,url,body", REQUESTS)
+    def test_matches_oauthlib(self, key, secret, method, url, body):
+        """Test headers are byte-for-byte identical to requests_oauthlib."""
+        auth = CardinityAuth(key, secret)
+        prepared_url, expected = oauth1_header(auth, method, url, body)
+
+        signer = auth.get_signer()
+        actual = signer.sign(method, prepared_url, nonce=NONCE, timestamp=TIMESTAMP)
+
+        assert actual == expected
+
+    def test_fresh_nonce_per_signature(self):
+        """Test every signature gets its own nonce."""
+        signer = OAuthSigner("test_key", "test_secret")
+        url = "https://api.cardinity.com/v1/payments"
+
+        assert signer.sign("GET", url) != signer.sign("GET", url)
+
+    def test_base_uri_is_cached(self):
+        """Test the encoded base URI is computed once per endpoint."""
+        encode_base_uri.cache_clear()
+        signer = OAuthSigner("test_key", "test_secret")
+
+        for limit in range(3):
+            signer.sign("GET", f"https://api.cardinity.com/v1/payments?limit={limit}")
+
+        info = encode_base_uri.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_repr_hides_secret(self):
+        """Test the string representation does not expose the secret."""
+        assert "test_secret" not in repr(OAuthSigner("test_key", "test_secret"))
+
+
+class TestCardinityAuthSigning:
+    """Test CardinityAuth on top of the fast signer."""
+
+    def test_signer_is_cached(self):
+        """Test the signer is built once per credential pair."""
+        auth = CardinityAuth("test_key", "test_secret")
+        signer = auth.get_signer()
+
+        assert auth.get_signer() is signer
+        auth.consumer_key = "rotated_key"
+        assert auth.get_signer() is not signer
+
+    def test_requests_auth_callable(self):
+        """Test CardinityAuth signs prepared requests like OAuth1 does."""
+        auth = CardinityAuth("test_key", "test_secret")
+        url = "https://api.cardinity.com/v1/payments?limit=5"
+        prepared_url, expected = oauth1_header(auth, "GET", url, None)
+
+        prepared = Request("GET", url).prepare()
+        with patch("cardinity.signing.generate_nonce", return_value=NONCE):
+            with patch("cardinity.signing.generate_timestamp", return_value=TIMESTAMP):
+                signed = auth(prepared)
+
+        assert signed is prepared
+        assert signed.headers["Authorization"] == expected
@@ -0,0 +1,244 @@
+"""
+Unit tests for the Cardinity test server.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from cardinity import Cardinity
+from cardinity.exceptions import APIError, NotFoundError, RateLimitError, ServerError
+from cardinity.idempotency import IDEMPOTENCY_HEADER
+from cardinity.testing import CardinityTestServer
+from tests.fixtures.test_data import (
+    TestPaymentData,
+    TestPaymentInstruments,
+    TestPaymentLinkData,
+)
+
+AUTH = {"Authorization": 'OAuth oauth_consumer_key="key"'}
+
+
+@pytest.fixture
+def server():
+    with CardinityTestServer(seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def cardinity(server):
+    return Cardinity("key", "secret", base_url=server.base_url)
+
+
+def post(server, path, data, headers=AUTH):
+    return server.handle("POST", path, json.dumps(data).encode(), headers)
+
+
+class TestPayments:
+    """Test cases for the emulated payment endpoints."""
+
+    def test_payment_lifecycle(self, cardinity):
+        payment = cardinity.create_payment(**TestPaymentData.successful_payment())
+        assert payment["status"] == "approved"
+        assert payment["payment_instrument"]["pan"] == "1111"
+        assert cardinity.get_payment(payment["id"]) == payment
+
+        refund = cardinity.create_refund(payment["id"], amount="25.00")
+        assert refund["parent_id"] == payment["id"]
+        assert cardinity.get_refund(payment["id"]) == [refund]
+
+    def test_declined_above_threshold(self, cardinity):
+        with pytest.raises(APIError) as exc_info:
+            cardinity.create_payment(**TestPaymentData.declined_payment())
+        assert exc_info.value.status_code == 402
+        assert exc_info.value.response_data["status"] == "declined"
+
+    def test_3ds_card_requires_authentication(self, cardinity):
+        payment = cardinity.create_payment(
+            **{
+                **TestPaymentData.successful_payment(),
+                "payment_instrument": TestPaymentInstruments.mastercard_3ds_passed(),
+            }
+        )
+        assert payment["status"] == "pending"
+        assert "url" in payment["authorization_information"]
+
+        finalized = cardinity.finalize_payment(payment["id"], authorize_data="ok")
+        assert finalized["status"] == "approved"
+
+    def test_3ds2_failure(self, cardinity):
+        payment = cardinity.create_payment(**TestPaymentData.payment_3ds_v2_fail())
+        assert payment["threeds2_data"]["acs_url"]
+        with pytest.raises(APIError) as exc_info:
+            cardinity.finalize_payment(payment["id"], cres="fail")
+        assert exc_info.value.status_code == 402
+
+    def test_invalid_luhn(self, server):
+        data = {
+            **TestPaymentData.successful_payment(),
+            "payment_instrument": TestPaymentInstruments.invalid_luhn(),
+        }
+        status, body, _ = post(server, "/v1/payments", data)
+        assert status == 400
+        assert body["errors"][0]["field"] == "payment_instrument.pan"
+
+    def test_recurring_payment(self, cardinity):
+        parent = cardinity.create_payment(**TestPaymentData.successful_payment())
+        payment = cardinity.create_recurring_payment(
+            **TestPaymentData.recurring_payment_data(parent["id"])
+        )
+        assert payment["payment_method"] == "recurring"
+        assert payment["payment_instrument"] == parent["payment_instrument"]
+
+    def test_pagination(self, cardinity):
+        ids = [
+            cardinity.create_payment(**TestPaymentData.successful_payment())["id"]
+            for _ in range(5)
+        ]
+        listed = [
+            payment["id"]
+            for payment in cardinity.iter_payments(page_size=2, cursor_param="after")
+        ]
+        assert listed == ids[::-1]
+
+    def test_refund_beyond_payment_amount(self, cardinity):
+        payment = cardinity.create_payment(**TestPaymentData.successful_payment())
+        with pytest.raises(APIError) as exc_info:
+            cardinity.create_refund(payment["id"], amount="50.01")
+        assert exc_info.value.status_code == 400
+
+    def test_failing_description(self, cardinity):
+        payment = cardinity.create_payment(**TestPaymentData.successful_payment())
+        with pytest.raises(APIError) as exc_info:
+            cardinity.create_void(payment["id"], description="fail")
+        assert exc_info.value.status_code == 402
+
+    def test_unknown_payment(self, cardinity):
+        with pytest.raises(NotFoundError):
+            cardinity.get_payment("missing")
+
+    def test_chargebacks(self, server, cardinity):
+        payment = cardinity.create_payment(**TestPaymentData.successful_payment())
+        chargeback = server.add_chargeback(payment["id"])
+        assert chargeback["amount"] == "50.00"
+        assert cardinity.get_chargeback(payment["id"]) == [chargeback]
+        assert list(cardinity.iter_chargebacks()) == [chargeback]
+
+
+class TestPaymentLinks:
+    """Test cases for the emulated payment link endpoints."""
+
+    def test_create_and_update(self, cardinity):
+        link = cardinity.create_payment_link(**TestPaymentLinkData.payment_link())
+        assert link["enabled"] is True
+        assert cardinity.get_payment_link(link["id"]) == link
+
+        updated = cardinity.update_payment_link(link["id"], enabled=False)
+        assert updated["enabled"] is False
+
+    def test_disabled(self):
+        server = CardinityTestServer(payment_links_enabled=False)
+        status, body, _ = post(
+            server, "/v1/paymentLinks", {"amount": "75.00", "currency": "EUR"}
+        )
+        assert status == 400
+        assert "disabled" in body["detail"]
+
+
+class TestServerBehaviour:
+    """Test cases for authentication, idempotency and fault injection."""
+
+    def test_requires_oauth(self):
+        status, _, _ = CardinityTestServer().handle("GET", "/v1/payments")
+        assert status == 401
+
+    def test_consumer_key(self):
+        server = CardinityTestServer(consumer_key="other")
+        assert server.handle("GET", "/v1/payments", headers=AUTH)[0] == 401
+
+    def test_idempotent_replay(self):
+        server = CardinityTestServer()
+        headers = {**AUTH, IDEMPOTENCY_HEADER: "k1"}
+        data = TestPaymentData.successful_payment()
+        first = post(server, "/v1/payments", data, headers)
+        assert post(server, "/v1/payments", data, headers) == first
+        assert server.stats()["payments"] == 1
+
+    def test_idempotent_replies_are_bounded(self):
+        server = CardinityTestServer(max_idempotent_replies=2)
+        data = TestPaymentData.successful_payment()
+        first = post(server, "/v1/payments", data, {**AUTH, IDEMPOTENCY_HEADER: "k1"})
+        post(server, "/v1/payments", data, {**AUTH, IDEMPOTENCY_HEADER: "k2"})
+        # Replaying k1 makes k2 the least recently used key
+        assert (
+            post(server, "/v1/payments", data, {**AUTH, IDEMPOTENCY_HEADER: "k1"})
+            == first
+        )
+        post(server, "/v1/payments", data, {**AUTH, IDEMPOTENCY_HEADER: "k3"})
+
+        assert list(server._idempotent_replies) == ["k1", "k3"]
+        post(server, "/v1/payments", data, {**AUTH, IDEMPOTENCY_HEADER: "k2"})
+        assert server.stats()["payments"] == 4
+
+    def test_injected_rate_limits(self):
+        server = CardinityTestServer(rate_limit_rate=1, retry_after=3)
+        status, _, headers = server.handle("GET", "/v1/payments", headers=AUTH)
+        assert status == 429
+        assert headers == {"Retry-After": "3"}
+        assert server.stats()["injected_rate_limits"] == 1
+
+    @pytest.mark.parametrize("retry_after, header", [(0.5, "1"), (2.1, "3")])
+    def test_fractional_retry_after_is_rounded_up(self, retry_after, header):
+        server = CardinityTestServer(error_rate=1, retry_after=retry_after)
+        _, _, headers = server.handle("GET", "/v1/payments", headers=AUTH)
+        assert headers == {"Retry-After": header}
+
+    def test_client_retries_injected_errors(self):
+        with CardinityTestServer(error_rate=1, retry_after=None) as server:
+            cardinity = Cardinity("key", "secret", base_url=server.base_url)
+            with patch.object(cardinity.get_client().retry_policy, "sleep"):
+                with pytest.raises(ServerError):
+                    cardinity.get_payment("p1")
+            assert server.stats()["injected_errors"] > 1
+
+    def test_rate_limit_reaches_client(self):
+        with CardinityTestServer(rate_limit_rate=1) as server:
+            cardinity = Cardinity(
+                "key", "secret", base_url=server.base_url, max_retries=0
+            )
+            with pytest.raises(RateLimitError) as exc_info:
+                cardinity.get_payment("p1")
+        assert exc_info.value.retry_after == 1
+
+    def test_seeded_faults_are_reproducible(self):
+        def statuses():
+            server = CardinityTestServer(error_rate=0.5, seed=7)
+            return [
+                server.handle("GET", "/v1/payments", headers=AUTH)[0] for _ in range(20)
+            ]
+
+        assert statuses() == statuses()
+        assert {200, 503} == set(statuses())
+
+    def test_invalid_max_idempotent_replies(self):
+        with pytest.raises(ValueError):
+            CardinityTestServer(max_idempotent_replies=0)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            CardinityTestServer(error_rate=1.5)
+
+    def test_base_url_requires_running_server(self):
+        with pytest.raises(RuntimeError):
+            CardinityTestServer().base_url
+
+    def test_reset(self, server, cardinity):
+        cardinity.create_payment(**TestPaymentData.successful_payment())
+        server.reset()
+        assert server.stats() == {
+            "requests": 0,
+            "injected_errors": 0,
+            "injected_rate_limits": 0,
+            "payments": 0,
+        }
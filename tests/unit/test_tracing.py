@@ -0,0 +1,237 @@
+"""
+Unit tests for the Cardinity OpenTelemetry tracing.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from cardinity import AsyncCardinity, Cardinity, Tracing
+from cardinity import tracing as tracing_module
+from cardinity.exceptions import NotFoundError, ValidationError
+from cardinity.models import Payment
+from cardinity.testing import CardinityTestServer
+from cardinity.tracing import active_tracing, validation_span
+from tests.fixtures.test_data import TestPaymentData
+
+
+class FakeSpan:
+    """Span recording its name, parent and attributes."""
+
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.error = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def get_span_context(self):
+        return SimpleNamespace(trace_id=0xABC, span_id=id(self), trace_flags=1)
+
+
+class FakeTracer:
+    """Duck-typed tracer keeping every span it started."""
+
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None, kind=None):
+        parent = self._stack[-1] if self._stack else None
+        span = FakeSpan(name, parent, attributes)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.error = e
+            raise
+        finally:
+            self._stack.pop()
+
+    def named(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+class TestTracing:
+    """Test the tracing helpers."""
+
+    def test_client_without_tracing(self, monkeypatch):
+        """Clients without an enabled tracing skip it entirely."""
+        cardinity = Cardinity("key", "secret")
+        assert cardinity.get_client().tracing is None
+
+        # As without OpenTelemetry installed
+        monkeypatch.setattr(tracing_module, "trace", None)
+        monkeypatch.setattr(tracing_module, "propagate", None)
+        disabled = Tracing()
+        assert not disabled.enabled
+        cardinity = Cardinity("key", "secret", tracing=disabled)
+        assert cardinity.get_client().tracing is None
+
+    def test_validation_outside_operations_is_untraced(self):
+        """Models validated outside SDK operations create no span."""
+        tracer = FakeTracer()
+        Payment(**TestPaymentData.successful_payment())
+        assert active_tracing() is None
+        with validation_span(object()) as span:
+            assert span is None
+        assert tracer.spans == []
+
+    def test_operation_sets_active_tracing(self):
+        """An operation makes its tracing active for model validation."""
+        tracer = FakeTracer()
+        tracing = Tracing(tracer=tracer)
+        with tracing.operation("Cardinity.create_payment"):
+            assert active_tracing() is tracing
+            Payment(**TestPaymentData.successful_payment())
+        assert active_tracing() is None
+
+        operation, validation = tracer.spans
+        assert validation.name == "Payment.validate"
+        assert validation.parent is operation
+
+    def test_inject_without_opentelemetry(self, monkeypatch):
+        """Without OpenTelemetry the traceparent is built from the span."""
+        monkeypatch.setattr(tracing_module, "propagate", None)
+        span = FakeSpan("POST /payments", None, None)
+        headers = {}
+        Tracing(tracer=FakeTracer()).inject(headers, span)
+
+        trace_id, span_id, flags = headers["traceparent"].split("-")[1:]
+        assert int(trace_id, 16) == 0xABC
+        assert int(span_id, 16) == id(span)
+        assert flags == "01"
+
+    def test_inject_disabled(self, monkeypatch):
+        """propagate_context=False sends no trace headers."""
+        monkeypatch.setattr(tracing_module, "propagate", None)
+        headers = {}
+        tracing = Tracing(tracer=FakeTracer(), propagate_context=False)
+        tracing.inject(headers, FakeSpan("GET", None, None))
+        assert headers == {}
+
+
+class TestSDKTracing:
+    """Test the spans of SDK operations."""
+
+    def test_operation_spans(self):
+        """An operation is the parent of its validation and HTTP attempt."""
+        tracer = FakeTracer()
+        with CardinityTestServer() as server:
+            cardinity = Cardinity(
+                "key",
+                "secret",
+                base_url=server.base_url,
+                tracing=Tracing(tracer=tracer),
+            )
+            payment = cardinity.create_payment(**TestPaymentData.successful_payment())
+            cardinity.get_payment(payment["id"])
+
+        create = tracer.named("Cardinity.create_payment")[0]
+        assert create.parent is None
+        (validation,) = tracer.named("Payment.validate")
+        assert validation.parent is create
+        (post,) = tracer.named("POST /payments")
+        assert post.parent is create
+        assert post.attributes["http.request.method"] == "POST"
+        assert post.attributes["http.response.status_code"] == 201
+        assert post.attributes["url.full"].endswith("/payments")
+        sign, parse = [span for span in tracer.spans if span.parent is post]
+        assert sign.name == "CardinityAuth.sign"
+        assert parse.name == "Response.parse"
+
+        get = tracer.named("Cardinity.get_payment")[0]
+        (lookup,) = tracer.named("GET /payments/{id}")
+        assert lookup.parent is get
+
+    def test_errors_are_recorded(self):
+        """Exceptions are recorded on the spans they escape from."""
+        tracer = FakeTracer()
+        with CardinityTestServer() as server:
+            cardinity = Cardinity(
+                "key",
+                "secret",
+                base_url=server.base_url,
+                tracing=Tracing(tracer=tracer),
+            )
+            with pytest.raises(NotFoundError):
+                cardinity.get_payment("missing")
+            with pytest.raises(ValidationError):
+                cardinity.create_payment(amount="-1")
+
+        (get,) = tracer.named("Cardinity.get_payment")
+        assert isinstance(get.error, NotFoundError)
+        (create,) = tracer.named("Cardinity.create_payment")
+        assert isinstance(create.error, ValidationError)
+        assert not tracer.named("POST /payments")
+
+    def test_async_operation_spans(self):
+        """Async operations are traced like synchronous ones."""
+        pytest.importorskip("httpx")
+        tracer = FakeTracer()
+
+        async def run(base_url):
+            async with AsyncCardinity(
+                "key", "secret", base_url=base_url, tracing=Tracing(tracer=tracer)
+            ) as cardinity:
+                return await cardinity.create_payment(
+                    **TestPaymentData.successful_payment()
+                )
+
+        with CardinityTestServer() as server:
+            asyncio.run(run(server.base_url))
+
+        (create,) = tracer.named("AsyncCardinity.create_payment")
+        (post,) = tracer.named("POST /payments")
+        assert post.parent is create
+        assert [span.name for span in tracer.spans if span.parent is post] == [
+            "CardinityAuth.sign",
+            "Response.parse",
+        ]
+
+
+class TestOpenTelemetry:
+    """Test tracing with the OpenTelemetry SDK."""
+
+    def test_trace_context_is_propagated(self):
+        """The API receives the trace context of the HTTP attempt span."""
+        sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+        export = pytest.importorskip("opentelemetry.sdk.trace.export")
+        in_memory = pytest.importorskip(
+            "opentelemetry.sdk.trace.export.in_memory_span_exporter"
+        )
+        exporter = in_memory.InMemorySpanExporter()
+        provider = sdk_trace.TracerProvider()
+        provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+        tracing = Tracing(tracer=provider.get_tracer("test"))
+
+        received = []
+        with CardinityTestServer() as server:
+            handle = server.handle
+
+            def recording_handle(method, path, body=None, headers=None):
+                received.append({k.lower(): v for k, v in (headers or {}).items()})
+                return handle(method, path, body, headers)
+
+            server.handle = recording_handle
+            cardinity = Cardinity(
+                "key", "secret", base_url=server.base_url, tracing=tracing
+            )
+            cardinity.create_payment(**TestPaymentData.successful_payment())
+
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        operation = spans["Cardinity.create_payment"]
+        attempt = spans["POST /payments"]
+        assert attempt.parent.span_id == operation.context.span_id
+        assert spans["Payment.validate"].parent.span_id == operation.context.span_id
+        assert spans["CardinityAuth.sign"].parent.span_id == attempt.context.span_id
+
+        _, trace_id, span_id, _ = received[0]["traceparent"].split("-")
+        assert int(trace_id, 16) == operation.context.trace_id
+        assert int(span_id, 16) == attempt.context.span_id
@@ -0,0 +1,161 @@
+"""
+Unit tests for the Cardinity HTTP transport and connection pool statistics.
+"""
+
+import json
+import pickle
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cardinity import Cardinity
+from cardinity.auth import CardinityAuth
+from cardinity.client import CardinityClient
+from cardinity.transport import CardinityHTTPAdapter, keepalive_socket_options
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Minimal keep-alive JSON endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    barrier = None
+
+    def do_GET(self):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run a local HTTP server for the duration of a test."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    _Handler.barrier = None
+
+
+def make_client(server, **kwargs):
+    """Build a client pointed at the local server."""
+    host, port = server.server_address
+    auth = CardinityAuth("test_key", "test_secret")
+    return CardinityClient(auth, base_url=f"http://{host}:{port}/v1", **kwargs)
+
+
+class TestConnectionPool:
+    """Test cases for pool configuration and statistics."""
+
+    def test_adapter_configuration(self):
+        """Test pool options are passed to the mounted adapter."""
+        client = CardinityClient(
+            CardinityAuth("test_key", "test_secret"),
+            pool_connections=4,
+            pool_maxsize=32,
+            pool_block=True,
+        )
+
+        adapter = client.session.get_adapter("https://api.cardinity.com/v1")
+        assert adapter is client.adapter
+        assert isinstance(adapter, CardinityHTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+        assert adapter._pool_connections == 4
+
+    def test_tcp_keepalive_socket_options(self):
+        """Test keep-alive and custom socket options reach the pool manager."""
+        extra = (socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        client = CardinityClient(
+            CardinityAuth("test_key", "test_secret"),
+            tcp_keepalive=True,
+            socket_options=[extra],
+        )
+
+        options = client.adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert extra in options
+        assert set(keepalive_socket_options()) <= set(options)
+
+    def test_default_socket_options_untouched(self):
+        """Test urllib3 defaults are kept when no socket options are given."""
+        client = CardinityClient(CardinityAuth("test_key", "test_secret"))
+
+        assert "socket_options" not in client.adapter.poolmanager.connection_pool_kw
+
+    def test_stats_track_connection_reuse(self, server):
+        """Test sequential requests reuse one pooled connection."""
+        client = make_client(server)
+
+        for _ in range(3):
+            assert client.get("/payments") == {"path": "/v1/payments"}
+
+        assert client.get_pool_stats() == {
+            "in_use": 0,
+            "idle": 1,
+            "created": 1,
+            "discarded": 0,
+        }
+
+    def test_stats_count_discarded_connections(self, server):
+        """Test connections beyond pool_maxsize are counted as discarded."""
+        _Handler.barrier = threading.Barrier(4)
+        client = make_client(server, pool_maxsize=2)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Distinct endpoints, so the requests are not coalesced
+            list(executor.map(lambda i: client.get(f"/payments/{i}"), range(4)))
+
+        stats = client.get_pool_stats()
+        assert stats["created"] == 4
+        assert stats["discarded"] == 2
+        assert stats["idle"] == 2
+        assert stats["in_use"] == 0
+
+    def test_stats_in_use_while_request_active(self, server):
+        """Test in-flight requests are reported as in use."""
+        _Handler.barrier = threading.Barrier(2)
+        client = make_client(server)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(client.get, "/payments")
+            while client.get_pool_stats()["in_use"] == 0:
+                time.sleep(0.001)
+            assert client.get_pool_stats()["in_use"] == 1
+            _Handler.barrier.wait(timeout=5)
+            future.result(timeout=5)
+
+        assert client.get_pool_stats()["in_use"] == 0
+
+    def test_sdk_passes_pool_options(self):
+        """Test Cardinity forwards pool options to its client."""
+        cardinity = Cardinity("test_key", "test_secret", pool_maxsize=50, timeout=5)
+
+        client = cardinity.get_client()
+        assert client.adapter.poolmanager.connection_pool_kw["maxsize"] == 50
+        assert client.timeout == 5
+        assert cardinity.get_pool_stats()["created"] == 0
+
+    def test_adapter_pickle(self):
+        """Test the adapter survives pickling with its configuration."""
+        adapter = CardinityHTTPAdapter(pool_maxsize=7, socket_options=[(1, 2, 3)])
+
+        restored = pickle.loads(pickle.dumps(adapter))
+
+        assert restored.socket_options == [(1, 2, 3)]
+        assert restored.poolmanager.connection_pool_kw["maxsize"] == 7
+        assert restored.stats.snapshot()["created"] == 0
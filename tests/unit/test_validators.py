@@ -4,14 +4,21 @@ Unit tests for Cardinity validation functions.
 This module tests the validation functions and CardinityValidator class.
 """
 
+import threading
+
+from cardinity.models import FinalizePayment
+from cardinity.utils import FrozenSetList
 from cardinity.validation import (
     CardinityValidator,
+    ValidatorRegistry,
     validate_amount_format,
     validate_card_number,
     validate_country_code,
     validate_currency_code,
     validate_data,
+    validate_model_data,
     validate_required_fields,
+    validator_registry,
 )
 
 
@@ -176,6 +183,35 @@ class TestCardinityValidator:
         assert not validator.validate(data, schema)
         assert "payment_id" in validator.errors
 
+    def test_set_backed_allowed_values(self):
+        """Test allowed rules backed by a set or FrozenSetList."""
+        validator = CardinityValidator()
+
+        for allowed in (FrozenSetList(["EUR", "USD"]), frozenset({"EUR", "USD"})):
+            schema = {
+                "currency": {"type": "string", "allowed": allowed},
+                "currencies": {"type": "list", "allowed": allowed},
+            }
+            assert validator.validate(
+                {"currency": "EUR", "currencies": ["USD"]}, schema
+            )
+
+            assert not validator.validate(
+                {"currency": "GBP", "currencies": ["EUR", "GBP"]}, schema
+            )
+            assert validator.errors == {
+                "currency": ["unallowed value GBP"],
+                "currencies": ["unallowed values ('GBP',)"],
+            }
+
+    def test_set_backed_allowed_unhashable_value(self):
+        """Test unhashable values are rejected rather than raising TypeError."""
+        validator = CardinityValidator()
+        schema = {"items": {"allowed": FrozenSetList(["a", "b"])}}
+
+        assert not validator.validate({"items": [["a"]]}, schema)
+        assert "items" in validator.errors
+
 
 class TestValidateData:
     """Test the validate_data function."""
@@ -199,3 +235,101 @@ class TestValidateData:
 
         result = validate_data(data, schema)
         assert result is None
+
+
+class TestValidatorRegistry:
+    """Test the compiled validator registry."""
+
+    SCHEMA = {"amount": {"type": "string", "required": True}}
+
+    def test_schema_compiled_once_per_key(self):
+        """Test the schema factory is only called on the first lookup."""
+        registry = ValidatorRegistry()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return self.SCHEMA
+
+        first = registry.get_validator("key", factory)
+        second = registry.get_validator("key", factory)
+
+        assert first is second
+        assert len(calls) == 1
+        assert len(registry) == 1
+
+    def test_validators_are_per_thread(self):
+        """Test each thread gets its own validator sharing one compiled schema."""
+        registry = ValidatorRegistry()
+        main = registry.get_validator("key", lambda: self.SCHEMA)
+        other = []
+
+        thread = threading.Thread(
+            target=lambda: other.append(
+                registry.get_validator("key", lambda: self.SCHEMA)
+            )
+        )
+        thread.start()
+        thread.join()
+
+        assert other[0] is not main
+        assert other[0].schema is main.schema
+
+    def test_clear_recompiles(self):
+        """Test clear() drops compiled schemas and cached validators."""
+        registry = ValidatorRegistry()
+        before = registry.get_validator("key", lambda: self.SCHEMA)
+
+        registry.clear()
+
+        assert len(registry) == 0
+        assert registry.get_validator("key", lambda: self.SCHEMA) is not before
+
+    def test_validate_model_data(self):
+        """Test validate_model_data returns errors like validate_data."""
+        key = ("test_validate_model_data", 1)
+
+        assert validate_model_data({"amount": "1.00"}, key, lambda: self.SCHEMA) is None
+        errors = validate_model_data({}, key, lambda: self.SCHEMA)
+        assert errors == validate_data({}, self.SCHEMA)
+
+    def test_normalization_rules_still_applied(self):
+        """Test schemas with normalization rules keep normalizing on validate."""
+        schema = {"amount": {"type": "string", "coerce": str}}
+        key = ("test_normalization_rules_still_applied", 1)
+
+        assert validate_model_data({"amount": 5}, key, lambda: schema) is None
+
+    def test_concurrent_validation(self):
+        """Test concurrent validation through the shared registry is isolated."""
+        key = ("test_concurrent_validation", 1)
+        results = []
+
+        def worker(value):
+            for _ in range(50):
+                data = {"amount": value} if value else {}
+                results.append(
+                    (value, validate_model_data(data, key, lambda: self.SCHEMA))
+                )
+
+        threads = [threading.Thread(target=worker, args=(v,)) for v in ("1", None)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for value, errors in results:
+            assert (errors is None) == (value is not None)
+
+    def test_finalize_payment_keyed_by_3ds_version(self):
+        """Test 3DS v1 and v2 finalization use separately compiled schemas."""
+        v2 = FinalizePayment("payment_id", cres="challenge_response")
+        v1 = FinalizePayment("payment_id", authorize_data="authorize_data")
+
+        assert v2.is_valid()
+        assert v1.is_valid()
+        assert validator_registry.get_validator(
+            v1._validator_key(), v1.get_constraints
+        ) is not validator_registry.get_validator(
+            v2._validator_key(), v2.get_constraints
+        )